@@ -1,5 +1,7 @@
 import math
 
+from algorithms import metrics
+
 def bellman_ford(graph, start_id, verbose=False):
     """
     Algoritmo de Bellman-Ford. Detecta ciclos negativos.
@@ -17,6 +19,8 @@ def bellman_ford(graph, start_id, verbose=False):
             print(f"Error: El vértice {start_id} no existe.")
         return None
 
+    metricas = metrics.iniciar('bellman_ford')
+
     dist = {v: math.inf for v in graph.get_vertices()}
     pred = {v: None for v in graph.get_vertices()}
     dist[start_id] = 0
@@ -24,6 +28,9 @@ def bellman_ford(graph, start_id, verbose=False):
 
     num_vertices = len(graph.get_vertices())
     
+    if metricas is not None:
+        metricas.fase('inicializacion')
+    
     # Relajación
     for iteration in range(num_vertices - 1):
         cambios = False
@@ -34,17 +41,30 @@ def bellman_ford(graph, start_id, verbose=False):
             if dist[u_id] == math.inf:
                 continue
             
-            for vertex_v, weight in vertex_u.get_connections().items():
+            conexiones = vertex_u.get_connections()
+            if metricas is not None:
+                metricas.nodos_expandidos += 1
+                metricas.aristas_examinadas += len(conexiones)
+            
+            for vertex_v, weight in conexiones.items():
                 v_id = vertex_v.id
                 
                 if dist[u_id] + weight < dist[v_id]:
                     dist[v_id] = dist[u_id] + weight
                     pred[v_id] = u_id
                     cambios = True
+                    if metricas is not None:
+                        metricas.aristas_relajadas += 1
+
+        if metricas is not None:
+            metricas.contar('iteraciones')
 
         if not cambios:
             break
 
+    if metricas is not None:
+        metricas.fase('relajacion')
+
     # Detección de ciclos negativos
     tiene_ciclo_negativo = False
     
@@ -64,6 +84,10 @@ def bellman_ford(graph, start_id, verbose=False):
         if tiene_ciclo_negativo:
             break
 
+    if metricas is not None:
+        metricas.fase('deteccion_ciclos')
+    metrics.terminar(metricas)
+
     return {
         'distancias': dist,
         'predecesores': pred,
@@ -1,6 +1,8 @@
 import math
 import heapq
 
+from algorithms import metrics
+
 def dijkstra(graph, start_id, end_id=None, verbose=False):
     """
     Algoritmo de Dijkstra para encontrar el camino más corto.
@@ -22,6 +24,8 @@ def dijkstra(graph, start_id, end_id=None, verbose=False):
             print(f"Error: El vértice {start_id} no existe.")
         return None
 
+    metricas = metrics.iniciar('dijkstra')
+    
     dist = {v: math.inf for v in graph.get_vertices()}
     pred = {v: None for v in graph.get_vertices()}
     visitados = set()
@@ -30,10 +34,15 @@ def dijkstra(graph, start_id, end_id=None, verbose=False):
     pred[start_id] = start_id
     pq = [(0, start_id)]
     
+    if metricas is not None:
+        metricas.fase('inicializacion')
+    
     while pq:
         dist_actual, u_id = heapq.heappop(pq)
         
         if u_id in visitados:
+            if metricas is not None:
+                metricas.extracciones_obsoletas += 1
             continue
         
         visitados.add(u_id)
@@ -42,8 +51,11 @@ def dijkstra(graph, start_id, end_id=None, verbose=False):
             break
         
         vertex_u = graph.get_vertex(u_id)
+        conexiones = vertex_u.get_connections()
+        if metricas is not None:
+            metricas.aristas_examinadas += len(conexiones)
         
-        for vertex_v, weight in vertex_u.get_connections().items():
+        for vertex_v, weight in conexiones.items():
             v_id = vertex_v.id
             
             if v_id in visitados:
@@ -53,6 +65,8 @@ def dijkstra(graph, start_id, end_id=None, verbose=False):
             # (excepto si es el punto de partida)
             estrella_v = graph.obtener_estrella(v_id)
             if estrella_v and estrella_v.visitada and v_id != start_id:
+                if metricas is not None:
+                    metricas.podar('estrella_visitada')
                 continue
             
             nueva_distancia = dist[u_id] + weight
@@ -61,10 +75,23 @@ def dijkstra(graph, start_id, end_id=None, verbose=False):
                 dist[v_id] = nueva_distancia
                 pred[v_id] = u_id
                 heapq.heappush(pq, (nueva_distancia, v_id))
+                if metricas is not None:
+                    metricas.aristas_relajadas += 1
+
+    if metricas is not None:
+        metricas.fase('busqueda')
+        # Cada relajación inserta en el heap; lo que quedó en él no se extrajo
+        metricas.nodos_expandidos = len(visitados)
+        metricas.inserciones_heap = 1 + metricas.aristas_relajadas
+        metricas.extracciones_heap = metricas.inserciones_heap - len(pq)
 
     camino = None
     if end_id:
         camino = obtener_camino(pred, start_id, end_id)
+    
+    if metricas is not None:
+        metricas.fase('reconstruccion')
+    metrics.terminar(metricas)
 
     return {
         'distancias': dist,
@@ -0,0 +1,480 @@
+"""
+Planificadores heurísticos de rutas para catálogos grandes.
+
+El backtracking exacto de max_stars_route.py y optimal_route_with_grass.py
+explora todas las rutas posibles y no termina con miles de estrellas.
+Este módulo ofrece dos alternativas aproximadas que devuelven el mismo
+diccionario de resultado que los algoritmos exactos:
+
+- Beam search: conserva solo las `ancho_haz` mejores rutas parciales por
+  nivel, puntuadas por estrellas visitadas y energía restante.
+- Greedy: avanza siempre a la estrella factible más cercana y después mejora
+  la ruta con movimientos 2-opt y or-opt.
+
+Ambos reutilizan las funciones de simulación de los algoritmos exactos, así
+que las rutas obedecen exactamente las mismas reglas (Req. 1.2 y Req. 2.0).
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.donkey import Donkey
+from backend.constellation import GrafoConstelaciones
+from algorithms import metrics
+from algorithms.max_stars_route import EstadoBurro, simular_viaje
+from algorithms.optimal_route_with_grass import EstadoBurroConPasto, simular_viaje_con_pasto
+
+
+def _crear_transicion(burro: Donkey, con_pasto: bool) -> Callable:
+    """
+    Devuelve la función de transición equivalente a la del algoritmo exacto.
+
+    Aplica las mismas podas que el backtracking correspondiente, de modo que
+    un estado devuelto por la transición es un estado que el algoritmo exacto
+    también habría explorado.
+    """
+    if con_pasto:
+        def transicion(estado, distancia, estrella):
+            nuevo = simular_viaje_con_pasto(estado, distancia, estrella, burro.max_age)
+            if nuevo is None or not nuevo.esta_vivo(burro.max_age):
+                return None
+            return nuevo
+    else:
+        def transicion(estado, distancia, estrella):
+            nuevo = simular_viaje(estado, distancia, estrella)
+            if nuevo is None or not nuevo.esta_vivo():
+                return None
+            if not estado.puede_viajar(distancia):
+                return None
+            return nuevo
+
+    return transicion
+
+
+def _crear_estado_inicial(burro: Donkey, con_pasto: bool):
+    """Crea el estado inicial con la clase de estado del algoritmo exacto."""
+    clase_estado = EstadoBurroConPasto if con_pasto else EstadoBurro
+    return clase_estado(
+        energia=burro.donkey_energy,
+        edad=burro.age,
+        salud=burro.health,
+        pasto=burro.grass_in_basement
+    )
+
+
+class _Vecindario:
+    """
+    Caché de vecinos por estrella para una sola búsqueda.
+
+    Vertex.get_connections() construye un diccionario nuevo en cada llamada
+    para filtrar caminos bloqueados; aquí se calcula una vez por estrella.
+    """
+
+    def __init__(self, grafo: GrafoConstelaciones):
+        self.grafo = grafo
+        self._vecinos: Dict[int, Dict[int, float]] = {}
+        self.consultas = 0
+
+    def de(self, star_id: int) -> Dict[int, float]:
+        """Retorna {id_vecino: distancia} de una estrella (sin bloqueados)."""
+        self.consultas += 1
+        vecinos = self._vecinos.get(star_id)
+        if vecinos is None:
+            vertice = self.grafo.get_vertex(star_id)
+            vecinos = {}
+            if vertice:
+                for vecino_vertex, distancia in vertice.get_connections().items():
+                    vecinos[vecino_vertex.id] = distancia
+            self._vecinos[star_id] = vecinos
+        return vecinos
+
+    def registrar_metricas(self, metricas) -> None:
+        """Cada estrella se calcula una sola vez: el resto de consultas son aciertos."""
+        metricas.fallos_cache = len(self._vecinos)
+        metricas.aciertos_cache = self.consultas - len(self._vecinos)
+
+
+def _evaluar_ruta(
+    grafo: GrafoConstelaciones,
+    vecindario: _Vecindario,
+    transicion: Callable,
+    estado_inicial,
+    ruta: List[int]
+) -> Optional[Tuple[object, float, int]]:
+    """
+    Simula una ruta completa desde el estado inicial.
+
+    Returns:
+        (estado_final, distancia_total, pasto_usado) o None si la ruta no es
+        válida (arista inexistente, estrella repetida o el burro muere)
+    """
+    if len(set(ruta)) != len(ruta):
+        return None
+
+    estado = estado_inicial
+    distancia_total = 0.0
+    pasto_usado = 0
+
+    for desde, hasta in zip(ruta, ruta[1:]):
+        distancia = vecindario.de(desde).get(hasta)
+        if distancia is None:
+            return None
+
+        estrella = grafo.obtener_estrella(hasta)
+        if not estrella:
+            return None
+
+        nuevo = transicion(estado, distancia, estrella)
+        if nuevo is None:
+            return None
+
+        pasto_usado += int(estado.pasto - nuevo.pasto)
+        distancia_total += distancia
+        estado = nuevo
+
+    return estado, distancia_total, pasto_usado
+
+
+def _construir_resultado(
+    ruta: List[int],
+    distancia: float,
+    estado_final,
+    pasto_usado: int,
+    exploraciones: int,
+    con_pasto: bool
+) -> Dict:
+    """Construye el diccionario de resultado compartido con los algoritmos exactos."""
+    resultado = {
+        'ruta': ruta,
+        'distancia_total': distancia,
+        'estrellas_visitadas': len(ruta),
+        'estado_final': {
+            'energia': estado_final.energia,
+            'edad': estado_final.edad,
+            'salud': estado_final.salud,
+            'pasto': estado_final.pasto
+        },
+        'exploraciones': exploraciones
+    }
+    if con_pasto:
+        resultado['pasto_usado'] = pasto_usado
+    return resultado
+
+
+def encontrar_ruta_beam_search(
+    grafo: GrafoConstelaciones,
+    burro: Donkey,
+    posicion_inicial: int,
+    ancho_haz: int = 64,
+    con_pasto: bool = False,
+    verbose: bool = False
+) -> Dict:
+    """
+    Busca una ruta larga con beam search (búsqueda en haz).
+
+    En cada nivel expande todas las rutas del haz y conserva solo las
+    `ancho_haz` mejores, puntuadas por estrellas visitadas y energía restante.
+    Con ancho_haz suficientemente grande se comporta como una búsqueda en
+    anchura exhaustiva; con anchos pequeños escala linealmente con el largo
+    de la ruta.
+
+    Args:
+        grafo: Grafo de constelaciones
+        burro: Burro con estado inicial
+        posicion_inicial: ID de la estrella inicial
+        ancho_haz: Número de rutas parciales que se conservan por nivel
+        con_pasto: Si True usa las reglas del Req. 2.0 (recarga de pasto)
+        verbose: Si True, imprime información de depuración
+
+    Returns:
+        Dict con el mismo formato que encontrar_ruta_maxima_estrellas
+        (y 'pasto_usado' si con_pasto=True)
+    """
+    if ancho_haz < 1:
+        raise ValueError("ancho_haz debe ser al menos 1")
+
+    transicion = _crear_transicion(burro, con_pasto)
+    vecindario = _Vecindario(grafo)
+    estado_inicial = _crear_estado_inicial(burro, con_pasto)
+
+    # Cada ruta parcial: (ruta, visitados, estado, distancia, pasto_usado)
+    haz = [([posicion_inicial], {posicion_inicial}, estado_inicial, 0.0, 0)]
+    mejor = haz[0]
+    exploraciones = 1
+    metricas = metrics.iniciar('beam_search')
+
+    def costo(parcial) -> float:
+        """Criterio de desempate del algoritmo exacto correspondiente."""
+        return parcial[4] if con_pasto else parcial[3]
+
+    def puntaje(parcial) -> tuple:
+        """Más estrellas primero, luego más energía, luego menor costo."""
+        return (len(parcial[0]), parcial[2].energia, -costo(parcial))
+
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"🔦 BEAM SEARCH (ancho: {ancho_haz}, pasto: {'sí' if con_pasto else 'no'})")
+        print(f"{'='*60}")
+
+    while haz:
+        # Expandir todas las rutas del haz, sin repetir (estrella, visitados)
+        candidatos = {}
+        if metricas is not None:
+            metricas.nodos_expandidos += len(haz)
+            metricas.contar('niveles')
+        for ruta, visitados, estado, distancia_actual, pasto_usado in haz:
+            vecinos = vecindario.de(ruta[-1])
+            if metricas is not None:
+                metricas.aristas_examinadas += len(vecinos)
+            for vecino_id, distancia in vecinos.items():
+                if vecino_id in visitados:
+                    if metricas is not None:
+                        metricas.podar('visitada')
+                    continue
+
+                estrella_destino = grafo.obtener_estrella(vecino_id)
+                if not estrella_destino:
+                    continue
+
+                nuevo_estado = transicion(estado, distancia, estrella_destino)
+                exploraciones += 1
+                if nuevo_estado is None:
+                    if metricas is not None:
+                        metricas.podar('inviable')
+                    continue
+
+                nuevos_visitados = visitados | {vecino_id}
+                candidato = (
+                    ruta + [vecino_id],
+                    nuevos_visitados,
+                    nuevo_estado,
+                    distancia_actual + distancia,
+                    pasto_usado + int(estado.pasto - nuevo_estado.pasto)
+                )
+
+                clave = (vecino_id, frozenset(nuevos_visitados))
+                existente = candidatos.get(clave)
+                if existente is not None and metricas is not None:
+                    metricas.podar('duplicado')
+                if existente is None or puntaje(candidato) > puntaje(existente):
+                    candidatos[clave] = candidato
+
+        if not candidatos:
+            break
+
+        haz = heapq.nlargest(ancho_haz, candidatos.values(), key=puntaje)
+        if metricas is not None and len(candidatos) > len(haz):
+            metricas.podar('haz', len(candidatos) - len(haz))
+
+        # Mismo criterio que el algoritmo exacto: más estrellas, luego menor costo
+        lider = min(haz, key=costo)
+        if len(lider[0]) > len(mejor[0]) or \
+           (len(lider[0]) == len(mejor[0]) and costo(lider) < costo(mejor)):
+            mejor = lider
+            if verbose:
+                print(f"  💫 Nivel {len(mejor[0])}: {len(candidatos)} candidatos, "
+                      f"energía líder {mejor[2].energia:.1f}")
+
+    ruta, _, estado_final, distancia, pasto_usado = mejor
+
+    if metricas is not None:
+        metricas.fase('busqueda')
+        vecindario.registrar_metricas(metricas)
+    metrics.terminar(metricas)
+
+    if verbose:
+        print(f"✅ Beam search: {len(ruta)} estrellas, {distancia:.1f} ly, "
+              f"{exploraciones} exploraciones")
+        print(f"{'='*60}\n")
+
+    return _construir_resultado(ruta, distancia, estado_final, pasto_usado,
+                                exploraciones, con_pasto)
+
+
+def _extender_greedy(
+    grafo: GrafoConstelaciones,
+    vecindario: _Vecindario,
+    transicion: Callable,
+    ruta: List[int],
+    estado,
+    contador: List[int]
+) -> List[int]:
+    """
+    Extiende una ruta avanzando a la estrella factible más cercana.
+
+    Modifica y retorna `ruta`. `contador[0]` acumula las transiciones simuladas.
+    """
+    visitados = set(ruta)
+
+    while True:
+        opciones = sorted(vecindario.de(ruta[-1]).items(), key=lambda item: item[1])
+        siguiente = None
+
+        for vecino_id, distancia in opciones:
+            if vecino_id in visitados:
+                continue
+
+            estrella_destino = grafo.obtener_estrella(vecino_id)
+            if not estrella_destino:
+                continue
+
+            contador[0] += 1
+            nuevo_estado = transicion(estado, distancia, estrella_destino)
+            if nuevo_estado is not None:
+                siguiente = (vecino_id, nuevo_estado)
+                break
+
+        if siguiente is None:
+            return ruta
+
+        ruta.append(siguiente[0])
+        visitados.add(siguiente[0])
+        estado = siguiente[1]
+
+
+def _vecindades_locales(ruta: List[int], vecindario: _Vecindario, max_segmento: int):
+    """
+    Genera las rutas vecinas para la mejora local.
+
+    - 2-opt: invierte el tramo ruta[i..j]
+    - or-opt: mueve un tramo de 1 a `max_segmento` estrellas a otra posición
+
+    Antes de construir cada candidata se comprueba que existan las aristas
+    nuevas en las uniones; en grafos dispersos eso descarta casi todos los
+    movimientos sin simularlos. La estrella inicial (posición 0) nunca se mueve.
+    """
+    n = len(ruta)
+
+    def conectadas(a: int, b: int) -> bool:
+        return b in vecindario.de(a)
+
+    for i in range(1, n - 1):
+        for j in range(i + 1, n):
+            if not conectadas(ruta[i - 1], ruta[j]):
+                continue
+            if j + 1 < n and not conectadas(ruta[i], ruta[j + 1]):
+                continue
+            yield ruta[:i] + ruta[i:j + 1][::-1] + ruta[j + 1:]
+
+    for largo in range(1, max_segmento + 1):
+        for i in range(1, n - largo + 1):
+            fin = i + largo
+            if fin < n and not conectadas(ruta[i - 1], ruta[fin]):
+                continue
+
+            tramo = ruta[i:fin]
+            resto = ruta[:i] + ruta[fin:]
+            for k in range(1, len(resto) + 1):
+                if k == i:
+                    continue
+                if not conectadas(resto[k - 1], tramo[0]):
+                    continue
+                if k < len(resto) and not conectadas(tramo[-1], resto[k]):
+                    continue
+                yield resto[:k] + tramo + resto[k:]
+
+
+def encontrar_ruta_greedy(
+    grafo: GrafoConstelaciones,
+    burro: Donkey,
+    posicion_inicial: int,
+    con_pasto: bool = False,
+    mejora_local: bool = True,
+    max_rondas: int = 20,
+    max_segmento_or_opt: int = 3,
+    verbose: bool = False
+) -> Dict:
+    """
+    Planifica una ruta yendo siempre a la estrella factible más cercana.
+
+    Después de la construcción greedy aplica mejora local (2-opt y or-opt):
+    acepta cualquier reordenamiento válido que reduzca el costo (distancia, o
+    pasto usado con con_pasto=True) y vuelve a extender la ruta desde el final
+    con la energía ahorrada. Repite hasta que no haya mejoras o se agoten las
+    rondas.
+
+    Args:
+        grafo: Grafo de constelaciones
+        burro: Burro con estado inicial
+        posicion_inicial: ID de la estrella inicial
+        con_pasto: Si True usa las reglas del Req. 2.0 (recarga de pasto)
+        mejora_local: Si False, devuelve la ruta greedy sin mejorar
+        max_rondas: Máximo de rondas de mejora local
+        max_segmento_or_opt: Largo máximo del tramo movido por or-opt
+        verbose: Si True, imprime información de depuración
+
+    Returns:
+        Dict con el mismo formato que encontrar_ruta_maxima_estrellas
+        (y 'pasto_usado' si con_pasto=True)
+    """
+    transicion = _crear_transicion(burro, con_pasto)
+    vecindario = _Vecindario(grafo)
+    estado_inicial = _crear_estado_inicial(burro, con_pasto)
+    contador = [0]
+    metricas = metrics.iniciar('greedy')
+
+    def costo(evaluacion) -> float:
+        """Criterio de desempate del algoritmo exacto correspondiente."""
+        return evaluacion[2] if con_pasto else evaluacion[1]
+
+    ruta = _extender_greedy(grafo, vecindario, transicion,
+                            [posicion_inicial], estado_inicial, contador)
+    evaluacion = _evaluar_ruta(grafo, vecindario, transicion, estado_inicial, ruta)
+    if metricas is not None:
+        metricas.fase('construccion')
+        metricas.contar('largo_greedy', len(ruta))
+
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"🧭 GREEDY: {len(ruta)} estrellas, {evaluacion[1]:.1f} ly")
+
+    rondas = 0
+    while mejora_local and rondas < max_rondas and len(ruta) > 2:
+        rondas += 1
+        mejorada = False
+
+        for candidata in _vecindades_locales(ruta, vecindario, max_segmento_or_opt):
+            contador[0] += 1
+            evaluacion_candidata = _evaluar_ruta(
+                grafo, vecindario, transicion, estado_inicial, candidata
+            )
+            if evaluacion_candidata is None:
+                if metricas is not None:
+                    metricas.podar('candidata_invalida')
+                continue
+
+            if costo(evaluacion_candidata) < costo(evaluacion):
+                ruta, evaluacion = candidata, evaluacion_candidata
+                mejorada = True
+                break
+
+        # Con el costo reducido puede que quepan más estrellas al final
+        largo_anterior = len(ruta)
+        ruta = _extender_greedy(grafo, vecindario, transicion,
+                                ruta, evaluacion[0], contador)
+        if len(ruta) > largo_anterior:
+            evaluacion = _evaluar_ruta(grafo, vecindario, transicion, estado_inicial, ruta)
+            mejorada = True
+
+        if verbose and mejorada:
+            print(f"  🔁 Ronda {rondas}: {len(ruta)} estrellas, {evaluacion[1]:.1f} ly")
+
+        if not mejorada:
+            break
+
+    estado_final, distancia, pasto_usado = evaluacion
+
+    if metricas is not None:
+        metricas.fase('mejora_local')
+        metricas.contar('rondas', rondas)
+        metricas.nodos_expandidos = contador[0]
+        vecindario.registrar_metricas(metricas)
+    metrics.terminar(metricas)
+
+    if verbose:
+        print(f"✅ Greedy + mejora local: {len(ruta)} estrellas, {distancia:.1f} ly, "
+              f"{contador[0]} exploraciones")
+        print(f"{'='*60}\n")
+
+    return _construir_resultado(ruta, distancia, estado_final, pasto_usado,
+                                contador[0], con_pasto)
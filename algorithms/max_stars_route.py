@@ -7,12 +7,17 @@ y encontrar la que maximiza el número de estrellas visitadas.
 from typing import List, Dict, Tuple, Optional
 from backend.donkey import Donkey
 from backend.constellation import GrafoConstelaciones
+from algorithms import metrics
+from algorithms.transposition import TablaTransposicion
 import copy
 
 
 class EstadoBurro:
     """Representa el estado del burro en un momento dado."""
     
+    # Las búsquedas crean millones de estados: sin __dict__ por instancia
+    __slots__ = ('energia', 'edad', 'salud', 'pasto')
+    
     def __init__(self, energia: float, edad: float, salud: str, pasto: float):
         self.energia = energia
         self.edad = edad
@@ -93,7 +98,8 @@ def encontrar_ruta_maxima_estrellas(
     grafo: GrafoConstelaciones,
     burro: Donkey,
     posicion_inicial: int,
-    verbose: bool = False
+    verbose: bool = False,
+    tabla: Optional[TablaTransposicion] = None
 ) -> Dict:
     """
     Encuentra la ruta que permite visitar la mayor cantidad de estrellas
@@ -106,6 +112,9 @@ def encontrar_ruta_maxima_estrellas(
         burro: Burro con estado inicial
         posicion_inicial: ID de la estrella inicial
         verbose: Si True, imprime información de depuración
+        tabla: Tabla de transposición opcional; responde desde caché los
+               subárboles que ya no pueden cambiar la ruta encontrada
+               (ver algorithms/transposition.py)
     
     Returns:
         Dict con:
@@ -113,6 +122,7 @@ def encontrar_ruta_maxima_estrellas(
             - 'distancia_total': Distancia total recorrida
             - 'estrellas_visitadas': Número de estrellas visitadas
             - 'estado_final': Estado del burro al final
+            - 'transposicion': Estadísticas de la tabla (solo si se usó)
     """
     # Estado inicial
     estado_inicial = EstadoBurro(
@@ -127,6 +137,10 @@ def encontrar_ruta_maxima_estrellas(
     mejor_distancia = 0.0
     mejor_estado_final = estado_inicial.copy()
     
+    metricas = metrics.iniciar('ruta_maxima_estrellas')
+    if tabla is not None:
+        consultas_antes, aciertos_antes = tabla.consultas, tabla.aciertos
+    
     # Contador de exploraciones (para debugging)
     exploraciones = [0]
     
@@ -135,12 +149,16 @@ def encontrar_ruta_maxima_estrellas(
         estado_actual: EstadoBurro,
         ruta_actual: List[int],
         distancia_actual: float,
-        visitados: set
-    ):
+        visitados: set,
+        hash_visitados: int = 0
+    ) -> int:
         """
         Función recursiva para explorar todas las rutas posibles.
         
         Usa backtracking con poda para optimizar la búsqueda.
+        
+        Returns:
+            Máximo de estrellas adicionales alcanzables desde este estado
         """
         nonlocal mejor_ruta, mejor_distancia, mejor_estado_final
         
@@ -161,12 +179,30 @@ def encontrar_ruta_maxima_estrellas(
             mejor_distancia = distancia_actual
             mejor_estado_final = estado_actual.copy()
         
+        # Poda 0: subárbol ya explorado con el mismo estado (transposición)
+        if tabla is not None:
+            clave = tabla.clave(posicion_actual, hash_visitados, estado_actual)
+            # Sin comer, con menos energía y más edad no se visitan más
+            # estrellas: vale la poda por dominancia
+            en_cache = tabla.consultar(
+                clave, distancia_actual, len(mejor_ruta) - len(ruta_actual)
+            )
+            if en_cache is not None:
+                if metricas is not None:
+                    metricas.podar('transposicion')
+                return en_cache
+            exploraciones_antes = exploraciones[0]
+        
+        mejor_adicional = 0
+        
         # Obtener vecinos de la estrella actual
         vertice_actual = grafo.get_vertex(posicion_actual)
         if not vertice_actual:
-            return
+            return mejor_adicional
         
         vecinos = vertice_actual.get_connections()
+        if metricas is not None:
+            metricas.aristas_examinadas += len(vecinos)
         
         # Explorar cada vecino
         for vecino_vertex, distancia in vecinos.items():
@@ -174,6 +210,8 @@ def encontrar_ruta_maxima_estrellas(
             
             # Poda 1: No visitar estrellas ya visitadas
             if vecino_id in visitados:
+                if metricas is not None:
+                    metricas.podar('visitada')
                 continue
             
             # Obtener estrella destino
@@ -186,23 +224,35 @@ def encontrar_ruta_maxima_estrellas(
             
             # Poda 2: Si el burro no sobrevive al viaje, no explorar
             if nuevo_estado is None or not nuevo_estado.esta_vivo():
+                if metricas is not None:
+                    metricas.podar('no_sobrevive')
                 continue
             
             # Poda 3: Si no puede viajar, no explorar
             if not estado_actual.puede_viajar(distancia):
+                if metricas is not None:
+                    metricas.podar('sin_energia')
                 continue
             
             # Recursión: explorar desde el vecino
             nueva_ruta = ruta_actual + [vecino_id]
             nuevo_visitados = visitados | {vecino_id}
             
-            backtracking(
+            adicional = backtracking(
                 vecino_id,
                 nuevo_estado,
                 nueva_ruta,
                 distancia_actual + distancia,
-                nuevo_visitados
+                nuevo_visitados,
+                tabla.zobrist.alternar(hash_visitados, vecino_id) if tabla is not None else 0
             )
+            mejor_adicional = max(mejor_adicional, adicional + 1)
+        
+        if tabla is not None:
+            tabla.guardar(clave, mejor_adicional, exploraciones[0] - exploraciones_antes,
+                          distancia_actual)
+        
+        return mejor_adicional
     
     # Iniciar búsqueda desde posición inicial
     if verbose:
@@ -220,14 +270,25 @@ def encontrar_ruta_maxima_estrellas(
         estado_inicial,
         [posicion_inicial],
         0.0,
-        {posicion_inicial}
+        {posicion_inicial},
+        tabla.zobrist.hash_de({posicion_inicial}) if tabla is not None else 0
     )
     
+    if metricas is not None:
+        metricas.fase('busqueda')
+        metricas.nodos_expandidos = exploraciones[0]
+        if tabla is not None:
+            metricas.aciertos_cache = tabla.aciertos - aciertos_antes
+            metricas.fallos_cache = (tabla.consultas - consultas_antes) - metricas.aciertos_cache
+    metrics.terminar(metricas)
+    
     if verbose:
         print(f"\n{'='*60}")
         print(f"✅ BÚSQUEDA COMPLETADA")
         print(f"{'='*60}")
         print(f"🔢 Exploraciones realizadas: {exploraciones[0]}")
+        if tabla is not None:
+            print(f"♻️  Aciertos en tabla de transposición: {tabla.aciertos}/{tabla.consultas}")
         print(f"⭐ Mejor ruta: {' → '.join(map(str, mejor_ruta))}")
         print(f"📊 Estrellas visitadas: {len(mejor_ruta)}")
         print(f"📏 Distancia total: {mejor_distancia:.1f} ly")
@@ -236,7 +297,7 @@ def encontrar_ruta_maxima_estrellas(
         print(f"🎂 Edad final: {mejor_estado_final.edad:.1f} años luz")
         print(f"{'='*60}\n")
     
-    return {
+    resultado = {
         'ruta': mejor_ruta,
         'distancia_total': mejor_distancia,
         'estrellas_visitadas': len(mejor_ruta),
@@ -248,6 +309,11 @@ def encontrar_ruta_maxima_estrellas(
         },
         'exploraciones': exploraciones[0]
     }
+    
+    if tabla is not None:
+        resultado['transposicion'] = tabla.estadisticas()
+    
+    return resultado
 
 
 def obtener_nombres_ruta(grafo: GrafoConstelaciones, ruta_ids: List[int]) -> List[str]:
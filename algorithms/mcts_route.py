@@ -0,0 +1,339 @@
+"""
+Planificador Monte-Carlo Tree Search para la ruta con recarga de pasto.
+
+REQUERIMIENTO 2.0: mismo problema que encontrar_ruta_optima_con_pasto, pero
+resuelto como búsqueda "anytime": la calidad mejora con el presupuesto de
+iteraciones o de tiempo y en cualquier momento se puede devolver la mejor
+ruta encontrada hasta entonces.
+
+- Selección: UCT (Upper Confidence bound applied to Trees)
+- Expansión: un hijo nuevo por iteración sobre transiciones de
+  EstadoBurroConPasto (simular_viaje_con_pasto)
+- Simulación: rollouts aleatorios baratos con el mismo simulador
+- Retropropagación: número de estrellas de la ruta completa
+
+Los rollouts pueden ejecutarse en procesos de trabajo (procesos > 1); cada
+proceso recibe una InstantaneaGrafo una sola vez al iniciarse.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from backend.donkey import Donkey
+from backend.constellation import GrafoConstelaciones
+from backend.snapshot import InstantaneaGrafo
+from algorithms import metrics
+from algorithms.optimal_route_with_grass import EstadoBurroConPasto, simular_viaje_con_pasto
+
+
+# Instantánea del grafo en cada proceso de trabajo (ver _inicializar_proceso)
+_INSTANTANEA: Optional[InstantaneaGrafo] = None
+
+
+class _NodoMCTS:
+    """Nodo del árbol de búsqueda: una ruta parcial y el estado del burro."""
+
+    __slots__ = (
+        'posicion', 'estado', 'ruta', 'visitados', 'distancia', 'pasto_usado',
+        'padre', 'hijos', 'pendientes', 'visitas', 'valor_total'
+    )
+
+    def __init__(self, posicion, estado, ruta, visitados, distancia, pasto_usado,
+                 padre, vecinos):
+        self.posicion = posicion
+        self.estado = estado
+        self.ruta = ruta
+        self.visitados = visitados
+        self.distancia = distancia
+        self.pasto_usado = pasto_usado
+        self.padre = padre
+        self.hijos: List['_NodoMCTS'] = []
+        # Vecinos aún no probados como hijos
+        self.pendientes = [(v, d) for v, d in vecinos if v not in visitados]
+        self.visitas = 0
+        self.valor_total = 0.0
+
+    def completamente_expandido(self) -> bool:
+        return not self.pendientes
+
+    def es_terminal(self) -> bool:
+        return not self.pendientes and not self.hijos
+
+
+def _simular_rollout(
+    instantanea: InstantaneaGrafo,
+    posicion: int,
+    estado: EstadoBurroConPasto,
+    visitados: set,
+    max_age: float,
+    semilla: int
+) -> Tuple[List[int], EstadoBurroConPasto, float, int]:
+    """
+    Completa una ruta eligiendo vecinos factibles al azar.
+
+    Returns:
+        (tramo_añadido, estado_final, distancia_añadida, pasto_usado_añadido)
+    """
+    rng = random.Random(semilla)
+    visitados = set(visitados)
+    tramo = []
+    distancia_total = 0.0
+    pasto_usado = 0
+
+    while True:
+        opciones = [(v, d) for v, d in instantanea.vecinos(posicion) if v not in visitados]
+        rng.shuffle(opciones)
+
+        siguiente = None
+        for vecino_id, distancia in opciones:
+            estrella = instantanea.obtener_estrella(vecino_id)
+            if not estrella:
+                continue
+            nuevo = simular_viaje_con_pasto(estado, distancia, estrella, max_age)
+            if nuevo is not None and nuevo.esta_vivo(max_age):
+                siguiente = (vecino_id, distancia, nuevo)
+                break
+
+        if siguiente is None:
+            return tramo, estado, distancia_total, pasto_usado
+
+        vecino_id, distancia, nuevo = siguiente
+        pasto_usado += int(estado.pasto - nuevo.pasto)
+        distancia_total += distancia
+        tramo.append(vecino_id)
+        visitados.add(vecino_id)
+        posicion = vecino_id
+        estado = nuevo
+
+
+def _inicializar_proceso(instantanea: InstantaneaGrafo) -> None:
+    """Inicializador de ProcessPoolExecutor: guarda la instantánea del grafo."""
+    global _INSTANTANEA
+    _INSTANTANEA = instantanea
+
+
+def _rollout_en_proceso(argumentos):
+    """Ejecuta un rollout dentro de un proceso de trabajo."""
+    return _simular_rollout(_INSTANTANEA, *argumentos)
+
+
+def encontrar_ruta_mcts(
+    grafo: GrafoConstelaciones,
+    burro: Donkey,
+    posicion_inicial: int,
+    iteraciones: int = 2000,
+    tiempo_limite: Optional[float] = None,
+    exploracion: float = math.sqrt(2),
+    procesos: int = 1,
+    semilla: Optional[int] = None,
+    verbose: bool = False
+) -> Dict:
+    """
+    Busca la ruta con recarga de pasto usando Monte-Carlo Tree Search.
+
+    Alternativa "anytime" a encontrar_ruta_optima_con_pasto: se detiene al
+    agotar `iteraciones` o `tiempo_limite` (lo que ocurra primero) y devuelve
+    la mejor ruta completa vista en cualquier rollout.
+
+    Args:
+        grafo: Grafo de constelaciones
+        burro: Burro con estado inicial
+        posicion_inicial: ID de la estrella inicial
+        iteraciones: Número máximo de rollouts
+        tiempo_limite: Segundos máximos de búsqueda (None = sin límite)
+        exploracion: Constante C de UCT
+        procesos: Si > 1, ejecuta los rollouts en ese número de procesos
+        semilla: Semilla para resultados reproducibles
+        verbose: Si True, imprime información de depuración
+
+    Returns:
+        Dict con el mismo formato que encontrar_ruta_optima_con_pasto
+    """
+    instantanea = InstantaneaGrafo.desde_grafo(grafo)
+    rng = random.Random(semilla)
+    max_age = burro.max_age
+
+    estado_inicial = EstadoBurroConPasto(
+        energia=burro.donkey_energy,
+        edad=burro.age,
+        salud=burro.health,
+        pasto=burro.grass_in_basement
+    )
+
+    raiz = _NodoMCTS(
+        posicion_inicial, estado_inicial, [posicion_inicial], {posicion_inicial},
+        0.0, 0, None, instantanea.vecinos(posicion_inicial)
+    )
+
+    mejor = {
+        'ruta': [posicion_inicial],
+        'distancia': 0.0,
+        'pasto_usado': 0,
+        'estado': estado_inicial,
+    }
+    mejor_largo = [1]
+    metricas = metrics.iniciar('mcts')
+
+    def registrar(nodo, tramo, estado_final, distancia, pasto_usado) -> int:
+        """Actualiza la mejor ruta (más estrellas, luego menos pasto)."""
+        largo = len(nodo.ruta) + len(tramo)
+        pasto_total = nodo.pasto_usado + pasto_usado
+        if largo > len(mejor['ruta']) or \
+           (largo == len(mejor['ruta']) and pasto_total < mejor['pasto_usado']):
+            mejor['ruta'] = nodo.ruta + tramo
+            mejor['distancia'] = nodo.distancia + distancia
+            mejor['pasto_usado'] = pasto_total
+            mejor['estado'] = estado_final
+            if verbose:
+                print(f"  💫 Nueva mejor: {largo} estrellas, pasto usado: {pasto_total} kg")
+        mejor_largo[0] = max(mejor_largo[0], largo)
+        return largo
+
+    def uct(hijo, log_visitas_padre) -> float:
+        """Valor UCT con recompensa normalizada por la mejor ruta conocida."""
+        if hijo.visitas == 0:
+            return math.inf
+        media = hijo.valor_total / hijo.visitas / mejor_largo[0]
+        return media + exploracion * math.sqrt(log_visitas_padre / hijo.visitas)
+
+    def expandir(nodo) -> Optional[_NodoMCTS]:
+        """Crea un hijo factible a partir de los vecinos pendientes."""
+        while nodo.pendientes:
+            indice = rng.randrange(len(nodo.pendientes))
+            vecino_id, distancia = nodo.pendientes.pop(indice)
+            estrella = instantanea.obtener_estrella(vecino_id)
+            if not estrella:
+                continue
+
+            nuevo = simular_viaje_con_pasto(nodo.estado, distancia, estrella, max_age)
+            if nuevo is None or not nuevo.esta_vivo(max_age):
+                if metricas is not None:
+                    metricas.podar('inviable')
+                continue
+
+            hijo = _NodoMCTS(
+                vecino_id, nuevo, nodo.ruta + [vecino_id], nodo.visitados | {vecino_id},
+                nodo.distancia + distancia,
+                nodo.pasto_usado + int(nodo.estado.pasto - nuevo.pasto),
+                nodo, instantanea.vecinos(vecino_id)
+            )
+            nodo.hijos.append(hijo)
+            if metricas is not None:
+                metricas.nodos_expandidos += 1
+            return hijo
+        return None
+
+    def seleccionar() -> _NodoMCTS:
+        """Desciende por UCT hasta un nodo expandible o terminal."""
+        nodo = raiz
+        while True:
+            if not nodo.completamente_expandido():
+                hijo = expandir(nodo)
+                if hijo is not None:
+                    return hijo
+            if not nodo.hijos:
+                return nodo
+            log_visitas = math.log(max(1, nodo.visitas))
+            nodo = max(nodo.hijos, key=lambda h: uct(h, log_visitas))
+
+    def retropropagar(nodo, valor) -> None:
+        while nodo is not None:
+            nodo.visitas += 1
+            nodo.valor_total += valor
+            nodo = nodo.padre
+
+    if verbose:
+        print(f"\n{'='*70}")
+        print(f"🌳 MCTS CON RECARGA DE PASTO (Req. 2.0)")
+        print(f"{'='*70}")
+        print(f"📍 Posición inicial: {posicion_inicial}")
+        print(f"🔁 Iteraciones: {iteraciones}, tiempo límite: {tiempo_limite or '∞'} s")
+        print(f"🧵 Procesos: {procesos}")
+        print(f"{'='*70}\n")
+
+    inicio = time.perf_counter()
+    realizadas = 0
+    ejecutor = None
+
+    if procesos > 1:
+        ejecutor = ProcessPoolExecutor(
+            max_workers=procesos,
+            initializer=_inicializar_proceso,
+            initargs=(instantanea,)
+        )
+
+    try:
+        while realizadas < iteraciones:
+            if tiempo_limite is not None and time.perf_counter() - inicio >= tiempo_limite:
+                break
+
+            # Seleccionar un lote de hojas; la pérdida virtual (visitas sin
+            # valor) evita que el lote elija la misma hoja varias veces.
+            tamano_lote = min(procesos, iteraciones - realizadas)
+            hojas = []
+            for _ in range(tamano_lote):
+                hoja = seleccionar()
+                hojas.append(hoja)
+                retropropagar(hoja, 0.0)
+
+            argumentos = [
+                (hoja.posicion, hoja.estado, hoja.visitados, max_age, rng.getrandbits(32))
+                for hoja in hojas
+            ]
+
+            if ejecutor is not None:
+                resultados = list(ejecutor.map(_rollout_en_proceso, argumentos))
+            else:
+                resultados = [_simular_rollout(instantanea, *args) for args in argumentos]
+
+            for hoja, (tramo, estado_final, distancia, pasto_usado) in zip(hojas, resultados):
+                largo = registrar(hoja, tramo, estado_final, distancia, pasto_usado)
+                # Deshacer la pérdida virtual y sumar el valor real
+                nodo = hoja
+                while nodo is not None:
+                    nodo.valor_total += largo
+                    nodo = nodo.padre
+
+            realizadas += tamano_lote
+            if metricas is not None:
+                metricas.contar('lotes')
+
+            if raiz.es_terminal():
+                break
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    estado_final = mejor['estado']
+
+    if metricas is not None:
+        metricas.fase('busqueda')
+        metricas.contar('rollouts', realizadas)
+    metrics.terminar(metricas)
+
+    if verbose:
+        print(f"\n{'='*70}")
+        print(f"✅ MCTS COMPLETADO")
+        print(f"{'='*70}")
+        print(f"🔢 Rollouts: {realizadas} en {time.perf_counter() - inicio:.2f} s")
+        print(f"⭐ Estrellas visitadas: {len(mejor['ruta'])}")
+        print(f"🌾 Pasto usado: {mejor['pasto_usado']} kg")
+        print(f"📏 Distancia total: {mejor['distancia']:.1f} ly")
+        print(f"{'='*70}\n")
+
+    return {
+        'ruta': mejor['ruta'],
+        'distancia_total': mejor['distancia'],
+        'estrellas_visitadas': len(mejor['ruta']),
+        'pasto_usado': mejor['pasto_usado'],
+        'estado_final': {
+            'energia': estado_final.energia,
+            'edad': estado_final.edad,
+            'salud': estado_final.salud,
+            'pasto': estado_final.pasto
+        },
+        'exploraciones': realizadas
+    }
@@ -0,0 +1,190 @@
+"""
+Métricas de los algoritmos de búsqueda.
+Responsabilidad: Contadores opcionales compartidos por todos los
+algoritmos de algorithms/ (nodos expandidos, aristas, operaciones del
+heap, podas por motivo, aciertos de caché y tiempo por fase).
+
+Las métricas solo se calculan si alguien las pide:
+- recolectar(): context manager que junta las consultas hechas dentro
+  del bloque
+- suscribir(): callback llamado al terminar cada consulta
+
+Sin recolectores ni suscriptores, iniciar() devuelve None y cada
+algoritmo solo paga una comprobación `if metricas is not None` en las
+ramas que cuentan algo.
+
+Ejemplo:
+    with recolectar() as recolector:
+        dijkstra(grafo, 1)
+        bellman_ford(grafo, 1)
+    for consulta in recolector.consultas:
+        print(consulta.algoritmo, consulta.nodos_expandidos)
+
+Los recolectores y suscriptores son globales al proceso (no por hilo).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class MetricasConsulta:
+    """Contadores de una sola ejecución de un algoritmo."""
+
+    __slots__ = (
+        'algoritmo', 'nodos_expandidos', 'aristas_examinadas', 'aristas_relajadas',
+        'inserciones_heap', 'extracciones_heap', 'extracciones_obsoletas',
+        'podas', 'aciertos_cache', 'fallos_cache', 'contadores', 'tiempos',
+        '_inicio', '_marca',
+    )
+
+    def __init__(self, algoritmo: str):
+        self.algoritmo = algoritmo
+        self.nodos_expandidos = 0
+        self.aristas_examinadas = 0
+        self.aristas_relajadas = 0
+        self.inserciones_heap = 0
+        self.extracciones_heap = 0
+        self.extracciones_obsoletas = 0
+        self.podas: Dict[str, int] = {}
+        self.aciertos_cache = 0
+        self.fallos_cache = 0
+        # Contadores propios de un algoritmo (p. ej. 'rollouts' en MCTS)
+        self.contadores: Dict[str, int] = {}
+        # Segundos por fase; 'total' se agrega al terminar la consulta
+        self.tiempos: Dict[str, float] = {}
+        self._inicio = self._marca = time.perf_counter()
+
+    def podar(self, motivo: str, cantidad: int = 1) -> None:
+        """Registra ramas descartadas por un motivo."""
+        self.podas[motivo] = self.podas.get(motivo, 0) + cantidad
+
+    def contar(self, nombre: str, cantidad: int = 1) -> None:
+        """Suma a un contador propio del algoritmo."""
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def fase(self, nombre: str) -> None:
+        """
+        Cierra una fase: le asigna el tiempo transcurrido desde la fase
+        anterior (o desde el inicio de la consulta).
+        """
+        ahora = time.perf_counter()
+        self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + (ahora - self._marca)
+        self._marca = ahora
+
+    def como_dict(self) -> Dict:
+        return {
+            'algoritmo': self.algoritmo,
+            'nodos_expandidos': self.nodos_expandidos,
+            'aristas_examinadas': self.aristas_examinadas,
+            'aristas_relajadas': self.aristas_relajadas,
+            'inserciones_heap': self.inserciones_heap,
+            'extracciones_heap': self.extracciones_heap,
+            'extracciones_obsoletas': self.extracciones_obsoletas,
+            'podas': dict(self.podas),
+            'aciertos_cache': self.aciertos_cache,
+            'fallos_cache': self.fallos_cache,
+            'contadores': dict(self.contadores),
+            'tiempos': dict(self.tiempos),
+        }
+
+
+_CAMPOS_SUMABLES = (
+    'nodos_expandidos', 'aristas_examinadas', 'aristas_relajadas',
+    'inserciones_heap', 'extracciones_heap', 'extracciones_obsoletas',
+    'aciertos_cache', 'fallos_cache',
+)
+
+
+class RecolectorMetricas:
+    """Junta las consultas terminadas mientras está activo."""
+
+    def __init__(self):
+        self.consultas: List[MetricasConsulta] = []
+
+    def agregar(self, metricas: MetricasConsulta) -> None:
+        self.consultas.append(metricas)
+
+    def totales(self, algoritmo: Optional[str] = None) -> Dict:
+        """
+        Suma de todas las consultas (o solo las de un algoritmo).
+
+        Returns:
+            Mismo formato que MetricasConsulta.como_dict(), con 'consultas'
+            en lugar de 'algoritmo'
+        """
+        seleccion = [m for m in self.consultas if algoritmo is None or m.algoritmo == algoritmo]
+        total = {campo: sum(getattr(m, campo) for m in seleccion) for campo in _CAMPOS_SUMABLES}
+        for campo in ('podas', 'contadores', 'tiempos'):
+            suma: Dict = {}
+            for m in seleccion:
+                for clave, valor in getattr(m, campo).items():
+                    suma[clave] = suma.get(clave, 0) + valor
+            total[campo] = suma
+        total['consultas'] = len(seleccion)
+        return total
+
+
+_recolectores: List[RecolectorMetricas] = []
+_suscriptores: List[Callable[[MetricasConsulta], None]] = []
+
+
+def activas() -> bool:
+    """True si alguien está recibiendo métricas."""
+    return bool(_recolectores or _suscriptores)
+
+
+def iniciar(algoritmo: str) -> Optional[MetricasConsulta]:
+    """
+    Llamado por los algoritmos al comenzar una consulta.
+
+    Returns:
+        MetricasConsulta a completar, o None si las métricas están apagadas
+    """
+    if not _recolectores and not _suscriptores:
+        return None
+    return MetricasConsulta(algoritmo)
+
+
+def terminar(metricas: Optional[MetricasConsulta]) -> None:
+    """Cierra una consulta y la entrega a recolectores y suscriptores."""
+    if metricas is None:
+        return
+    metricas.tiempos['total'] = time.perf_counter() - metricas._inicio
+    for recolector in list(_recolectores):
+        recolector.agregar(metricas)
+    for callback in list(_suscriptores):
+        callback(metricas)
+
+
+def suscribir(callback: Callable[[MetricasConsulta], None]) -> None:
+    """Llama a callback(metricas) al terminar cada consulta."""
+    _suscriptores.append(callback)
+
+
+def cancelar_suscripcion(callback: Callable[[MetricasConsulta], None]) -> None:
+    if callback in _suscriptores:
+        _suscriptores.remove(callback)
+
+
+@contextmanager
+def recolectar(callback: Optional[Callable[[MetricasConsulta], None]] = None) -> Iterator[RecolectorMetricas]:
+    """
+    Activa las métricas dentro del bloque.
+
+    Args:
+        callback: Opcional, llamado además al terminar cada consulta del bloque
+
+    Yields:
+        RecolectorMetricas con las consultas del bloque
+    """
+    recolector = RecolectorMetricas()
+    _recolectores.append(recolector)
+    if callback is not None:
+        suscribir(callback)
+    try:
+        yield recolector
+    finally:
+        _recolectores.remove(recolector)
+        if callback is not None:
+            cancelar_suscripcion(callback)
@@ -15,6 +15,8 @@ Usa backtracking recursivo con poda inteligente (SOLID: SRP).
 from typing import List, Dict, Tuple, Optional
 from backend.donkey import Donkey
 from backend.constellation import GrafoConstelaciones
+from algorithms import metrics
+from algorithms.transposition import TablaTransposicion
 import math
 
 
@@ -24,6 +26,9 @@ class EstadoBurroConPasto:
     Responsabilidad: Mantener estado y simular acciones del burro.
     """
     
+    # Las búsquedas crean millones de estados: sin __dict__ por instancia
+    __slots__ = ('energia', 'edad', 'salud', 'pasto')
+    
     def __init__(self, energia: float, edad: float, salud: str, pasto: float):
         self.energia = energia
         self.edad = edad
@@ -166,7 +171,8 @@ def encontrar_ruta_optima_con_pasto(
     grafo: GrafoConstelaciones,
     burro: Donkey,
     posicion_inicial: int,
-    verbose: bool = False
+    verbose: bool = False,
+    tabla: Optional[TablaTransposicion] = None
 ) -> Dict:
     """
     Encuentra la ruta óptima que maximiza estrellas visitadas con recarga de pasto.
@@ -179,9 +185,11 @@ def encontrar_ruta_optima_con_pasto(
         burro: Burro con estado inicial
         posicion_inicial: ID de la estrella inicial
         verbose: Si True, imprime información de depuración
+        tabla: Tabla de transposición opcional (ver algorithms/transposition.py)
     
     Returns:
         Dict con la ruta óptima y estadísticas
+        ('transposicion' con las estadísticas de la tabla si se usó)
     """
     # Estado inicial
     estado_inicial = EstadoBurroConPasto(
@@ -197,6 +205,10 @@ def encontrar_ruta_optima_con_pasto(
     mejor_estado_final = estado_inicial.copy()
     mejor_pasto_usado = 0
     
+    metricas = metrics.iniciar('ruta_optima_con_pasto')
+    if tabla is not None:
+        consultas_antes, aciertos_antes = tabla.consultas, tabla.aciertos
+    
     # Contador de exploraciones
     exploraciones = [0]
     
@@ -206,9 +218,15 @@ def encontrar_ruta_optima_con_pasto(
         ruta_actual: List[int],
         distancia_actual: float,
         pasto_usado: int,
-        visitados: set
-    ):
-        """Backtracking recursivo con poda."""
+        visitados: set,
+        hash_visitados: int = 0
+    ) -> int:
+        """
+        Backtracking recursivo con poda.
+        
+        Returns:
+            Máximo de estrellas adicionales alcanzables desde este estado
+        """
         nonlocal mejor_ruta, mejor_distancia, mejor_estado_final, mejor_pasto_usado
         
         exploraciones[0] += 1
@@ -230,18 +248,36 @@ def encontrar_ruta_optima_con_pasto(
             mejor_estado_final = estado_actual.copy()
             mejor_pasto_usado = pasto_usado
         
+        # Poda 0: subárbol ya explorado con el mismo estado (transposición)
+        if tabla is not None:
+            clave = tabla.clave(posicion_actual, hash_visitados, estado_actual)
+            # Solo el mismo estado: llegar con menos energía puede hacer
+            # comer antes y terminar visitando más estrellas
+            en_cache = tabla.consultar(clave, pasto_usado)
+            if en_cache is not None:
+                if metricas is not None:
+                    metricas.podar('transposicion')
+                return en_cache
+            exploraciones_antes = exploraciones[0]
+        
+        mejor_adicional = 0
+        
         # Explorar vecinos
         vertice_actual = grafo.get_vertex(posicion_actual)
         if not vertice_actual:
-            return
+            return mejor_adicional
         
         vecinos = vertice_actual.get_connections()
+        if metricas is not None:
+            metricas.aristas_examinadas += len(vecinos)
         
         for vecino_vertex, distancia in vecinos.items():
             vecino_id = vecino_vertex.id
             
             # Poda 1: No visitar estrellas ya visitadas
             if vecino_id in visitados:
+                if metricas is not None:
+                    metricas.podar('visitada')
                 continue
             
             estrella_destino = grafo.obtener_estrella(vecino_id)
@@ -261,6 +297,8 @@ def encontrar_ruta_optima_con_pasto(
             
             # Poda 2: Si no sobrevive, no explorar
             if nuevo_estado is None or not nuevo_estado.esta_vivo(burro.max_age):
+                if metricas is not None:
+                    metricas.podar('no_sobrevive')
                 continue
             
             # Calcular pasto consumido en este viaje
@@ -270,14 +308,22 @@ def encontrar_ruta_optima_con_pasto(
             nueva_ruta = ruta_actual + [vecino_id]
             nuevo_visitados = visitados | {vecino_id}
             
-            backtracking(
+            adicional = backtracking(
                 vecino_id,
                 nuevo_estado,
                 nueva_ruta,
                 distancia_actual + distancia,
                 pasto_usado + pasto_consumido,
-                nuevo_visitados
+                nuevo_visitados,
+                tabla.zobrist.alternar(hash_visitados, vecino_id) if tabla is not None else 0
             )
+            mejor_adicional = max(mejor_adicional, adicional + 1)
+        
+        if tabla is not None:
+            tabla.guardar(clave, mejor_adicional, exploraciones[0] - exploraciones_antes,
+                          pasto_usado)
+        
+        return mejor_adicional
     
     # Iniciar búsqueda
     if verbose:
@@ -296,14 +342,25 @@ def encontrar_ruta_optima_con_pasto(
         [posicion_inicial],
         0.0,
         0,
-        {posicion_inicial}
+        {posicion_inicial},
+        tabla.zobrist.hash_de({posicion_inicial}) if tabla is not None else 0
     )
     
+    if metricas is not None:
+        metricas.fase('busqueda')
+        metricas.nodos_expandidos = exploraciones[0]
+        if tabla is not None:
+            metricas.aciertos_cache = tabla.aciertos - aciertos_antes
+            metricas.fallos_cache = (tabla.consultas - consultas_antes) - metricas.aciertos_cache
+    metrics.terminar(metricas)
+    
     if verbose:
         print(f"\n{'='*70}")
         print(f"✅ BÚSQUEDA COMPLETADA")
         print(f"{'='*70}")
         print(f"🔢 Exploraciones: {exploraciones[0]}")
+        if tabla is not None:
+            print(f"♻️  Aciertos en tabla de transposición: {tabla.aciertos}/{tabla.consultas}")
         print(f"⭐ Estrellas visitadas: {len(mejor_ruta)}")
         print(f"🌾 Pasto usado: {mejor_pasto_usado} kg")
         print(f"📏 Distancia total: {mejor_distancia:.1f} ly")
@@ -311,7 +368,7 @@ def encontrar_ruta_optima_con_pasto(
         print(f"🌾 Pasto restante: {mejor_estado_final.pasto:.0f} kg")
         print(f"{'='*70}\n")
     
-    return {
+    resultado = {
         'ruta': mejor_ruta,
         'distancia_total': mejor_distancia,
         'estrellas_visitadas': len(mejor_ruta),
@@ -324,3 +381,8 @@ def encontrar_ruta_optima_con_pasto(
         },
         'exploraciones': exploraciones[0]
     }
+    
+    if tabla is not None:
+        resultado['transposicion'] = tabla.estadisticas()
+    
+    return resultado
@@ -0,0 +1,240 @@
+"""
+Tabla de transposición para los algoritmos de backtracking.
+
+Las búsquedas exactas (max_stars_route.py y optimal_route_with_grass.py)
+llegan muchas veces al mismo (estrella actual, conjunto de visitadas) con un
+estado del burro casi idéntico, solo que por órdenes distintos. Como la ruta
+ya recorrida tiene el mismo número de estrellas, el mejor resultado de ese
+subárbol ya quedó registrado la primera vez: la tabla guarda cuántas
+estrellas adicionales se pueden alcanzar desde ese estado y el backtracking
+responde desde la caché en lugar de volver a explorarlo.
+
+Claves:
+- (estrella actual, conjunto de visitadas): hash Zobrist incremental (XOR de
+  una clave aleatoria de 64 bits por estrella), actualizado en O(1) por paso.
+- Estado del burro: energía, edad y pasto cuantizados en cubetas.
+
+Los valores guardados son cotas superiores de las estrellas adicionales
+del subárbol, y una consulta solo acierta cuando saltarse el subárbol no
+puede cambiar la ruta que devuelve la búsqueda:
+
+- Mismo estado: la entrada tiene la misma clave de 64 bits y las mismas
+  cubetas, y el coste de desempate de la ruta hasta el estado (distancia o
+  pasto usado) no es menor que el de la entrada. Desde el mismo estado se
+  alcanzan exactamente los mismos finales, así que ninguno mejora lo que ya
+  se evaluó la primera vez.
+- Dominancia (solo si la búsqueda pasa `cota`): el estado nuevo tiene menos
+  recursos que el guardado (energía y pasto menores o iguales, edad mayor
+  o igual) y ni siquiera el valor guardado alcanza para empatar a la mejor
+  ruta. Solo vale para búsquedas donde más recursos nunca dan menos
+  estrellas; la búsqueda con recarga de pasto no la usa (un burro que llega
+  con menos energía come y puede terminar adelante).
+
+Con paso None (el valor por defecto) las cubetas son los valores exactos y
+la búsqueda devuelve la misma ruta que sin tabla. Con cubetas mayores dos
+estados "casi iguales" comparten entrada y la tabla pasa a ser aproximada:
+poda más, pero la ruta (o su distancia) puede cambiar.
+"""
+
+import random
+import sys
+from typing import Dict, Optional
+
+
+MASCARA_64 = (1 << 64) - 1
+
+
+class ZobristVisitados:
+    """
+    Hash Zobrist de un conjunto de estrellas visitadas.
+
+    Cada estrella recibe una clave aleatoria de 64 bits (generada la primera
+    vez que se usa). El hash de un conjunto es el XOR de sus claves, así que
+    agregar o quitar una estrella es un solo XOR.
+    """
+
+    def __init__(self, semilla: int = 0x5EED):
+        self._rng = random.Random(semilla)
+        self._claves: Dict[int, int] = {}
+
+    def clave(self, star_id: int) -> int:
+        """Retorna la clave aleatoria de una estrella."""
+        clave = self._claves.get(star_id)
+        if clave is None:
+            clave = self._rng.getrandbits(64)
+            self._claves[star_id] = clave
+        return clave
+
+    def alternar(self, hash_actual: int, star_id: int) -> int:
+        """Agrega (o quita) una estrella del hash del conjunto."""
+        return hash_actual ^ self.clave(star_id)
+
+    def hash_de(self, visitados) -> int:
+        """Calcula el hash de un conjunto completo (sin incrementalidad)."""
+        resultado = 0
+        for star_id in visitados:
+            resultado ^= self.clave(star_id)
+        return resultado
+
+
+class TablaTransposicion:
+    """
+    Tabla de transposición de tamaño fijo.
+
+    Es un arreglo de `capacidad` casillas (potencia de dos) indexado por los
+    bits bajos de la clave. Cada casilla guarda (clave, cubetas, valor,
+    trabajo, coste), donde `trabajo` es el número de exploraciones que costó
+    calcular el valor y `coste` el coste de desempate de la ruta con la que
+    se llegó al estado.
+
+    Política de reemplazo (preferencia por profundidad): una entrada nueva
+    reemplaza a la existente si la casilla está vacía, tiene la misma clave o
+    si costó al menos el mismo trabajo. Así se conservan los subárboles más
+    caros de recalcular.
+
+    Usar una tabla distinta por tipo de búsqueda y llamar limpiar() si cambia
+    el grafo o la edad máxima del burro.
+    """
+
+    def __init__(
+        self,
+        capacidad: int = 1 << 16,
+        paso_energia: Optional[float] = None,
+        paso_edad: Optional[float] = None,
+        paso_pasto: Optional[float] = None,
+        semilla: int = 0x5EED
+    ):
+        """
+        Args:
+            capacidad: Número de casillas (se redondea a potencia de dos)
+            paso_energia: Tamaño de cubeta para la energía (None = exacto;
+                          con cubetas la tabla es aproximada)
+            paso_edad: Tamaño de cubeta para la edad (None = exacto)
+            paso_pasto: Tamaño de cubeta para el pasto (None = exacto)
+            semilla: Semilla de las claves Zobrist
+        """
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser al menos 1")
+
+        self.capacidad = 1 << (capacidad - 1).bit_length()
+        self._mascara_indice = self.capacidad - 1
+        self.paso_energia = paso_energia
+        self.paso_edad = paso_edad
+        self.paso_pasto = paso_pasto
+        self.zobrist = ZobristVisitados(semilla)
+        self.limpiar()
+
+    def limpiar(self) -> None:
+        """Vacía la tabla y reinicia las estadísticas."""
+        self._casillas = [None] * self.capacidad
+        self.consultas = 0
+        self.aciertos = 0
+        self.guardados = 0
+        self.reemplazos = 0
+        self.rechazados = 0
+
+    @staticmethod
+    def _cubeta(valor: float, paso: Optional[float]):
+        if not paso:
+            return valor
+        return int(valor // paso)
+
+    def clave(self, posicion: int, hash_visitados: int, estado) -> tuple:
+        """
+        Calcula la clave de un estado de búsqueda.
+
+        Args:
+            posicion: ID de la estrella actual
+            hash_visitados: Hash Zobrist del conjunto de visitadas
+            estado: EstadoBurro o EstadoBurroConPasto
+
+        Returns:
+            (clave de 64 bits de (posición, visitadas), cubetas del estado)
+        """
+        return (
+            (hash_visitados ^ (self.zobrist.clave(posicion) * 0x9E3779B97F4A7C15)) & MASCARA_64,
+            (
+                self._cubeta(estado.energia, self.paso_energia),
+                self._cubeta(estado.edad, self.paso_edad),
+                self._cubeta(estado.pasto, self.paso_pasto),
+            )
+        )
+
+    def consultar(self, clave: tuple, coste: float = 0.0, cota: Optional[int] = None) -> Optional[int]:
+        """
+        Retorna las estrellas adicionales guardadas para la clave, o None.
+
+        Args:
+            clave: Clave del estado (ver clave())
+            coste: Coste de desempate de la ruta hasta el estado
+            cota: Estrellas adicionales que necesita el subárbol para empatar
+                  a la mejor ruta encontrada (None = sin poda por dominancia)
+        """
+        self.consultas += 1
+        clave_nodo, cubetas = clave
+        entrada = self._casillas[clave_nodo & self._mascara_indice]
+        if entrada is None or entrada[0] != clave_nodo:
+            return None
+
+        if cubetas == entrada[1]:
+            acierto = coste >= entrada[4]
+        elif cota is not None and entrada[2] < cota:
+            energia, edad, pasto = cubetas
+            e, a, p = entrada[1]
+            acierto = energia <= e and edad >= a and pasto <= p
+        else:
+            acierto = False
+
+        if acierto:
+            self.aciertos += 1
+            return entrada[2]
+        return None
+
+    def guardar(self, clave: tuple, valor: int, trabajo: int, coste: float = 0.0) -> None:
+        """
+        Guarda las estrellas adicionales alcanzables desde un estado.
+
+        Args:
+            clave: Clave del estado (ver clave())
+            valor: Máximo de estrellas adicionales desde el estado
+            trabajo: Exploraciones que costó calcular el valor
+            coste: Coste de desempate de la ruta hasta el estado
+        """
+        clave_nodo, cubetas = clave
+        indice = clave_nodo & self._mascara_indice
+        entrada = self._casillas[indice]
+
+        if entrada is None:
+            self.guardados += 1
+        elif entrada[0] == clave_nodo or trabajo >= entrada[3]:
+            self.reemplazos += 1
+        else:
+            self.rechazados += 1
+            return
+
+        self._casillas[indice] = (clave_nodo, cubetas, valor, trabajo, coste)
+
+    def memoria_bytes(self) -> int:
+        """Memoria aproximada de la tabla (arreglo + entradas + claves Zobrist)."""
+        total = sys.getsizeof(self._casillas)
+        for entrada in self._casillas:
+            if entrada is not None:
+                total += sys.getsizeof(entrada) + sum(sys.getsizeof(x) for x in entrada)
+                total += sum(sys.getsizeof(x) for x in entrada[1])
+        total += sys.getsizeof(self.zobrist._claves)
+        return total
+
+    def estadisticas(self) -> Dict:
+        """Resumen de uso: tasa de aciertos, ocupación y memoria."""
+        ocupadas = sum(1 for entrada in self._casillas if entrada is not None)
+        return {
+            'consultas': self.consultas,
+            'aciertos': self.aciertos,
+            'tasa_aciertos': self.aciertos / self.consultas if self.consultas else 0.0,
+            'guardados': self.guardados,
+            'reemplazos': self.reemplazos,
+            'rechazados': self.rechazados,
+            'ocupacion': ocupadas / self.capacidad,
+            'capacidad': self.capacidad,
+            'memoria_bytes': self.memoria_bytes(),
+        }
@@ -0,0 +1,311 @@
+"""
+Simulador por lotes.
+Responsabilidad: Ejecutar muchos viajes (configuración inicial del burro +
+itinerario) sin interfaz, sin imprimir y sin esperar, y devolver los
+estados finales en un arreglo de registros NumPy.
+"""
+
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.donkey import Donkey
+from backend.health_calculator import HealthStatus
+from backend.snapshot import InstantaneaGrafo
+
+
+# Códigos de salud del campo 'salud' (índice en esta tupla)
+SALUDES: Tuple[str, ...] = tuple(estado.value for estado in HealthStatus)
+_CODIGO_SALUD: Dict[str, int] = {nombre: i for i, nombre in enumerate(SALUDES)}
+
+# Códigos del campo 'motivo': por qué terminó la ejecución
+MOTIVO_COMPLETADO = 0
+MOTIVO_MUERTE = 1
+MOTIVO_YA_VISITADA = 2
+MOTIVO_SIN_RUTA = 3
+
+DTYPE_RESULTADO = np.dtype([
+    ('energia', np.float64),
+    ('edad', np.float64),
+    ('pasto', np.int64),
+    ('salud', np.int8),
+    ('vivo', np.bool_),
+    ('paso_muerte', np.int32),   # -1 si no murió
+    ('pasos', np.int32),         # destinos alcanzados
+    ('motivo', np.int8),
+    ('distancia', np.float64),
+])
+
+# Instantánea del grafo en cada proceso de trabajo (ver _inicializar_proceso)
+_INSTANTANEA: Optional[InstantaneaGrafo] = None
+
+
+@dataclass(frozen=True)
+class ConfiguracionBurro:
+    """Estado inicial de un burro para una ejecución del lote."""
+    energia: float
+    edad: float
+    edad_maxima: float
+    pasto: int
+
+    @classmethod
+    def desde_burro(cls, burro: Donkey) -> 'ConfiguracionBurro':
+        """Toma la configuración inicial de un Donkey existente."""
+        return cls(burro.donkey_energy, burro.age, burro.max_age, burro.grass_in_basement)
+
+    def crear_burro(self) -> Donkey:
+        """Crea un Donkey silencioso con reloj simulado."""
+        return Donkey(
+            name="Burro Lote",
+            age=self.edad,
+            max_age=self.edad_maxima,
+            donkey_energy=self.energia,
+            grass_in_basement=self.pasto
+        )
+
+
+def camino_mas_corto(
+    instantanea: InstantaneaGrafo,
+    origen: int,
+    destino: int,
+    visitadas: set
+) -> Optional[List[Tuple[int, int, float]]]:
+    """
+    Dijkstra sobre la instantánea con las mismas reglas que
+    encontrar_camino_mas_corto: no atraviesa estrellas ya visitadas.
+
+    Returns:
+        Lista de tramos (desde, hasta, peso) o None si no hay ruta
+    """
+    if origen not in instantanea.adyacencia:
+        return None
+
+    dist = {origen: 0.0}
+    pred = {origen: origen}
+    cerrados = set()
+    pq = [(0.0, origen)]
+
+    while pq:
+        dist_actual, u = heapq.heappop(pq)
+        if u in cerrados:
+            continue
+        cerrados.add(u)
+        if u == destino:
+            break
+        for v, peso in instantanea.vecinos(u):
+            if v in cerrados or (v in visitadas and v != origen):
+                continue
+            nueva = dist_actual + peso
+            if nueva < dist.get(v, math.inf):
+                dist[v] = nueva
+                pred[v] = u
+                heapq.heappush(pq, (nueva, v))
+
+    if destino not in pred:
+        return None
+
+    camino = [destino]
+    while camino[-1] != origen:
+        camino.append(pred[camino[-1]])
+    camino.reverse()
+
+    tramos = []
+    for u, v in zip(camino, camino[1:]):
+        pesos = dict(instantanea.vecinos(u))
+        tramos.append((u, v, pesos[v]))
+    return tramos
+
+
+def simular_itinerario(
+    instantanea: InstantaneaGrafo,
+    configuracion: ConfiguracionBurro,
+    itinerario: Sequence[int],
+    investigar: bool = True
+) -> tuple:
+    """
+    Ejecuta un itinerario con las mismas reglas que SimuladorViaje.
+
+    Cada destino se alcanza por el camino más corto (Donkey.trip por tramo),
+    se marca como visitado, aplica la bonificación de hipergigante y, si
+    `investigar` es True, el burro investiga la estrella durante su
+    stay_duration (como investigar_estrella). El itinerario empieza en su
+    primer elemento.
+
+    Returns:
+        Tupla con los campos de DTYPE_RESULTADO
+
+    Raises:
+        ValueError: Si el itinerario está vacío
+    """
+    if not itinerario:
+        raise ValueError("El itinerario está vacío: debe empezar por la estrella de partida")
+
+    burro = configuracion.crear_burro()
+    posicion = itinerario[0]
+    visitadas = set()
+    distancia = 0.0
+    pasos = 0
+    paso_muerte = -1
+    motivo = MOTIVO_COMPLETADO
+
+    for paso, destino in enumerate(itinerario[1:], 1):
+        if destino in visitadas:
+            motivo = MOTIVO_YA_VISITADA
+            break
+
+        tramos = camino_mas_corto(instantanea, posicion, destino, visitadas)
+        if tramos is None:
+            motivo = MOTIVO_SIN_RUTA
+            break
+
+        # Como SimuladorViaje, la distancia solo cuenta si el viaje termina
+        recorrido = 0.0
+        for desde, hasta, peso in tramos:
+            origen = instantanea.obtener_estrella(desde)
+            estrella = instantanea.obtener_estrella(hasta)
+            misma_constelacion = bool(
+                set(origen.constelaciones) & set(estrella.constelaciones)
+            )
+            if burro.trip(
+                distance=peso,
+                time_to_eat_kg=estrella.time_to_eat,
+                time_of_stance=0,
+                is_star=misma_constelacion,
+                health_impact=estrella.health_impact,
+                life_time_impact=estrella.life_time_impact,
+                research_energy_cost=estrella.research_energy_cost,
+            ):
+                break
+            posicion = hasta
+            recorrido += peso
+
+        if not burro.alive:
+            motivo = MOTIVO_MUERTE
+            paso_muerte = paso
+            break
+
+        distancia += recorrido
+
+        estrella = instantanea.obtener_estrella(destino)
+        visitadas.add(destino)
+        if estrella.hipergigante:
+            burro.hyper_star(0)
+
+        if investigar and burro.stay_of_star(
+            time_to_eat_kg=estrella.time_to_eat,
+            time_of_stance=estrella.stay_duration,
+            health_impact=estrella.health_impact,
+            life_time_impact=estrella.life_time_impact,
+            research_energy_cost=estrella.research_energy_cost,
+        ):
+            motivo = MOTIVO_MUERTE
+            paso_muerte = paso
+            pasos += 1
+            break
+
+        pasos += 1
+
+    return (
+        burro.donkey_energy,
+        burro.age,
+        burro.grass_in_basement,
+        _CODIGO_SALUD.get(burro.health, -1),
+        burro.alive,
+        paso_muerte,
+        pasos,
+        motivo,
+        distancia,
+    )
+
+
+def _inicializar_proceso(instantanea: InstantaneaGrafo) -> None:
+    """Inicializador de ProcessPoolExecutor: guarda la instantánea del grafo."""
+    global _INSTANTANEA
+    _INSTANTANEA = instantanea
+
+
+def _simular_bloque(argumentos) -> List[tuple]:
+    """Ejecuta un bloque de (configuración, itinerario) en un proceso de trabajo."""
+    bloque, investigar = argumentos
+    return [
+        simular_itinerario(_INSTANTANEA, configuracion, itinerario, investigar)
+        for configuracion, itinerario in bloque
+    ]
+
+
+class SimuladorLote:
+    """
+    Ejecuta miles de viajes sobre una misma instantánea del grafo.
+
+    A diferencia de SimuladorViaje no toca el grafo (las estrellas visitadas
+    se llevan por ejecución), no publica eventos y usa reloj simulado, así
+    que cada ejecución es independiente y se puede repartir entre procesos.
+    """
+
+    def __init__(
+        self,
+        instantanea: InstantaneaGrafo,
+        procesos: int = 1,
+        tamano_bloque: int = 256,
+        investigar: bool = True
+    ):
+        """
+        Args:
+            instantanea: Grafo sobre el que se simula
+            procesos: Si > 1, reparte los bloques en ese número de procesos
+            tamano_bloque: Ejecuciones por tarea enviada a un proceso
+            investigar: Si True, el burro investiga cada destino
+        """
+        self.instantanea = instantanea
+        self.procesos = procesos
+        self.tamano_bloque = max(1, tamano_bloque)
+        self.investigar = investigar
+
+    def ejecutar(
+        self,
+        ejecuciones: Sequence[Tuple[ConfiguracionBurro, Sequence[int]]]
+    ) -> np.recarray:
+        """
+        Simula todas las ejecuciones.
+
+        Args:
+            ejecuciones: Pares (configuración inicial, itinerario); el
+                         itinerario empieza por la estrella de partida
+
+        Returns:
+            np.recarray con DTYPE_RESULTADO, una fila por ejecución y en el
+            mismo orden de entrada
+
+        Raises:
+            ValueError: Si algún itinerario está vacío
+        """
+        ejecuciones = [(c, tuple(it)) for c, it in ejecuciones]
+        for indice, (_, itinerario) in enumerate(ejecuciones):
+            if not itinerario:
+                raise ValueError(
+                    f"El itinerario de la ejecución {indice} está vacío: "
+                    "debe empezar por la estrella de partida"
+                )
+
+        if self.procesos > 1 and len(ejecuciones) > self.tamano_bloque:
+            bloques = [
+                (ejecuciones[i:i + self.tamano_bloque], self.investigar)
+                for i in range(0, len(ejecuciones), self.tamano_bloque)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=self.procesos,
+                initializer=_inicializar_proceso,
+                initargs=(self.instantanea,)
+            ) as ejecutor:
+                filas = [fila for bloque in ejecutor.map(_simular_bloque, bloques) for fila in bloque]
+        else:
+            filas = [
+                simular_itinerario(self.instantanea, configuracion, itinerario, self.investigar)
+                for configuracion, itinerario in ejecuciones
+            ]
+
+        return np.array(filas, dtype=DTYPE_RESULTADO).view(np.recarray)
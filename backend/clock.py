@@ -0,0 +1,118 @@
+"""
+Relojes del viaje.
+Responsabilidad: Llevar la cuenta del tiempo simulado (en horas) sin
+bloquear el hilo que ejecuta la simulación.
+
+- SimulatedClock: avanza instantáneamente. Para lotes, pruebas y ejecuciones
+  sin interfaz.
+- AnimatedClock: avanza igual de rápido, pero además programa cuánto tiempo
+  real debería durar la animación de cada acción. La interfaz consulta
+  is_animating() y animation_progress() en cada frame en lugar de dormir
+  (el anillo de progreso de la estadía alrededor del burro).
+"""
+
+import time
+from typing import Callable
+
+
+class Clock:
+    """
+    Interfaz de reloj inyectable en Donkey y SimuladorViaje.
+
+    El tiempo se mide en horas simuladas desde la creación del reloj.
+    """
+
+    __slots__ = ('_hours',)
+
+    def __init__(self) -> None:
+        self._hours: float = 0.0
+
+    @property
+    def now(self) -> float:
+        """Horas simuladas transcurridas."""
+        return self._hours
+
+    def advance(self, hours: float) -> None:
+        """
+        Avanza el reloj. Nunca bloquea.
+
+        Args:
+            hours: Horas simuladas a avanzar (los valores <= 0 se ignoran)
+        """
+        if hours > 0:
+            self._hours += hours
+
+    def reset(self) -> None:
+        """Vuelve el reloj a la hora cero."""
+        self._hours = 0.0
+
+
+class SimulatedClock(Clock):
+    """Reloj puramente simulado: avanzar es solo una suma."""
+
+    __slots__ = ()
+
+
+class AnimatedClock(Clock):
+    """
+    Reloj para la interfaz gráfica.
+
+    Cada avance se traduce en una animación de `seconds_per_hour` segundos
+    reales por hora simulada (con un tope de `max_animation_seconds`). Las
+    animaciones se encadenan: si se avanza mientras otra sigue en curso, la
+    nueva empieza cuando termine la anterior.
+    """
+
+    __slots__ = (
+        'seconds_per_hour', 'max_animation_seconds', '_time_source',
+        '_animation_start', '_animation_end',
+    )
+
+    def __init__(
+        self,
+        seconds_per_hour: float = 0.1,
+        max_animation_seconds: float = 2.0,
+        time_source: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            seconds_per_hour: Segundos reales de animación por hora simulada
+            max_animation_seconds: Duración máxima de la animación de un avance
+            time_source: Fuente de tiempo real (inyectable para pruebas)
+        """
+        super().__init__()
+        self.seconds_per_hour = seconds_per_hour
+        self.max_animation_seconds = max_animation_seconds
+        self._time_source = time_source
+        self._animation_start: float = 0.0
+        self._animation_end: float = 0.0
+
+    def advance(self, hours: float) -> None:
+        if hours <= 0:
+            return
+        super().advance(hours)
+
+        now = self._time_source()
+        duration = min(hours * self.seconds_per_hour, self.max_animation_seconds)
+        if self._animation_end <= now:
+            self._animation_start = now
+            self._animation_end = now + duration
+        else:
+            self._animation_end += duration
+
+    def is_animating(self) -> bool:
+        """True mientras quede animación pendiente."""
+        return self._time_source() < self._animation_end
+
+    def animation_progress(self) -> float:
+        """Progreso de la animación en curso, de 0.0 a 1.0."""
+        total = self._animation_end - self._animation_start
+        if total <= 0:
+            return 1.0
+        elapsed = self._time_source() - self._animation_start
+        return max(0.0, min(1.0, elapsed / total))
+
+    def reset(self) -> None:
+        super().reset()
+        self._animation_start = 0.0
+        self._animation_end = 0.0
@@ -3,7 +3,7 @@ Grafo de constelaciones.
 Responsabilidad: Gestión de estrellas agrupadas en constelaciones.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from backend.graph import Graph
 from backend.star import Estrella
 
@@ -19,6 +19,8 @@ class GrafoConstelaciones(Graph):
         super().__init__()
         self.estrellas: Dict[int, Estrella] = {}
         self.constelaciones: Dict[str, List[int]] = {}
+        # Estrellas editadas desde el último guardado (utils/config_saver.py)
+        self.estrellas_modificadas: Set[int] = set()
     
     def agregar_estrella(
         self,
@@ -111,6 +113,26 @@ class GrafoConstelaciones(Graph):
         except ValueError:
             return 0
     
+    def actualizar_estrella(self, star_id: int, **campos) -> bool:
+        """
+        Edita atributos de una estrella y la marca como modificada, para que
+        el próximo guardado incremental escriba solo las estrellas editadas.
+        
+        Args:
+            star_id: ID de la estrella
+            **campos: atributo=valor (ej. amount_of_energy=5)
+        
+        Returns:
+            True si la estrella existe
+        """
+        estrella = self.obtener_estrella(star_id)
+        if estrella is None:
+            return False
+        for atributo, valor in campos.items():
+            setattr(estrella, atributo, valor)
+        self.estrellas_modificadas.add(star_id)
+        return True
+    
     def estrella_tiene_multiples_constelaciones(self, star_id: int) -> bool:
         """
         Verifica si una estrella pertenece a más de una constelación.
@@ -155,6 +177,7 @@ class GrafoConstelaciones(Graph):
             # Bloquear en AMBAS direcciones para grafo no dirigido
             vertex_from.block_edge(to_id)
             vertex_to.block_edge(from_id)
+            self.bump_version()
             return True
         return False
     
@@ -178,6 +201,7 @@ class GrafoConstelaciones(Graph):
             # Habilitar en AMBAS direcciones para grafo no dirigido
             vertex_from.unblock_edge(to_id)
             vertex_to.unblock_edge(from_id)
+            self.bump_version()
             return True
         return False
     
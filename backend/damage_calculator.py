@@ -2,8 +2,9 @@
 Calculador de daño por viaje.
 Responsabilidad: Single Responsibility - calcular daño basado en edad.
 """
+import math
 from dataclasses import dataclass
-from typing import Final
+from typing import Final, Tuple
 
 
 @dataclass(frozen=True)
@@ -59,3 +60,35 @@ class DamageCalculator:
             return self._rates.MATURE_CONSTELLATION if is_constellation else self._rates.MATURE_STAR
         else:
             return self._rates.OLD_CONSTELLATION if is_constellation else self._rates.OLD_STAR
+    
+    def damage_band(self, age: float) -> Tuple[float, float, float, float]:
+        """
+        Calcula ambos daños y el intervalo [mínimo, máximo) de edad en el
+        que no cambian.
+        
+        Permite a Donkey recalcular el daño solo cuando la edad cruza el
+        límite de una franja. Los daños salen siempre de calculate_damage;
+        si una subclase lo redefine sin redefinir también este método, sus
+        franjas no se conocen y el intervalo cubre solo la edad actual
+        (Donkey recalcula en cada cambio de edad).
+        
+        Args:
+            age: Edad actual en años luz
+            
+        Returns:
+            (daño estrella, daño constelación, edad mínima, edad máxima exclusiva)
+        """
+        star = self.calculate_damage(age, False)
+        constellation = self.calculate_damage(age, True)
+        if type(self).calculate_damage is not DamageCalculator.calculate_damage:
+            return star, constellation, age, math.nextafter(age, math.inf)
+        
+        r = self._rates
+        if age < r.YOUNG_MAX:
+            return star, constellation, -math.inf, r.YOUNG_MAX
+        elif age < r.ADULT_MAX:
+            return star, constellation, r.YOUNG_MAX, r.ADULT_MAX
+        elif age < r.MATURE_MAX:
+            return star, constellation, r.ADULT_MAX, r.MATURE_MAX
+        else:
+            return star, constellation, r.MATURE_MAX, math.inf
@@ -13,9 +13,14 @@ Mejores prácticas Python:
 - Nombres según PEP 8
 - Docstrings según PEP 257
 """
-from time import sleep
+import math
 from typing import Optional
 
+from backend.clock import Clock, SimulatedClock
+from backend.events import (
+    EventBus, GrassEaten, GrassRefused, MealFinished, ResearchStarted,
+    ResearchApplied, ResearchFinished, Died, IntergalacticTravel
+)
 from backend.health_calculator import HealthCalculator
 from backend.damage_calculator import DamageCalculator
 
@@ -24,6 +29,10 @@ from backend.damage_calculator import DamageCalculator
 MAX_ENERGY: float = 100.0
 MIN_ENERGY: float = 0.0
 
+# Calculadoras por defecto compartidas (no tienen estado mutable)
+_DEFAULT_HEALTH_CALCULATOR = HealthCalculator()
+_DEFAULT_DAMAGE_CALCULATOR = DamageCalculator()
+
 
 class Donkey:
     """
@@ -47,8 +56,19 @@ class Donkey:
         health: Estado de salud basado en energía
         damage_stars: Porcentaje de desgaste por viaje entre estrellas
         damage_constellations: Porcentaje de desgaste entre constelaciones
+    
+    Las propiedades derivadas se guardan junto con el intervalo de edad (o
+    energía) en el que son válidas; _update_derived_properties solo llama a
+    las calculadoras cuando el valor sale de su franja.
     """
     
+    __slots__ = (
+        'name', 'age', 'max_age', 'donkey_energy', 'grass_in_basement', 'alive',
+        '_health_calculator', '_damage_calculator', 'clock', 'events',
+        'damage_stars', 'damage_constellations', 'health',
+        '_damage_low', '_damage_high', '_health_low', '_health_high',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -57,7 +77,9 @@ class Donkey:
         donkey_energy: float,
         grass_in_basement: int,
         health_calculator: Optional[HealthCalculator] = None,
-        damage_calculator: Optional[DamageCalculator] = None
+        damage_calculator: Optional[DamageCalculator] = None,
+        clock: Optional[Clock] = None,
+        events: Optional[EventBus] = None
     ) -> None:
         """
         Inicializa el burro con sus estadísticas base.
@@ -70,6 +92,8 @@ class Donkey:
             grass_in_basement: Cantidad inicial de pasto en kg
             health_calculator: Calculadora de salud (inyectable para testing)
             damage_calculator: Calculadora de daño (inyectable para testing)
+            clock: Reloj del viaje (por defecto SimulatedClock, no bloquea)
+            events: Bus de eventos (por defecto uno sin suscriptores: silencioso)
         """
         # Estado mutable del burro
         self.name: str = name
@@ -81,13 +105,18 @@ class Donkey:
         
         # Dependency Inversion: inyección de dependencias
         # Permite mockear para testing y cambiar implementación
-        self._health_calculator = health_calculator or HealthCalculator()
-        self._damage_calculator = damage_calculator or DamageCalculator()
+        self._health_calculator = health_calculator or _DEFAULT_HEALTH_CALCULATOR
+        self._damage_calculator = damage_calculator or _DEFAULT_DAMAGE_CALCULATOR
+        
+        # El tiempo de comer e investigar avanza este reloj en vez de dormir
+        self.clock: Clock = clock or SimulatedClock()
+        
+        # Lo que le pasa al burro se publica aquí en lugar de imprimirse
+        self.events: EventBus = events or EventBus()
         
-        # Calcular propiedades iniciales para compatibilidad
-        self.damage_stars: float = self.calculate_damage_per_trip()
-        self.damage_constellations: float = self.calculate_damage_per_trip(True)
-        self.health: str = self.calculate_donkey_health()
+        # Calcular propiedades iniciales (damage_stars, damage_constellations, health)
+        self._invalidate_derived_cache()
+        self._refresh_bands()
     
     def calculate_damage_per_trip(self, is_constellation: bool = False) -> float:
         """Calcula el daño por viaje (método legacy mantenido para compatibilidad)."""
@@ -109,11 +138,52 @@ class Donkey:
         """
         return max(MIN_ENERGY, min(MAX_ENERGY, energy))
     
+    def _invalidate_derived_cache(self) -> None:
+        """
+        Fuerza a recalcular daño y salud en la próxima actualización.
+        
+        Llamar si se asignan damage_stars, damage_constellations o health
+        desde fuera.
+        """
+        self._damage_low = math.inf
+        self._damage_high = -math.inf
+        self._health_low = math.inf
+        self._health_high = -math.inf
+    
+    def _refresh_bands(self) -> None:
+        """Recalcula daño y salud solo si la edad o la energía cambiaron de franja."""
+        age = self.age
+        if not (self._damage_low <= age < self._damage_high):
+            (self.damage_stars, self.damage_constellations,
+             self._damage_low, self._damage_high) = self._damage_band(age)
+        
+        energy = self.donkey_energy
+        if not (self._health_low <= energy < self._health_high):
+            status, self._health_low, self._health_high = self._health_band(energy)
+            self.health = status.value
+    
+    def _damage_band(self, age: float) -> tuple:
+        """
+        damage_band de la calculadora inyectada. Una calculadora que solo
+        implementa calculate_damage no declara franjas: se recalcula en
+        cada cambio de edad.
+        """
+        calculator = self._damage_calculator
+        if hasattr(calculator, 'damage_band'):
+            return calculator.damage_band(age)
+        return (calculator.calculate_damage(age, False), calculator.calculate_damage(age, True),
+                age, math.nextafter(age, math.inf))
+    
+    def _health_band(self, energy: float) -> tuple:
+        """health_band de la calculadora inyectada (ver _damage_band)."""
+        calculator = self._health_calculator
+        if hasattr(calculator, 'health_band'):
+            return calculator.health_band(energy)
+        return calculator.calculate_health(energy), energy, math.nextafter(energy, math.inf)
+    
     def _update_derived_properties(self) -> None:
         """Actualiza las propiedades calculadas (para compatibilidad con código existente)."""
-        self.damage_stars = self.calculate_damage_per_trip(False)
-        self.damage_constellations = self.calculate_damage_per_trip(True)
-        self.health = self.calculate_donkey_health()
+        self._refresh_bands()
         self.alive = self._health_calculator.is_alive(self.donkey_energy) and self.age < self.max_age
     
     def calculate_grass_profit(self) -> float:
@@ -156,12 +226,14 @@ class Donkey:
             True si comió exitosamente, False si no pudo comer
         """
         if self.grass_in_basement <= 0:
-            print("No hay hierba en el sótano para que el burro coma.")
+            if self.events.active:
+                self.events.publish(GrassRefused('sin_pasto', self.donkey_energy))
             return False
         
         # REQUERIMIENTO: Solo puede comer si tiene menos del 50% de energía
         if self.donkey_energy >= 50.0:
-            print(f"El burro tiene {self.donkey_energy:.1f}% de energía (≥50%). No necesita comer.")
+            if self.events.active:
+                self.events.publish(GrassRefused('energia_suficiente', self.donkey_energy))
             return False
         
         # Incrementar energía según el porcentaje de ganancia
@@ -174,12 +246,18 @@ class Donkey:
         # Actualizar propiedades derivadas
         self._update_derived_properties()
         
+        if self.events.active:
+            self.events.publish(GrassEaten(grass_profit, self.donkey_energy, self.grass_in_basement))
+        
         return True
     
     def dead(self) -> None:
         """Marca al burro como muerto y detiene todas las acciones."""
         self.alive = False
         self.damage_stars = 0
+        # damage_stars ya no corresponde a la franja de edad guardada
+        self._damage_low = math.inf
+        self._damage_high = -math.inf
     
     def stay_of_star(
         self,
@@ -198,6 +276,9 @@ class Donkey:
         - Cada kg de pasto tarda "time_to_eat_kg" horas en consumirse
         - La investigación consume "research_energy_cost" por hora
         
+        Las horas de comida e investigación avanzan self.clock (tiempo
+        simulado); este método nunca bloquea el hilo.
+        
         Args:
             time_to_eat_kg: Tiempo para comer 1kg de hierba (horas)
             time_of_stance: Tiempo total de estancia en la estrella (horas)
@@ -211,12 +292,10 @@ class Donkey:
         if not self.alive:
             return "El burro está muerto y no puede explorar."
         
-        print(f"\n🔬 El burro investiga la estrella...")
+        events = self.events
         
         # REQUERIMIENTO: Si tiene < 50% energía, debe comer primero
         if self.donkey_energy < 50.0:
-            print(f"⚠️ Energía baja ({self.donkey_energy:.1f}%). El burro come primero.")
-            
             # 50% del tiempo para comer, 50% para investigar
             time_to_eat = time_of_stance * 0.5
             time_investigate = time_of_stance * 0.5
@@ -224,49 +303,46 @@ class Donkey:
             # Calcular cuántos kg puede comer en ese tiempo
             kg_to_eat = int(time_to_eat / time_to_eat_kg) if time_to_eat_kg > 0 else 0
             
-            print(f"🍽️  Tiempo disponible para comer: {time_to_eat:.1f} horas")
-            print(f"🌾 Puede comer hasta {kg_to_eat} kg de pasto")
+            if events.active:
+                events.publish(ResearchStarted(self.donkey_energy, True, time_to_eat, kg_to_eat))
             
             # Comer pasto según el tiempo disponible
             kg_comidos = 0
+            recuperado = False
             for _ in range(kg_to_eat):
                 grass_profit = self.calculate_grass_profit()
                 if self.eat_grass(grass_profit):
                     kg_comidos += 1
-                    sleep(time_to_eat_kg)
-                    print(f"  🌾 Comió 1 kg (+{grass_profit:.1f}% energía). Energía: {self.donkey_energy:.1f}%")
+                    self.clock.advance(time_to_eat_kg)
                     
                     # Si ya tiene ≥50% energía, deja de comer
                     if self.donkey_energy >= 50.0:
-                        print(f"  ✅ Energía recuperada a {self.donkey_energy:.1f}%. Deja de comer.")
+                        recuperado = True
                         break
                 else:
                     break
             
-            if kg_comidos > 0:
-                print(f"🌾 Total comido: {kg_comidos} kg de pasto")
+            if events.active:
+                events.publish(MealFinished(kg_comidos, self.donkey_energy, self.health, recuperado))
         else:
             # Si tiene ≥50% energía, usa todo el tiempo para investigar
             time_investigate = time_of_stance
-            print(f"✅ Energía suficiente ({self.donkey_energy:.1f}%). No necesita comer.")
+            if events.active:
+                events.publish(ResearchStarted(self.donkey_energy, False))
         
         # Aplicar efectos de la investigación
-        print(f"⏱️ Tiempo de investigación: {time_investigate:.1f} horas")
+        self.clock.advance(time_investigate)
         
         # REQUERIMIENTO: Consumir energía durante la investigación
         # "Y" cantidad de energía por cada "X" tiempo de investigación
+        energia_consumida = 0.0
         if research_energy_cost > 0:
             energia_consumida = research_energy_cost * time_investigate
             self.donkey_energy -= energia_consumida
-            print(f"🔬 Energía consumida investigando: {energia_consumida:.1f} ({research_energy_cost:.1f} × {time_investigate:.1f}h)")
         
         # Efectos en la salud/energía (healthImpact)
         if health_impact != 0:
             self.donkey_energy += health_impact
-            if health_impact > 0:
-                print(f"💚 La investigación fue beneficiosa: +{health_impact:.1f} de energía")
-            else:
-                print(f"💔 La investigación causó daño: {health_impact:.1f} de energía")
             
             # Asegurar que la energía esté en rango válido
             self.donkey_energy = self._clamp_energy(self.donkey_energy)
@@ -277,23 +353,24 @@ class Donkey:
             # Si life_time_impact < 0: pierde años de vida (se hace más viejo, age aumenta)
             # Si life_time_impact > 0: gana años de vida (se hace más joven, age disminuye)
             self.age -= life_time_impact  # Restamos porque positivo = ganar = reducir edad
-            if life_time_impact > 0:  # Valores positivos rejuvenecen (disminuyen age)
-                print(f"⏰ ¡Experimento exitoso! Rejuveneció {life_time_impact:.1f} años luz de vida")
-                print(f"   Nueva edad efectiva: {self.age:.1f} años luz")
-            else:  # Valores negativos envejecen (aumentan age)
-                print(f"⚠️ La investigación envejeció {abs(life_time_impact):.1f} años luz de vida")
-                print(f"   Nueva edad: {self.age:.1f} años luz")
+        
+        if events.active:
+            events.publish(ResearchApplied(
+                time_investigate, research_energy_cost, energia_consumida,
+                health_impact, life_time_impact, self.age
+            ))
         
         # Verificar si sigue vivo después de los efectos
         if self.age >= self.max_age or self.donkey_energy <= MIN_ENERGY:
             self.dead()
-            print(f"\n💀 El burro ha muerto durante la investigación...")
+            if events.active:
+                events.publish(Died('investigacion', self.age, self.donkey_energy))
             return "El burro ha muerto."
         
         # Actualizar propiedades derivadas
         self._update_derived_properties()
-        print(f"💚 Estado de salud: {self.health}")
-        print(f"⚡ Energía final: {self.donkey_energy:.1f}")
+        if events.active:
+            events.publish(ResearchFinished(self.health, self.donkey_energy))
         
         return None
 
@@ -350,6 +427,8 @@ class Donkey:
         # Verificar muerte
         if self.age >= self.max_age or self.donkey_energy <= MIN_ENERGY:
             self.dead()
+            if self.events.active:
+                self.events.publish(Died('viaje', self.age, self.donkey_energy))
             return "El burro ha muerto durante el viaje."
         
         # Actualizar propiedades derivadas
@@ -382,6 +461,8 @@ class Donkey:
         
         if self.age >= self.max_age or self.donkey_energy <= MIN_ENERGY:
             self.dead()
+            if self.events.active:
+                self.events.publish(Died('hipergigante', self.age, self.donkey_energy))
             return "El burro ha muerto durante el viaje."
         
         # Aplicar bonificaciones de hipergigante
@@ -419,9 +500,7 @@ class Donkey:
         # Actualizar propiedades derivadas
         self._update_derived_properties()
         
-        print(f"\n{'='*70}")
-        print(f"🌌 ¡VIAJE INTER-GALÁCTICO COMPLETADO!")
-        print(f"{'='*70}")
-        print(f"⚡ Energía recargada: +{recharge_amount:.1f} (total: {self.donkey_energy:.1f})")
-        print(f"🌾 Pasto duplicado: {self.grass_in_basement:.0f} kg")
-        print(f"{'='*70}\n")
\ No newline at end of file
+        if self.events.active:
+            self.events.publish(IntergalacticTravel(
+                recharge_amount, self.donkey_energy, self.grass_in_basement
+            ))
\ No newline at end of file
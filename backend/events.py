@@ -0,0 +1,516 @@
+"""
+Eventos del viaje.
+Responsabilidad: Publicar lo que le pasa al burro como eventos tipados en
+lugar de imprimirlo, y repartirlos a suscriptores intercambiables.
+
+- EventBus: registro de suscriptores y publicación. Sin suscriptores,
+  `active` es False y los emisores ni siquiera construyen el evento.
+- ConsoleSubscriber: reproduce la salida en consola de siempre.
+- RingBufferSubscriber: guarda los últimos N eventos en memoria.
+- JsonlFileSubscriber: escribe un evento JSON por línea en un archivo.
+"""
+
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+
+# ---------------------------------------------------------------------------
+# Eventos
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Event:
+    """Clase base de todos los eventos del viaje."""
+
+
+@dataclass(frozen=True)
+class TripStarted(Event):
+    """Comienza un viaje planificado (TravelManager.viajar_a)."""
+    origin: int
+    destination: int
+    path: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class LegStarted(Event):
+    """Comienza un tramo entre dos estrellas adyacentes."""
+    origin_label: str
+    destination_label: str
+    distance: float
+
+
+@dataclass(frozen=True)
+class LegCompleted(Event):
+    """El burro llegó vivo al final de un tramo."""
+    energy: float
+    health: str
+
+
+@dataclass(frozen=True)
+class TravelFailed(Event):
+    """Un viaje no pudo iniciarse o se interrumpió."""
+    origin: int
+    destination: int
+    reason: str
+    detail: str = ""
+    during_leg: bool = False
+
+
+@dataclass(frozen=True)
+class Arrived(Event):
+    """El burro llegó a la estrella destino."""
+    star_id: int
+    label: str
+    hypergiant: bool
+
+
+@dataclass(frozen=True)
+class HyperStarBonus(Event):
+    """Bonificación de estrella hipergigante aplicada."""
+    energy: float
+    grass: float
+
+
+@dataclass(frozen=True)
+class IntergalacticTravel(Event):
+    """Viaje inter-galáctico completado."""
+    recharge: float
+    energy: float
+    grass: float
+
+
+@dataclass(frozen=True)
+class ResearchStarted(Event):
+    """El burro empieza su estancia en una estrella."""
+    energy: float
+    must_eat: bool
+    hours_to_eat: float = 0.0
+    max_kg: int = 0
+
+
+@dataclass(frozen=True)
+class GrassEaten(Event):
+    """El burro comió 1 kg de pasto."""
+    energy_gain: float
+    energy: float
+    grass_left: int
+
+
+@dataclass(frozen=True)
+class GrassRefused(Event):
+    """El burro no pudo comer ('sin_pasto' o 'energia_suficiente')."""
+    reason: str
+    energy: float
+
+
+@dataclass(frozen=True)
+class MealFinished(Event):
+    """Terminó una comida (durante la investigación o manual)."""
+    kg_eaten: int
+    energy: float
+    health: str
+    recovered: bool = False
+    during_research: bool = True
+
+
+@dataclass(frozen=True)
+class ResearchApplied(Event):
+    """Efectos de la investigación aplicados al burro."""
+    hours: float
+    energy_cost_per_hour: float
+    energy_consumed: float
+    health_impact: float
+    life_time_impact: float
+    age: float
+
+
+@dataclass(frozen=True)
+class ResearchFinished(Event):
+    """El burro sobrevivió a la investigación."""
+    health: str
+    energy: float
+
+
+@dataclass(frozen=True)
+class Died(Event):
+    """El burro murió ('viaje', 'investigacion' o 'hipergigante')."""
+    cause: str
+    age: float
+    energy: float
+
+
+@dataclass(frozen=True)
+class InvestigationRequested(Event):
+    """El jugador pidió investigar la estrella actual."""
+    star_id: int
+    label: str
+    hours: float
+    description: str
+
+
+@dataclass(frozen=True)
+class InvestigationCompleted(Event):
+    """Resultado de una investigación pedida por el jugador."""
+    star_id: int
+    success: bool
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class ReachableOption:
+    """Una estrella alcanzable, tal como la lista mostrar_opciones()."""
+    star_id: int
+    label: str
+    found: bool
+    hypergiant: bool
+    distance: float
+    energy_left: float
+    path: Tuple[int, ...]
+    effects: str
+
+
+@dataclass(frozen=True)
+class OptionsListed(Event):
+    """Estado del burro y estrellas alcanzables (SimuladorViaje.mostrar_opciones)."""
+    name: str
+    star_id: int
+    star_label: str
+    energy: float
+    health: str
+    grass: int
+    age: float
+    max_age: float
+    total_distance: float
+    options: Tuple[ReachableOption, ...] = field(default_factory=tuple)
+
+
+# ---------------------------------------------------------------------------
+# Bus
+# ---------------------------------------------------------------------------
+
+Handler = Callable[[Event], None]
+
+
+class EventBus:
+    """
+    Bus de eventos síncrono.
+
+    Los emisores deben comprobar `bus.active` antes de construir un evento:
+    sin suscriptores el costo de emitir es una lectura de atributo.
+    """
+
+    __slots__ = ('_by_type', '_all', 'active')
+
+    def __init__(self) -> None:
+        self._by_type: Dict[Type[Event], List[Handler]] = {}
+        self._all: List[Handler] = []
+        self.active: bool = False
+
+    def subscribe(self, handler: Handler, *event_types: Type[Event]) -> Handler:
+        """
+        Registra un suscriptor.
+
+        Args:
+            handler: Función u objeto invocable que recibe el evento
+            event_types: Tipos de evento a recibir (ninguno = todos)
+
+        Returns:
+            El mismo handler, para poder desuscribirlo después
+        """
+        if event_types:
+            for event_type in event_types:
+                self._by_type.setdefault(event_type, []).append(handler)
+        else:
+            self._all.append(handler)
+        self.active = True
+        return handler
+
+    def unsubscribe(self, handler: Handler) -> None:
+        """Quita un suscriptor de todos los tipos a los que estaba registrado."""
+        if handler in self._all:
+            self._all.remove(handler)
+        for event_type in list(self._by_type):
+            handlers = self._by_type[event_type]
+            if handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                del self._by_type[event_type]
+        self.active = bool(self._all or self._by_type)
+
+    def publish(self, event: Event) -> None:
+        """Entrega el evento a los suscriptores de su tipo y a los generales."""
+        if not self.active:
+            return
+        for handler in self._by_type.get(type(event), ()):
+            handler(event)
+        for handler in self._all:
+            handler(event)
+
+
+# ---------------------------------------------------------------------------
+# Suscriptores
+# ---------------------------------------------------------------------------
+
+def _format_trip_started(e: TripStarted) -> List[str]:
+    return ["\n🚀 INICIANDO VIAJE", f"{'-'*60}"]
+
+
+def _format_leg_started(e: LegStarted) -> List[str]:
+    return [
+        f"\n📍 {e.origin_label} → {e.destination_label}",
+        f"   Distancia: {e.distance:.2f} ly",
+    ]
+
+
+def _format_leg_completed(e: LegCompleted) -> List[str]:
+    return [
+        f"   ⚡ Energía restante: {e.energy:.2f}",
+        f"   💚 Salud: {e.health}",
+    ]
+
+
+def _format_travel_failed(e: TravelFailed) -> List[str]:
+    indent = "   " if e.during_leg else ""
+    lines = [f"{indent}❌ {e.reason}"]
+    if e.detail:
+        lines.append(f"   {e.detail}")
+    return lines
+
+
+def _format_arrived(e: Arrived) -> List[str]:
+    lines = [f"\n✅ LLEGASTE A: {e.label}"]
+    if e.hypergiant:
+        lines.append("\n⭐ ¡ESTRELLA HIPERGIGANTE!")
+    return lines
+
+
+def _format_hyper_star_bonus(e: HyperStarBonus) -> List[str]:
+    return [
+        f"   🎁 Energía: {e.energy:.2f} (+50%)",
+        f"   🌾 Pasto: {e.grass} kg (x2)",
+    ]
+
+
+def _format_intergalactic(e: IntergalacticTravel) -> List[str]:
+    return [
+        f"\n{'='*70}",
+        "🌌 ¡VIAJE INTER-GALÁCTICO COMPLETADO!",
+        f"{'='*70}",
+        f"⚡ Energía recargada: +{e.recharge:.1f} (total: {e.energy:.1f})",
+        f"🌾 Pasto duplicado: {e.grass:.0f} kg",
+        f"{'='*70}\n",
+    ]
+
+
+def _format_research_started(e: ResearchStarted) -> List[str]:
+    lines = ["\n🔬 El burro investiga la estrella..."]
+    if e.must_eat:
+        lines += [
+            f"⚠️ Energía baja ({e.energy:.1f}%). El burro come primero.",
+            f"🍽️  Tiempo disponible para comer: {e.hours_to_eat:.1f} horas",
+            f"🌾 Puede comer hasta {e.max_kg} kg de pasto",
+        ]
+    else:
+        lines.append(f"✅ Energía suficiente ({e.energy:.1f}%). No necesita comer.")
+    return lines
+
+
+def _format_grass_eaten(e: GrassEaten) -> List[str]:
+    return [f"  🌾 Comió 1 kg (+{e.energy_gain:.1f}% energía). Energía: {e.energy:.1f}%"]
+
+
+def _format_grass_refused(e: GrassRefused) -> List[str]:
+    if e.reason == 'sin_pasto':
+        return ["No hay hierba en el sótano para que el burro coma."]
+    return [f"El burro tiene {e.energy:.1f}% de energía (≥50%). No necesita comer."]
+
+
+def _format_meal_finished(e: MealFinished) -> List[str]:
+    if not e.during_research:
+        if e.kg_eaten == 0:
+            return []
+        return [
+            f"🌾 El burro comió {e.kg_eaten} kg de pasto",
+            f"⚡ Energía actual: {e.energy:.2f}",
+            f"💚 Salud: {e.health}",
+        ]
+    lines = []
+    if e.recovered:
+        lines.append(f"  ✅ Energía recuperada a {e.energy:.1f}%. Deja de comer.")
+    if e.kg_eaten > 0:
+        lines.append(f"🌾 Total comido: {e.kg_eaten} kg de pasto")
+    return lines
+
+
+def _format_research_applied(e: ResearchApplied) -> List[str]:
+    lines = [f"⏱️ Tiempo de investigación: {e.hours:.1f} horas"]
+    if e.energy_cost_per_hour > 0:
+        lines.append(
+            f"🔬 Energía consumida investigando: {e.energy_consumed:.1f} "
+            f"({e.energy_cost_per_hour:.1f} × {e.hours:.1f}h)"
+        )
+    if e.health_impact > 0:
+        lines.append(f"💚 La investigación fue beneficiosa: +{e.health_impact:.1f} de energía")
+    elif e.health_impact < 0:
+        lines.append(f"💔 La investigación causó daño: {e.health_impact:.1f} de energía")
+    if e.life_time_impact > 0:
+        lines += [
+            f"⏰ ¡Experimento exitoso! Rejuveneció {e.life_time_impact:.1f} años luz de vida",
+            f"   Nueva edad efectiva: {e.age:.1f} años luz",
+        ]
+    elif e.life_time_impact < 0:
+        lines += [
+            f"⚠️ La investigación envejeció {abs(e.life_time_impact):.1f} años luz de vida",
+            f"   Nueva edad: {e.age:.1f} años luz",
+        ]
+    return lines
+
+
+def _format_research_finished(e: ResearchFinished) -> List[str]:
+    return [
+        f"💚 Estado de salud: {e.health}",
+        f"⚡ Energía final: {e.energy:.1f}",
+    ]
+
+
+def _format_died(e: Died) -> List[str]:
+    # La muerte en viaje la informa TravelFailed con el mensaje del burro
+    if e.cause == 'investigacion':
+        return ["\n💀 El burro ha muerto durante la investigación..."]
+    return []
+
+
+def _format_investigation_requested(e: InvestigationRequested) -> List[str]:
+    return [
+        f"\n🔬 INVESTIGANDO: {e.label}",
+        f"   ⏱️  Tiempo de investigación: {e.hours} horas",
+        f"   📊 Efectos: {e.description}",
+    ]
+
+
+def _format_investigation_completed(e: InvestigationCompleted) -> List[str]:
+    if e.success:
+        return ["   ✅ Investigación completada"]
+    return [f"   ❌ {e.message}"]
+
+
+def _format_options_listed(e: OptionsListed) -> List[str]:
+    lines = [
+        f"\n{'='*60}",
+        f"🐴 ESTADO DEL BURRO: {e.name}",
+        f"{'='*60}",
+        f"📍 Posición actual: {e.star_label} (ID: {e.star_id})",
+        f"⚡ Energía: {e.energy:.2f}",
+        f"💚 Salud: {e.health}",
+        f"🌾 Pasto en sótano: {e.grass} kg",
+        f"🎂 Edad: {e.age:.2f} años (máx: {e.max_age})",
+        f"📏 Distancia total recorrida: {e.total_distance:.2f} ly",
+    ]
+
+    if not e.options:
+        lines += [
+            "\n❌ No hay estrellas alcanzables con tu energía actual.",
+            "💡 Intenta comer pasto para recuperar energía.",
+        ]
+        return lines
+
+    lines += [f"\n✅ ESTRELLAS ALCANZABLES ({len(e.options)}):", f"{'-'*60}"]
+    for i, option in enumerate(e.options, 1):
+        if not option.found:
+            lines.append(f"\n{i}. [ERROR: Estrella ID {option.star_id} no encontrada]")
+            continue
+
+        tipo = "⭐ HIPERGIGANTE" if option.hypergiant else "🌟 Normal"
+        lines += [
+            f"\n{i}. {option.label} (ID: {option.star_id}) {tipo}",
+            f"   📏 Distancia: {option.distance:.2f} ly",
+            f"   ⚡ Energía necesaria: {option.distance:.2f}",
+            f"   🔋 Energía restante: {option.energy_left:.2f}",
+            f"   🛤️  Camino: {' → '.join(map(str, option.path))}",
+        ]
+        if option.effects:
+            lines.append(f"   🔬 Efectos: {option.effects}")
+        if option.hypergiant:
+            lines.append("   🎁 Bonus: +50% energía, x2 pasto")
+    return lines
+
+
+_CONSOLE_FORMATTERS: Dict[Type[Event], Callable[[Event], List[str]]] = {
+    TripStarted: _format_trip_started,
+    LegStarted: _format_leg_started,
+    LegCompleted: _format_leg_completed,
+    TravelFailed: _format_travel_failed,
+    Arrived: _format_arrived,
+    HyperStarBonus: _format_hyper_star_bonus,
+    IntergalacticTravel: _format_intergalactic,
+    ResearchStarted: _format_research_started,
+    GrassEaten: _format_grass_eaten,
+    GrassRefused: _format_grass_refused,
+    MealFinished: _format_meal_finished,
+    ResearchApplied: _format_research_applied,
+    ResearchFinished: _format_research_finished,
+    Died: _format_died,
+    InvestigationRequested: _format_investigation_requested,
+    InvestigationCompleted: _format_investigation_completed,
+    OptionsListed: _format_options_listed,
+}
+
+
+class ConsoleSubscriber:
+    """Imprime los eventos con el formato de consola original."""
+
+    def __init__(self, output: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Args:
+            output: Función que recibe cada línea (por defecto print)
+        """
+        self._output = output or print
+
+    def __call__(self, event: Event) -> None:
+        formatter = _CONSOLE_FORMATTERS.get(type(event))
+        if formatter is None:
+            return
+        for line in formatter(event):
+            self._output(line)
+
+
+class RingBufferSubscriber:
+    """Guarda los últimos `capacity` eventos en memoria."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.events: deque = deque(maxlen=capacity)
+
+    def __call__(self, event: Event) -> None:
+        self.events.append(event)
+
+    def of_type(self, event_type: Type[Event]) -> List[Event]:
+        """Retorna los eventos guardados de un tipo."""
+        return [e for e in self.events if isinstance(e, event_type)]
+
+    def clear(self) -> None:
+        self.events.clear()
+
+
+class JsonlFileSubscriber:
+    """Escribe cada evento como una línea JSON: {"type": ..., campos...}."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def __call__(self, event: Event) -> None:
+        record = {'type': type(event).__name__}
+        record.update(asdict(event))
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> 'JsonlFileSubscriber':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
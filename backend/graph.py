@@ -6,6 +6,8 @@ Responsabilidad: Solo la lógica de grafos (vértices y aristas).
 class Vertex:
     """Representa un vértice en el grafo."""
     
+    __slots__ = ('id', 'x', 'y', 'constelaciones', 'neighbors', 'blocked_edges')
+    
     def __init__(self, id, x=0, y=0, constelaciones=None):
         self.id = id
         self.x = x
@@ -56,11 +58,19 @@ class Graph:
     
     def __init__(self):
         self.graph = {}  # {id: Vertex}
+        # Aumenta con cada cambio de vértices, aristas o bloqueos; las vistas
+        # lo usan para invalidar lo que tienen pre-renderizado
+        self.version = 0
+    
+    def bump_version(self):
+        """Registra un cambio hecho directamente sobre los vértices."""
+        self.version += 1
     
     def add_vertex(self, id, x=0, y=0, constelaciones=None):
         """Añade un vértice al grafo."""
         if id not in self.graph:
             self.graph[id] = Vertex(id, x, y, constelaciones)
+            self.version += 1
         return self.graph[id]
     
     def get_vertex(self, id):
@@ -79,3 +89,4 @@ class Graph:
             self.add_vertex(to_id)
         
         self.graph[from_id].add_neighbor(self.graph[to_id], weight)
+        self.version += 1
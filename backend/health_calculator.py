@@ -2,9 +2,10 @@
 Calculador de salud del burro.
 Responsabilidad: Single Responsibility - solo calcular salud basado en energía.
 """
+import math
 from dataclasses import dataclass
 from enum import Enum
-from typing import Final
+from typing import Final, Tuple
 
 
 class HealthStatus(Enum):
@@ -59,6 +60,41 @@ class HealthCalculator:
         else:
             return HealthStatus.DEAD
     
+    def health_band(self, energy: float) -> Tuple[HealthStatus, float, float]:
+        """
+        Calcula la salud y el intervalo [mínimo, máximo) de energía en el
+        que esa salud no cambia.
+        
+        Permite a Donkey recalcular la salud solo cuando la energía sale
+        del intervalo. La salud sale siempre de calculate_health; si una
+        subclase lo redefine sin redefinir también este método, el
+        intervalo cubre solo la energía actual (Donkey recalcula en cada
+        cambio de energía).
+        
+        Args:
+            energy: Nivel de energía actual
+            
+        Returns:
+            (HealthStatus, energía mínima, energía máxima exclusiva)
+        """
+        status = self.calculate_health(energy)
+        if type(self).calculate_health is not HealthCalculator.calculate_health:
+            return status, energy, math.nextafter(energy, math.inf)
+        
+        t = self._thresholds
+        # "energy > EXCELLENT" equivale a "energy >= siguiente float"
+        above_excellent = math.nextafter(t.EXCELLENT, math.inf)
+        if status is HealthStatus.EXCELLENT:
+            return status, above_excellent, math.inf
+        elif status is HealthStatus.GOOD:
+            return status, t.GOOD, above_excellent
+        elif status is HealthStatus.BAD:
+            return status, t.BAD, t.GOOD
+        elif status is HealthStatus.DYING:
+            return status, t.DYING, t.BAD
+        else:
+            return status, -math.inf, t.DYING
+    
     def is_alive(self, energy: float) -> bool:
         """Verifica si el burro está vivo basado en energía."""
         return energy > 0
@@ -0,0 +1,330 @@
+"""
+Población vectorizada de burros.
+Responsabilidad: Aplicar viajes y estancias a muchos burros a la vez con
+arreglos NumPy, con los mismos resultados que Donkey uno por uno.
+
+Pensado para estudios Monte-Carlo ("¿qué pasa si...?"): en lugar de crear N
+objetos Donkey y llamar a sus métodos, se guardan energía, edad, pasto,
+estado de vida y propiedades derivadas como arreglos de longitud N.
+
+Fidelidad con Donkey:
+- Las propiedades derivadas (daño por edad, salud) se guardan en caché y
+  solo se recalculan donde Donkey llama a _update_derived_properties, así
+  que el daño de un viaje usa la edad anterior al viaje.
+- dead() pone damage_stars en 0 y no recalcula la salud.
+- Las operaciones en coma flotante se hacen en el mismo orden que en
+  Donkey, por lo que los resultados coinciden bit a bit.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backend.batch_simulator import SALUDES
+from backend.clock import SimulatedClock
+from backend.damage_calculator import DamageRates
+from backend.donkey import Donkey, MAX_ENERGY, MIN_ENERGY
+from backend.health_calculator import HealthThresholds
+
+
+# Energía por kg de pasto según el código de salud (ver
+# Donkey.calculate_grass_profit; "Muerto" cae en el valor por defecto 2.0)
+GRASS_PROFIT = np.array([5.0, 3.0, 2.0, 1.0, 2.0])
+
+# Mismo factor que Donkey.trip (REQUERIMIENTO 2.0.b)
+ENERGY_CONSUMPTION_FACTOR = 0.5
+
+
+class DonkeyPopulation:
+    """
+    N burros representados como arreglos NumPy.
+
+    Attributes:
+        energy, age, max_age: float64[N]
+        grass: int64[N] (Donkey usa int de Python; aquí el pasto desborda
+            tras ~60 duplicaciones seguidas)
+        alive: bool[N]
+        health: int8[N], índice en SALUDES
+        damage_stars, damage_constellations: float64[N] (caché, como Donkey)
+        hours: float64[N], horas simuladas (equivale a Donkey.clock.now)
+
+    Los parámetros de trip()/stay_of_star() pueden ser escalares (la misma
+    estrella para todos) o arreglos de longitud N.
+    """
+
+    def __init__(
+        self,
+        energy,
+        age,
+        max_age,
+        grass,
+        health_thresholds: Optional[HealthThresholds] = None,
+        damage_rates: Optional[DamageRates] = None
+    ) -> None:
+        """
+        Args:
+            energy: Energía inicial de cada burro (se clampea a [0, 100])
+            age: Edad inicial
+            max_age: Edad máxima
+            grass: Pasto inicial en kg
+            health_thresholds: Umbrales de salud (como HealthCalculator)
+            damage_rates: Tasas de daño (como DamageCalculator)
+        """
+        self.energy = np.maximum(MIN_ENERGY, np.minimum(MAX_ENERGY, np.array(energy, dtype=np.float64)))
+        n = self.energy.shape[0]
+        self.age = np.array(np.broadcast_to(age, n), dtype=np.float64)
+        self.max_age = np.array(np.broadcast_to(max_age, n), dtype=np.float64)
+        self.grass = np.array(np.broadcast_to(grass, n), dtype=np.int64)
+        self.alive = np.ones(n, dtype=np.bool_)
+        self.hours = np.zeros(n, dtype=np.float64)
+
+        self._thresholds = health_thresholds or HealthThresholds()
+        rates = damage_rates or DamageRates()
+        self._age_bins = np.array([rates.YOUNG_MAX, rates.ADULT_MAX, rates.MATURE_MAX])
+        self._star_rates = np.array([rates.YOUNG_STAR, rates.ADULT_STAR, rates.MATURE_STAR, rates.OLD_STAR])
+        self._constellation_rates = np.array([
+            rates.YOUNG_CONSTELLATION, rates.ADULT_CONSTELLATION,
+            rates.MATURE_CONSTELLATION, rates.OLD_CONSTELLATION
+        ])
+
+        # Como Donkey.__init__: propiedades derivadas iniciales (alive queda True)
+        self.damage_stars = self._star_rates[np.digitize(self.age, self._age_bins)]
+        self.damage_constellations = self._constellation_rates[np.digitize(self.age, self._age_bins)]
+        self.health = self._health_codes(self.energy)
+
+    @classmethod
+    def from_donkeys(cls, donkeys: Sequence[Donkey]) -> 'DonkeyPopulation':
+        """Crea una población con el estado actual de varios Donkey."""
+        population = cls(
+            [d.donkey_energy for d in donkeys],
+            [d.age for d in donkeys],
+            [d.max_age for d in donkeys],
+            [d.grass_in_basement for d in donkeys],
+        )
+        population.alive = np.array([d.alive for d in donkeys], dtype=np.bool_)
+        population.health = np.array([SALUDES.index(d.health) for d in donkeys], dtype=np.int8)
+        population.damage_stars = np.array([d.damage_stars for d in donkeys], dtype=np.float64)
+        population.damage_constellations = np.array([d.damage_constellations for d in donkeys], dtype=np.float64)
+        population.hours = np.array([d.clock.now for d in donkeys], dtype=np.float64)
+        return population
+
+    def __len__(self) -> int:
+        return self.energy.shape[0]
+
+    def to_donkey(self, index: int) -> Donkey:
+        """Reconstruye el Donkey número `index` (para inspección o pruebas)."""
+        clock = SimulatedClock()
+        clock.advance(float(self.hours[index]))
+        donkey = Donkey(
+            name=f"Burro {index}",
+            age=float(self.age[index]),
+            max_age=float(self.max_age[index]),
+            donkey_energy=float(self.energy[index]),
+            grass_in_basement=int(self.grass[index]),
+            clock=clock
+        )
+        donkey.alive = bool(self.alive[index])
+        donkey.health = SALUDES[self.health[index]]
+        donkey.damage_stars = float(self.damage_stars[index])
+        donkey.damage_constellations = float(self.damage_constellations[index])
+        donkey._invalidate_derived_cache()
+        return donkey
+
+    def health_labels(self) -> List[str]:
+        """Estado de salud de cada burro como texto ("Excelente", ...)."""
+        return [SALUDES[code] for code in self.health]
+
+    # ------------------------------------------------------------------
+    # Propiedades derivadas
+    # ------------------------------------------------------------------
+
+    def _health_codes(self, energy: np.ndarray) -> np.ndarray:
+        """Umbrales de HealthCalculator.calculate_health con np.select."""
+        t = self._thresholds
+        return np.select(
+            [energy > t.EXCELLENT, energy >= t.GOOD, energy >= t.BAD, energy >= t.DYING],
+            [0, 1, 2, 3],
+            default=4
+        ).astype(np.int8)
+
+    def _update_derived_properties(self, mask: np.ndarray) -> None:
+        """Equivalente vectorizado de Donkey._update_derived_properties."""
+        band = np.digitize(self.age[mask], self._age_bins)
+        self.damage_stars[mask] = self._star_rates[band]
+        self.damage_constellations[mask] = self._constellation_rates[band]
+        energy = self.energy[mask]
+        self.health[mask] = self._health_codes(energy)
+        self.alive[mask] = (energy > 0) & (self.age[mask] < self.max_age[mask])
+
+    def _dead(self, mask: np.ndarray) -> None:
+        """Equivalente vectorizado de Donkey.dead."""
+        self.alive[mask] = False
+        self.damage_stars[mask] = 0
+
+    def _clamp(self, energy: np.ndarray) -> np.ndarray:
+        return np.maximum(MIN_ENERGY, np.minimum(MAX_ENERGY, energy))
+
+    def _broadcast(self, value, dtype=np.float64) -> np.ndarray:
+        return np.broadcast_to(np.asarray(value, dtype=dtype), self.energy.shape)
+
+    # ------------------------------------------------------------------
+    # Acciones
+    # ------------------------------------------------------------------
+
+    def trip(
+        self,
+        distance,
+        time_to_eat_kg=0,
+        time_of_stance=0,
+        is_star=True,
+        health_impact=0,
+        life_time_impact=0,
+        research_energy_cost=0
+    ) -> np.ndarray:
+        """
+        Donkey.trip para todos los burros vivos.
+
+        Returns:
+            Máscara de los burros que murieron en este viaje (o en la
+            estancia que lo sigue)
+        """
+        distance = self._broadcast(distance)
+        is_star = self._broadcast(is_star, np.bool_)
+
+        moving = self.alive.copy()
+        energy = self.energy[moving] - distance[moving] * ENERGY_CONSUMPTION_FACTOR
+        self.age[moving] += distance[moving]
+        damage = np.where(is_star[moving], self.damage_stars[moving], self.damage_constellations[moving])
+        self.energy[moving] = self._clamp(energy * (1 - damage))
+
+        died = moving & ((self.age >= self.max_age) | (self.energy <= MIN_ENERGY))
+        self._dead(died)
+
+        arrived = moving & ~died
+        self._update_derived_properties(arrived)
+
+        died |= self._stay(
+            arrived & is_star, time_to_eat_kg, time_of_stance,
+            health_impact, life_time_impact, research_energy_cost
+        )
+        return died
+
+    def stay_of_star(
+        self,
+        time_to_eat_kg=0,
+        time_of_stance=0,
+        health_impact=0,
+        life_time_impact=0,
+        research_energy_cost=0
+    ) -> np.ndarray:
+        """
+        Donkey.stay_of_star para todos los burros vivos.
+
+        Returns:
+            Máscara de los burros que murieron durante la investigación
+        """
+        return self._stay(
+            self.alive.copy(), time_to_eat_kg, time_of_stance,
+            health_impact, life_time_impact, research_energy_cost
+        )
+
+    def _stay(
+        self,
+        mask: np.ndarray,
+        time_to_eat_kg,
+        time_of_stance,
+        health_impact,
+        life_time_impact,
+        research_energy_cost
+    ) -> np.ndarray:
+        time_to_eat_kg = self._broadcast(time_to_eat_kg)
+        time_of_stance = self._broadcast(time_of_stance)
+        health_impact = self._broadcast(health_impact)
+        life_time_impact = self._broadcast(life_time_impact)
+        research_energy_cost = self._broadcast(research_energy_cost)
+
+        # REQUERIMIENTO: Si tiene < 50% energía, 50% del tiempo para comer
+        eating = mask & (self.energy < 50.0)
+        time_investigate = np.where(eating, time_of_stance * 0.5, time_of_stance)
+        kg_to_eat = np.zeros(len(self), dtype=np.int64)
+        can_divide = eating & (time_to_eat_kg > 0)
+        kg_to_eat[can_divide] = np.trunc(
+            (time_of_stance[can_divide] * 0.5) / time_to_eat_kg[can_divide]
+        ).astype(np.int64)
+
+        # Un kg por vuelta; el beneficio depende de la salud, que cambia al comer
+        kg_eaten = np.zeros(len(self), dtype=np.int64)
+        active = eating & (kg_to_eat > 0)
+        while active.any():
+            eats = active & (self.grass > 0)
+            profit = GRASS_PROFIT[self.health[eats]]
+            self.energy[eats] = self._clamp(self.energy[eats] + profit)
+            self.grass[eats] -= 1
+            self._update_derived_properties(eats)
+            self.hours[eats] += time_to_eat_kg[eats]
+            kg_eaten[eats] += 1
+            active = eats & (self.energy < 50.0) & (kg_eaten < kg_to_eat)
+
+        self.hours[mask] += np.where(time_investigate[mask] > 0, time_investigate[mask], 0.0)
+
+        # Efectos de la investigación, en el mismo orden que Donkey
+        cost = mask & (research_energy_cost > 0)
+        self.energy[cost] -= research_energy_cost[cost] * time_investigate[cost]
+
+        impact = mask & (health_impact != 0)
+        self.energy[impact] = self._clamp(self.energy[impact] + health_impact[impact])
+
+        aging = mask & (life_time_impact != 0)
+        self.age[aging] -= life_time_impact[aging]
+
+        died = mask & ((self.age >= self.max_age) | (self.energy <= MIN_ENERGY))
+        self._dead(died)
+        self._update_derived_properties(mask & ~died)
+        return died
+
+    def hyper_star(self, distance=0) -> np.ndarray:
+        """
+        Donkey.hyper_star para todos los burros vivos.
+
+        Returns:
+            Máscara de los burros que murieron
+        """
+        distance = self._broadcast(distance)
+        mask = self.alive.copy()
+        self.age[mask] += distance[mask]
+
+        died = mask & ((self.age >= self.max_age) | (self.energy <= MIN_ENERGY))
+        self._dead(died)
+
+        bonus = mask & ~died
+        self.energy[bonus] = self._clamp(self.energy[bonus] * 1.5)
+        self.grass[bonus] *= 2
+        self._update_derived_properties(bonus)
+        return died
+
+    def intergalactic_travel(self) -> None:
+        """Donkey.intergalactic_travel (como el original, también para los muertos)."""
+        self.energy = self._clamp(self.energy + self.energy * 0.5)
+        self.grass *= 2
+        self._update_derived_properties(np.ones(len(self), dtype=np.bool_))
+
+    def eat(self, kg: int = 1) -> np.ndarray:
+        """
+        Come hasta `kg` kg como SimuladorViaje.comer_pasto: el beneficio por
+        kg se calcula una sola vez, con la salud previa a comer.
+
+        Returns:
+            kg comidos por cada burro
+        """
+        profit = np.where(self.grass > 0, GRASS_PROFIT[self.health], 0.0)
+        eaten = np.zeros(len(self), dtype=np.int64)
+        active = np.ones(len(self), dtype=np.bool_)
+        for _ in range(kg):
+            active &= (self.grass > 0) & (self.energy < 50.0)
+            if not active.any():
+                break
+            self.energy[active] = self._clamp(self.energy[active] + profit[active])
+            self.grass[active] -= 1
+            self._update_derived_properties(active)
+            eaten[active] += 1
+        return eaten
@@ -3,8 +3,15 @@ Simulador de viaje.
 Responsabilidad: Mantener estado del viaje y coordinar acciones.
 """
 
+from typing import Optional
+
+from backend.clock import Clock
 from backend.constellation import GrafoConstelaciones
 from backend.donkey import Donkey
+from backend.events import (
+    EventBus, OptionsListed, ReachableOption, MealFinished,
+    InvestigationRequested, InvestigationCompleted
+)
 from backend.star import Estrella
 from backend.travel_manager import TravelManager
 from algorithms.dijkstra import obtener_estrellas_alcanzables
@@ -14,11 +21,28 @@ class SimuladorViaje:
     """
     Coordina el viaje del burro por las constelaciones.
     Mantiene el estado del viaje (posición, historial, distancia).
+    
+    El tiempo del viaje lo lleva un Clock compartido con el burro; si no se
+    pasa uno, se usa el reloj del burro (SimulatedClock por defecto). Lo
+    mismo con el EventBus: sin suscriptores la simulación es silenciosa.
     """
     
-    def __init__(self, grafo: GrafoConstelaciones, donkey: Donkey, posicion_inicial: int):
+    def __init__(
+        self,
+        grafo: GrafoConstelaciones,
+        donkey: Donkey,
+        posicion_inicial: int,
+        clock: Optional[Clock] = None,
+        events: Optional[EventBus] = None
+    ):
         self.grafo = grafo
         self.donkey = donkey
+        if clock is not None:
+            donkey.clock = clock
+        self.clock = donkey.clock
+        if events is not None:
+            donkey.events = events
+        self.events = donkey.events
         self.posicion_actual = posicion_inicial
         self.historial_viaje = [posicion_inicial]
         self.distancia_total = 0.0
@@ -36,19 +60,12 @@ class SimuladorViaje:
         return self.grafo.obtener_estrella(self.posicion_actual)
     
     def mostrar_opciones(self):
-        """Muestra las estrellas alcanzables con la energía actual del burro."""
-        print(f"\n{'='*60}")
-        print(f"🐴 ESTADO DEL BURRO: {self.donkey.name}")
-        print(f"{'='*60}")
-        
-        estrella_actual = self.obtener_estrella_actual()
-        print(f"📍 Posición actual: {estrella_actual.label} (ID: {self.posicion_actual})")
-        print(f"⚡ Energía: {self.donkey.donkey_energy:.2f}")
-        print(f"💚 Salud: {self.donkey.health}")
-        print(f"🌾 Pasto en sótano: {self.donkey.grass_in_basement} kg")
-        print(f"🎂 Edad: {self.donkey.age:.2f} años (máx: {self.donkey.max_age})")
-        print(f"📏 Distancia total recorrida: {self.distancia_total:.2f} ly")
+        """
+        Calcula las estrellas alcanzables con la energía actual del burro.
         
+        Publica un OptionsListed con el estado del burro y las opciones
+        (ConsoleSubscriber lo muestra como antes).
+        """
         # Obtener estrellas alcanzables
         alcanzables = obtener_estrellas_alcanzables(
             self.grafo,
@@ -56,38 +73,49 @@ class SimuladorViaje:
             self.donkey.donkey_energy
         )
         
-        if not alcanzables:
-            print("\n❌ No hay estrellas alcanzables con tu energía actual.")
-            print("💡 Intenta comer pasto para recuperar energía.")
-            return []
+        if self.events.active:
+            self.events.publish(self._crear_evento_opciones(alcanzables))
         
-        print(f"\n✅ ESTRELLAS ALCANZABLES ({len(alcanzables)}):")
-        print(f"{'-'*60}")
-        
-        for i, opcion in enumerate(alcanzables, 1):
+        return alcanzables
+    
+    def _crear_evento_opciones(self, alcanzables: list) -> OptionsListed:
+        """Construye el evento de mostrar_opciones (solo si alguien escucha)."""
+        opciones = []
+        for opcion in alcanzables:
             estrella = self.grafo.obtener_estrella(opcion['id'])
             
             if estrella is None:
-                print(f"\n{i}. [ERROR: Estrella ID {opcion['id']} no encontrada]")
+                opciones.append(ReachableOption(
+                    opcion['id'], '', False, False, opcion['distancia'],
+                    opcion['energia_restante'], tuple(opcion['camino']), ''
+                ))
                 continue
             
-            tipo = "⭐ HIPERGIGANTE" if estrella.hipergigante else "🌟 Normal"
-            
-            print(f"\n{i}. {estrella.label} (ID: {opcion['id']}) {tipo}")
-            print(f"   📏 Distancia: {opcion['distancia']:.2f} ly")
-            print(f"   ⚡ Energía necesaria: {opcion['distancia']:.2f}")
-            print(f"   🔋 Energía restante: {opcion['energia_restante']:.2f}")
-            print(f"   🛤️  Camino: {' → '.join(map(str, opcion['camino']))}")
-            
-            # Mostrar efectos de investigación
+            # Efectos de investigación (solo si tiene alguno)
             effects = estrella.get_investigation_effects()
+            descripcion = ''
             if effects['health_impact'] != 0 or effects['life_time_impact'] != 0:
-                print(f"   🔬 Efectos: {effects['description']}")
+                descripcion = effects['description']
             
-            if estrella.hipergigante:
-                print(f"   🎁 Bonus: +50% energía, x2 pasto")
+            opciones.append(ReachableOption(
+                opcion['id'], estrella.label, True, estrella.hipergigante,
+                opcion['distancia'], opcion['energia_restante'],
+                tuple(opcion['camino']), descripcion
+            ))
         
-        return alcanzables
+        estrella_actual = self.obtener_estrella_actual()
+        return OptionsListed(
+            name=self.donkey.name,
+            star_id=self.posicion_actual,
+            star_label=estrella_actual.label,
+            energy=self.donkey.donkey_energy,
+            health=self.donkey.health,
+            grass=self.donkey.grass_in_basement,
+            age=self.donkey.age,
+            max_age=self.donkey.max_age,
+            total_distance=self.distancia_total,
+            options=tuple(opciones)
+        )
     
     def viajar_a(self, destino_id: int, verbose: bool = True) -> bool:
         """
@@ -132,6 +160,7 @@ class SimuladorViaje:
                 'hasta': nueva_posicion,
                 'distancia': distancia,
                 'energia_restante': self.donkey.donkey_energy,
+                'horas_simuladas': self.clock.now,
                 'timestamp': time.time()
             })
         
@@ -149,9 +178,11 @@ class SimuladorViaje:
                 break
         
         if comidos > 0:
-            print(f"🌾 El burro comió {comidos} kg de pasto")
-            print(f"⚡ Energía actual: {self.donkey.donkey_energy:.2f}")
-            print(f"💚 Salud: {self.donkey.health}")
+            if self.events.active:
+                self.events.publish(MealFinished(
+                    comidos, self.donkey.donkey_energy, self.donkey.health,
+                    during_research=False
+                ))
             return True
         
         return False
@@ -172,12 +203,13 @@ class SimuladorViaje:
         if tiempo_investigacion is None:
             tiempo_investigacion = estrella.stay_duration
         
-        print(f"\n🔬 INVESTIGANDO: {estrella.label}")
-        print(f"   ⏱️  Tiempo de investigación: {tiempo_investigacion} horas")
-        
         # Mostrar efectos esperados
-        effects = estrella.get_investigation_effects()
-        print(f"   📊 Efectos: {effects['description']}")
+        if self.events.active:
+            effects = estrella.get_investigation_effects()
+            self.events.publish(InvestigationRequested(
+                self.posicion_actual, estrella.label, tiempo_investigacion,
+                effects['description']
+            ))
         
         # Aplicar investigación
         resultado = self.donkey.stay_of_star(
@@ -199,15 +231,16 @@ class SimuladorViaje:
             'estrella': self.posicion_actual,
             'tiempo': tiempo_investigacion,
             'energia_restante': self.donkey.donkey_energy,
+            'horas_simuladas': self.clock.now,
             'timestamp': time.time()
         })
         
-        if resultado:
-            print(f"   ❌ {resultado}")
-            return False
+        if self.events.active:
+            self.events.publish(InvestigationCompleted(
+                self.posicion_actual, resultado is None, resultado or ''
+            ))
         
-        print(f"   ✅ Investigación completada")
-        return True
+        return resultado is None
     
     def obtener_resumen_viaje(self) -> dict:
         """Genera un resumen del viaje."""
@@ -220,4 +253,5 @@ class SimuladorViaje:
             'pasto_restante': self.donkey.grass_in_basement,
             'historial': self.historial_viaje,
             'vivo': self.donkey.alive,
+            'horas_simuladas': self.clock.now,
         }
\ No newline at end of file
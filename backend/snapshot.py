@@ -0,0 +1,91 @@
+"""
+Instantánea compacta del grafo.
+Responsabilidad: Copia de solo lectura del grafo, serializable con pickle,
+para enviar a procesos de trabajo.
+"""
+
+from typing import Dict, List, Tuple
+from backend.constellation import GrafoConstelaciones
+from backend.star import Estrella
+
+
+class InstantaneaGrafo:
+    """
+    Copia ligera de un GrafoConstelaciones.
+
+    Los Vertex del grafo se referencian entre sí (neighbors usa Vertex como
+    clave), lo que hace costoso y profundo serializarlos. La instantánea
+    guarda la adyacencia como listas de (id_vecino, distancia) y las estrellas
+    por ID, de modo que se puede enviar a un ProcessPoolExecutor una sola vez
+    por proceso.
+
+    Los caminos bloqueados (Req. 0.5) se excluyen de la adyacencia en el
+    momento de tomar la instantánea.
+    """
+
+    def __init__(
+        self,
+        adyacencia: Dict[int, List[Tuple[int, float]]],
+        estrellas: Dict[int, Estrella],
+        constelaciones: Dict[str, List[int]]
+    ):
+        self.adyacencia = adyacencia
+        self.estrellas = estrellas
+        self.constelaciones = constelaciones
+
+    @classmethod
+    def desde_grafo(cls, grafo: GrafoConstelaciones) -> 'InstantaneaGrafo':
+        """Toma una instantánea del estado actual del grafo."""
+        adyacencia = {}
+        for star_id, vertex in grafo.graph.items():
+            adyacencia[star_id] = [
+                (vecino_vertex.id, distancia)
+                for vecino_vertex, distancia in vertex.get_connections().items()
+            ]
+
+        constelaciones = {
+            nombre: list(ids) for nombre, ids in grafo.constelaciones.items()
+        }
+
+        return cls(adyacencia, dict(grafo.estrellas), constelaciones)
+
+    def vecinos(self, star_id: int) -> List[Tuple[int, float]]:
+        """Retorna la lista de (id_vecino, distancia) de una estrella."""
+        return self.adyacencia.get(star_id, [])
+
+    def obtener_estrella(self, star_id: int):
+        """Obtiene los datos de una estrella."""
+        return self.estrellas.get(star_id)
+
+    def a_grafo(self) -> GrafoConstelaciones:
+        """
+        Reconstruye un GrafoConstelaciones equivalente.
+
+        Útil en procesos de trabajo que necesitan ejecutar los algoritmos que
+        esperan un grafo completo. Las estrellas se copian, así que modificar
+        el grafo reconstruido no afecta a la instantánea.
+        """
+        grafo = GrafoConstelaciones()
+
+        for star_id, estrella in self.estrellas.items():
+            grafo.agregar_estrella(
+                id=star_id,
+                label=estrella.label,
+                x=estrella.x,
+                y=estrella.y,
+                radius=estrella.radius,
+                constelaciones=list(estrella.constelaciones),
+                hipergigante=estrella.hipergigante,
+                time_to_eat=estrella.time_to_eat,
+                stay_duration=estrella.stay_duration,
+                amount_of_energy=estrella.amount_of_energy,
+                health_impact=estrella.health_impact,
+                life_time_impact=estrella.life_time_impact,
+                research_energy_cost=estrella.research_energy_cost,
+            )
+
+        for star_id, vecinos in self.adyacencia.items():
+            for vecino_id, distancia in vecinos:
+                grafo.add_edge(star_id, vecino_id, distancia)
+
+        return grafo
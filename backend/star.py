@@ -6,6 +6,12 @@ class Estrella:
     Se integra con Donkey pero NO maneja el grafo.
     """
     
+    __slots__ = (
+        'id', 'label', 'x', 'y', 'radius', 'constelaciones', 'hipergigante',
+        'time_to_eat', 'stay_duration', 'amount_of_energy', 'health_impact',
+        'life_time_impact', 'research_energy_cost', 'visitada', 'activa',
+    )
+    
     def __init__(
         self,
         id: int,
@@ -0,0 +1,390 @@
+"""
+Tabla de estrellas en columnas.
+Responsabilidad: Guardar los atributos de muchas estrellas como arreglos
+NumPy (una columna por atributo) en lugar de un objeto Estrella por estrella.
+
+Un Estrella ocupa ~250 bytes más sus floats, su lista de constelaciones y su
+entrada en el diccionario del grafo; en la tabla una estrella ocupa ~100
+bytes en total. Pensada para catálogos grandes (generación, carga, análisis)
+donde casi nunca se necesita el objeto completo: estrella() lo construye
+bajo demanda.
+
+Disposición:
+- ids: int64[N] ordenado; la fila de una estrella se busca por bisección.
+- Una columna float64[N] por atributo numérico (x, y, radius, ...).
+- hipergigante, visitada, activa: bool[N].
+- Etiquetas: un solo bloque UTF-8 con desplazamientos int64[N+1].
+- Constelaciones (formato CSR): la fila i pertenece a
+  nombres_constelaciones[pertenencia[inicio_pertenencia[i]:inicio_pertenencia[i+1]]].
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from backend.star import Estrella
+
+
+# Columnas numéricas: (atributo de Estrella, clave en data/config.json, valor por defecto).
+# x e y vienen anidadas en 'coordenates'.
+COLUMNAS_NUMERICAS = (
+    ('radius', 'radius', 1.0),
+    ('time_to_eat', 'timeToEat', 1.0),
+    ('stay_duration', 'stayDuration', 5.0),
+    ('amount_of_energy', 'amountOfEnergy', 10.0),
+    ('health_impact', 'healthImpact', 0.0),
+    ('life_time_impact', 'lifeTimeImpact', 0.0),
+    ('research_energy_cost', 'researchEnergyCost', 1.0),
+)
+
+ATRIBUTOS_FLOAT = ('x', 'y') + tuple(atributo for atributo, _, _ in COLUMNAS_NUMERICAS)
+
+
+class TablaEstrellas:
+    """
+    Catálogo de estrellas como estructura de arreglos.
+
+    Ejemplo:
+        tabla = TablaEstrellas.desde_config(json.load(f))
+        fila = tabla.fila(42)
+        energia = tabla.amount_of_energy[fila]
+        estrella = tabla.estrella(42)     # Estrella materializada
+    """
+
+    __slots__ = (
+        'ids', 'x', 'y', 'radius', 'time_to_eat', 'stay_duration',
+        'amount_of_energy', 'health_impact', 'life_time_impact',
+        'research_energy_cost', 'hipergigante', 'visitada', 'activa',
+        'nombres_constelaciones', 'inicio_pertenencia', 'pertenencia',
+        'etiquetas', 'inicio_etiquetas',
+    )
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        columnas: Dict[str, np.ndarray],
+        hipergigante: np.ndarray,
+        etiquetas,
+        inicio_etiquetas: np.ndarray,
+        nombres_constelaciones: Sequence[str],
+        inicio_pertenencia: np.ndarray,
+        pertenencia: np.ndarray
+    ):
+        """
+        Args:
+            ids: IDs de las estrellas, en orden creciente y sin repetir
+            columnas: {atributo de ATRIBUTOS_FLOAT: float64[N]}
+            hipergigante: bool[N]
+            etiquetas: Etiquetas concatenadas en UTF-8 (bytes o uint8[])
+            inicio_etiquetas: Desplazamientos int64[N+1] dentro de etiquetas
+            nombres_constelaciones: Nombre de cada índice de constelación
+            inicio_pertenencia: Desplazamientos int64[N+1] dentro de pertenencia
+            pertenencia: Índices de constelación de cada fila (CSR)
+
+        Los arreglos pueden ser vistas de solo lectura (p. ej. mapeadas desde
+        la caché de utils/graph_cache.py); visitada y activa siempre se crean
+        nuevos.
+        """
+        n = len(ids)
+        if n > 1 and not np.all(ids[1:] > ids[:-1]):
+            raise ValueError("Los IDs deben estar ordenados y sin repetir")
+        faltantes = set(ATRIBUTOS_FLOAT) - set(columnas)
+        if faltantes:
+            raise ValueError(f"Faltan columnas: {sorted(faltantes)}")
+
+        self.ids = ids
+        for atributo in ATRIBUTOS_FLOAT:
+            columna = columnas[atributo]
+            if len(columna) != n:
+                raise ValueError(f"La columna '{atributo}' tiene {len(columna)} filas, se esperaban {n}")
+            setattr(self, atributo, columna)
+        self.hipergigante = hipergigante
+        self.visitada = np.zeros(n, dtype=bool)
+        self.activa = np.ones(n, dtype=bool)
+        self.etiquetas = etiquetas
+        self.inicio_etiquetas = inicio_etiquetas
+        self.nombres_constelaciones = list(nombres_constelaciones)
+        self.inicio_pertenencia = inicio_pertenencia
+        self.pertenencia = pertenencia
+
+    # ------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def desde_config(cls, data: dict) -> 'TablaEstrellas':
+        """
+        Construye la tabla a partir del contenido de data/config.json.
+
+        Sigue las reglas de cargar_grafo_desde_json: una estrella repetida
+        en varias constelaciones conserva los atributos de su primera
+        aparición y acumula las constelaciones.
+        """
+        constructor = ConstructorTablaEstrellas()
+        for constellation in data.get('constellations', []):
+            nombre = constellation.get('name', 'Sin nombre')
+            for star_data in constellation.get('starts', []):  # "starts" (typo del JSON)
+                constructor.agregar_registro(star_data, nombre)
+        return constructor.construir()
+
+    @classmethod
+    def desde_estrellas(cls, estrellas: Iterable[Estrella]) -> 'TablaEstrellas':
+        """Construye la tabla a partir de objetos Estrella (p. ej. grafo.estrellas.values())."""
+        estrellas = list(estrellas)
+        constructor = ConstructorTablaEstrellas()
+        for estrella in estrellas:
+            constructor.agregar_estrella(estrella)
+        tabla = constructor.construir()
+        # Conservar el estado de visita y bloqueo
+        for estrella in estrellas:
+            fila = tabla.fila(estrella.id)
+            tabla.visitada[fila] = estrella.visitada
+            tabla.activa[fila] = estrella.activa
+        return tabla
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, star_id: int) -> bool:
+        return self._buscar(star_id) is not None
+
+    def _buscar(self, star_id: int) -> Optional[int]:
+        fila = int(np.searchsorted(self.ids, star_id))
+        if fila < len(self.ids) and self.ids[fila] == star_id:
+            return fila
+        return None
+
+    def fila(self, star_id: int) -> int:
+        """
+        Retorna la fila de una estrella.
+
+        Raises:
+            KeyError: Si la estrella no está en la tabla
+        """
+        fila = self._buscar(star_id)
+        if fila is None:
+            raise KeyError(star_id)
+        return fila
+
+    def etiqueta(self, fila: int) -> str:
+        """Etiqueta de la estrella en una fila."""
+        inicio = int(self.inicio_etiquetas[fila])
+        fin = int(self.inicio_etiquetas[fila + 1])
+        return bytes(self.etiquetas[inicio:fin]).decode('utf-8')
+
+    def constelaciones_de(self, star_id: int) -> List[str]:
+        """Nombres de las constelaciones a las que pertenece una estrella."""
+        fila = self.fila(star_id)
+        inicio = int(self.inicio_pertenencia[fila])
+        fin = int(self.inicio_pertenencia[fila + 1])
+        return [self.nombres_constelaciones[i] for i in self.pertenencia[inicio:fin]]
+
+    def ids_de_constelacion(self, nombre: str) -> np.ndarray:
+        """IDs (ordenados) de las estrellas de una constelación."""
+        try:
+            indice = self.nombres_constelaciones.index(nombre)
+        except ValueError:
+            return np.empty(0, dtype=np.int64)
+        filas = np.repeat(np.arange(len(self.ids)), np.diff(self.inicio_pertenencia))
+        return self.ids[filas[self.pertenencia == indice]]
+
+    def estrella(self, star_id: int) -> Estrella:
+        """
+        Construye el objeto Estrella de un ID (con su estado de visita y
+        bloqueo). Es una copia: modificarla no cambia la tabla.
+        """
+        fila = self.fila(star_id)
+        estrella = Estrella(
+            id=int(self.ids[fila]),
+            label=self.etiqueta(fila),
+            constelaciones=self.constelaciones_de(star_id),
+            hipergigante=bool(self.hipergigante[fila]),
+            **{atributo: float(getattr(self, atributo)[fila]) for atributo in ATRIBUTOS_FLOAT}
+        )
+        estrella.visitada = bool(self.visitada[fila])
+        estrella.activa = bool(self.activa[fila])
+        return estrella
+
+    def a_estrellas(self) -> Dict[int, Estrella]:
+        """Materializa todas las estrellas como {id: Estrella}."""
+        return {int(star_id): self.estrella(int(star_id)) for star_id in self.ids}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arreglos y las etiquetas."""
+        total = len(self.etiquetas)
+        for atributo in ('ids', 'hipergigante', 'visitada', 'activa', 'inicio_etiquetas',
+                         'inicio_pertenencia', 'pertenencia') + ATRIBUTOS_FLOAT:
+            total += getattr(self, atributo).nbytes
+        return total
+
+
+class ConstructorTablaEstrellas:
+    """
+    Acumula estrellas una por una y construye una TablaEstrellas.
+
+    Guarda las filas en array.array (8 bytes por valor) mientras se agregan,
+    así que nunca existen a la vez N objetos Estrella ni N diccionarios. Las
+    estrellas pueden llegar en cualquier orden y repetirse (una vez por
+    constelación).
+    """
+
+    def __init__(self):
+        self._ids = array('q')
+        self._columnas = {atributo: array('d') for atributo in ATRIBUTOS_FLOAT}
+        self._hipergigante = array('b')
+        self._etiquetas = bytearray()
+        self._inicio_etiquetas = array('q', [0])
+        self._constelacion = array('q')
+        self._nombres: List[str] = []
+        self._indice_nombre: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Filas agregadas (incluye repeticiones)."""
+        return len(self._ids)
+
+    def apariciones(self):
+        """
+        Filas agregadas hasta ahora, en orden de llegada.
+
+        Returns:
+            (ids int64[M], índice de constelación int64[M], -1 = ninguna).
+            Los índices corresponden a nombres_constelaciones de la tabla.
+        """
+        return (np.array(self._ids, dtype=np.int64),
+                np.array(self._constelacion, dtype=np.int64))
+
+    def _indice_constelacion(self, nombre: Optional[str]) -> int:
+        if nombre is None:
+            return -1
+        indice = self._indice_nombre.get(nombre)
+        if indice is None:
+            indice = len(self._nombres)
+            self._indice_nombre[nombre] = indice
+            self._nombres.append(nombre)
+        return indice
+
+    def agregar(
+        self,
+        id: int,
+        label: str = "",
+        constelacion: Optional[str] = None,
+        hipergigante: bool = False,
+        **valores: float
+    ) -> None:
+        """
+        Agrega una fila. Los valores numéricos que falten toman los mismos
+        valores por defecto que Estrella.
+
+        Args:
+            id: ID de la estrella
+            label: Etiqueta (vacía = str(id))
+            constelacion: Constelación de esta aparición (None = ninguna)
+            hipergigante: Si es hipergigante
+            **valores: Atributos de ATRIBUTOS_FLOAT
+        """
+        self._ids.append(id)
+        self._columnas['x'].append(valores.get('x', 0.0))
+        self._columnas['y'].append(valores.get('y', 0.0))
+        for atributo, _, defecto in COLUMNAS_NUMERICAS:
+            self._columnas[atributo].append(valores.get(atributo, defecto))
+        self._hipergigante.append(1 if hipergigante else 0)
+        self._etiquetas += (label if label else str(id)).encode('utf-8')
+        self._inicio_etiquetas.append(len(self._etiquetas))
+        self._constelacion.append(self._indice_constelacion(constelacion))
+
+    def agregar_registro(self, star_data: dict, constelacion: Optional[str]) -> None:
+        """Agrega una estrella con el formato de data/config.json."""
+        coords = star_data.get('coordenates', {})
+        self.agregar(
+            star_data['id'],
+            label=star_data.get('label', str(star_data['id'])),
+            constelacion=constelacion,
+            hipergigante=star_data.get('hypergiant', False),
+            x=coords.get('x', 0),
+            y=coords.get('y', 0),
+            **{atributo: star_data.get(clave, defecto) for atributo, clave, defecto in COLUMNAS_NUMERICAS}
+        )
+
+    def agregar_estrella(self, estrella: Estrella) -> None:
+        """Agrega un objeto Estrella (una fila por cada constelación)."""
+        valores = {atributo: getattr(estrella, atributo) for atributo in ATRIBUTOS_FLOAT}
+        for nombre in estrella.constelaciones or [None]:
+            self.agregar(estrella.id, estrella.label, nombre, estrella.hipergigante, **valores)
+
+    def construir(self) -> TablaEstrellas:
+        """Ordena por ID, fusiona las repeticiones y crea la tabla."""
+        ids = _arreglo(self._ids, np.int64)
+        constelacion = _arreglo(self._constelacion, np.int64)
+        nombres = list(self._nombres)
+
+        if len(ids) < 2 or np.all(ids[1:] > ids[:-1]):
+            # Caso habitual (IDs crecientes y sin repetir): sin reordenar
+            columnas = {
+                atributo: _arreglo(valores, np.float64).copy()
+                for atributo, valores in self._columnas.items()
+            }
+            validos = constelacion >= 0
+            inicio_pertenencia = np.zeros(len(ids) + 1, dtype=np.int64)
+            np.cumsum(validos, out=inicio_pertenencia[1:])
+            return TablaEstrellas(
+                ids.copy(), columnas, _arreglo(self._hipergigante, np.int8).astype(bool),
+                bytes(self._etiquetas), _arreglo(self._inicio_etiquetas, np.int64).copy(),
+                nombres, inicio_pertenencia, constelacion[validos]
+            )
+
+        # Orden estable: la primera aparición de cada ID queda primero
+        orden = np.argsort(ids, kind='stable')
+        ids_ordenados = ids[orden]
+        primera = np.ones(len(ids_ordenados), dtype=bool)
+        primera[1:] = ids_ordenados[1:] != ids_ordenados[:-1]
+        filas_unicas = orden[primera]
+
+        columnas = {
+            atributo: _arreglo(valores, np.float64)[filas_unicas]
+            for atributo, valores in self._columnas.items()
+        }
+        hipergigante = _arreglo(self._hipergigante, np.int8)[filas_unicas].astype(bool)
+
+        # Etiquetas de la primera aparición, en el nuevo orden (sin crear un
+        # objeto bytes por estrella)
+        inicio = _arreglo(self._inicio_etiquetas, np.int64)
+        bloque = np.frombuffer(bytes(self._etiquetas), dtype=np.uint8)
+        longitudes = inicio[filas_unicas + 1] - inicio[filas_unicas]
+        inicio_etiquetas = np.zeros(len(filas_unicas) + 1, dtype=np.int64)
+        np.cumsum(longitudes, out=inicio_etiquetas[1:])
+        posiciones = np.repeat(inicio[filas_unicas] - inicio_etiquetas[:-1], longitudes)
+        posiciones += np.arange(int(inicio_etiquetas[-1]), dtype=np.int64)
+        etiquetas = bloque[posiciones].tobytes()
+
+        # Pertenencia: pares (fila única, constelación) en orden de aparición,
+        # sin repetir y sin "ninguna" (-1)
+        n = len(filas_unicas)
+        grupo = np.cumsum(primera) - 1
+        constelacion = constelacion[orden]
+        validos = constelacion >= 0
+        grupo, constelacion = grupo[validos], constelacion[validos]
+        clave = grupo * max(len(nombres), 1) + constelacion
+        _, primeras = np.unique(clave, return_index=True)
+        primeras.sort()
+        pertenencia = constelacion[primeras]
+        inicio_pertenencia = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grupo[primeras], minlength=n), out=inicio_pertenencia[1:])
+
+        return TablaEstrellas(
+            ids_ordenados[primera], columnas, hipergigante,
+            etiquetas, inicio_etiquetas,
+            nombres, inicio_pertenencia, pertenencia
+        )
+
+
+def _arreglo(valores: array, tipo) -> np.ndarray:
+    """Vista NumPy (sin copia) de un array.array; solo lectura mientras exista."""
+    if not len(valores):
+        return np.empty(0, dtype=tipo)
+    return np.frombuffer(valores, dtype=tipo)
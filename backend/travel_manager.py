@@ -5,6 +5,9 @@ Responsabilidad: Coordinar viajes entre estrellas.
 
 from backend.constellation import GrafoConstelaciones
 from backend.donkey import Donkey
+from backend.events import (
+    TripStarted, LegStarted, LegCompleted, TravelFailed, Arrived, HyperStarBonus
+)
 from algorithms.dijkstra import encontrar_camino_mas_corto
 
 
@@ -15,26 +18,40 @@ class TravelManager:
         self.grafo = grafo
         self.donkey = donkey
     
+    @property
+    def events(self):
+        """Bus de eventos del burro (donde se publica el progreso del viaje)."""
+        return self.donkey.events
+    
     def viajar_a(self, origen: int, destino: int, verbose: bool = True) -> tuple:
         """
         Ejecuta un viaje completo a una estrella destino.
         
         REQUERIMIENTO: Una estrella solo puede ser visitada una única vez.
         
+        Con verbose=True el progreso se publica en self.events (TripStarted,
+        LegStarted, ...); con verbose=False no se publica nada.
+        
         Returns:
             tuple: (exito: bool, nueva_posicion: int, distancia_recorrida: float)
         """
+        events = self.events
+        publicar = verbose and events.active
+        
         if not self.donkey.alive:
-            if verbose:
-                print("❌ El burro está muerto. No puede viajar.")
+            if publicar:
+                events.publish(TravelFailed(origen, destino, "El burro está muerto. No puede viajar."))
             return (False, origen, 0.0)
         
         # REQUERIMIENTO: Verificar que la estrella destino no haya sido visitada
         estrella_destino = self.grafo.obtener_estrella(destino)
         if estrella_destino and estrella_destino.visitada:
-            if verbose:
-                print(f"❌ La estrella {estrella_destino.label} ya fue visitada anteriormente.")
-                print(f"   REQUERIMIENTO: Una estrella solo puede ser visitada una única vez.")
+            if publicar:
+                events.publish(TravelFailed(
+                    origen, destino,
+                    f"La estrella {estrella_destino.label} ya fue visitada anteriormente.",
+                    "REQUERIMIENTO: Una estrella solo puede ser visitada una única vez."
+                ))
             return (False, origen, 0.0)
         
         # Planificar ruta
@@ -46,17 +63,16 @@ class TravelManager:
         )
         
         if not resultado or not resultado['existe']:
-            if verbose:
-                print(f"❌ No hay ruta disponible a la estrella {destino}")
+            if publicar:
+                events.publish(TravelFailed(origen, destino, f"No hay ruta disponible a la estrella {destino}"))
             return (False, origen, 0.0)
         
         # ELIMINADA VALIDACIÓN: Permitir viaje aunque no haya energía suficiente
         # El burro puede morir durante el viaje (Requerimiento 1.2)
         
         # Ejecutar viaje por pasos
-        if verbose:
-            print(f"\n🚀 INICIANDO VIAJE")
-            print(f"{'-'*60}")
+        if publicar:
+            events.publish(TripStarted(origen, destino, tuple(resultado['camino'])))
         
         distancia_total = 0.0
         posicion_actual = origen
@@ -65,9 +81,8 @@ class TravelManager:
             estrella_origen = self.grafo.obtener_estrella(paso['desde'])
             estrella_destino = self.grafo.obtener_estrella(paso['hasta'])
             
-            if verbose:
-                print(f"\n📍 {estrella_origen.label} → {estrella_destino.label}")
-                print(f"   Distancia: {paso['peso']:.2f} ly")
+            if publicar:
+                events.publish(LegStarted(estrella_origen.label, estrella_destino.label, paso['peso']))
             
             # Determinar si viaja entre constelaciones
             es_misma_constelacion = bool(
@@ -87,30 +102,29 @@ class TravelManager:
             )
             
             if resultado_viaje:
-                if verbose:
-                    print(f"   ❌ {resultado_viaje}")
+                if publicar:
+                    events.publish(TravelFailed(origen, destino, resultado_viaje, during_leg=True))
                 return (False, posicion_actual, distancia_total)
             
             # Actualizar posición
             posicion_actual = paso['hasta']
             distancia_total += paso['peso']
             
-            if verbose:
-                print(f"   ⚡ Energía restante: {self.donkey.donkey_energy:.2f}")
-                print(f"   💚 Salud: {self.donkey.health}")
+            if publicar:
+                events.publish(LegCompleted(self.donkey.donkey_energy, self.donkey.health))
         
         # Llegada a la estrella destino
         estrella_destino = self.grafo.obtener_estrella(destino)
         estrella_destino.marcar_visitada()
         
         if verbose:
-            print(f"\n✅ LLEGASTE A: {estrella_destino.label}")
+            if publicar:
+                events.publish(Arrived(destino, estrella_destino.label, estrella_destino.hipergigante))
             
             # Verificar si es hipergigante
             if estrella_destino.hipergigante:
-                print(f"\n⭐ ¡ESTRELLA HIPERGIGANTE!")
                 self.donkey.hyper_star(0)  # Aplicar bonus
-                print(f"   🎁 Energía: {self.donkey.donkey_energy:.2f} (+50%)")
-                print(f"   🌾 Pasto: {self.donkey.grass_in_basement} kg (x2)")
+                if publicar:
+                    events.publish(HyperStarBonus(self.donkey.donkey_energy, self.donkey.grass_in_basement))
         
         return (True, posicion_actual, distancia_total)
@@ -0,0 +1,191 @@
+"""
+Benchmark de memoria de las representaciones compactas.
+Responsabilidad: Medir cuánta memoria ocupan un catálogo sintético de
+estrellas y los estados de una búsqueda en cada representación.
+
+Casos:
+- estrellas_objetos: {id: Estrella}, como GrafoConstelaciones.estrellas
+- estrellas_tabla: TablaEstrellas (estructura de arreglos)
+- estados_dict: estados con __dict__ por instancia (disposición anterior
+  de EstadoBurro / EstadoBurroConPasto)
+- estados_slots: EstadoBurro con __slots__
+
+Cada caso se ejecuta en un proceso nuevo (spawn) para que la memoria
+liberada por un caso no se cuente en el siguiente. Se mide la memoria
+residente (Linux, /proc/self/statm); en otros sistemas se usa tracemalloc,
+que es más lento y añade su propio consumo. La memoria residente incluye
+lo que el asignador retiene tras liberar los temporales de construcción;
+para la tabla se informa además el tamaño exacto de sus arreglos.
+
+Uso:
+    python -m benchmarks.memoria --estrellas 1000000 --estados 10000000
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from algorithms.max_stars_route import EstadoBurro, calcular_salud
+from backend.star import Estrella
+from backend.star_table import ConstructorTablaEstrellas, COLUMNAS_NUMERICAS
+
+
+class _EstadoConDict:
+    """Mismos atributos que EstadoBurro, sin __slots__ (referencia)."""
+
+    def __init__(self, energia: float, edad: float, salud: str, pasto: float):
+        self.energia = energia
+        self.edad = edad
+        self.salud = salud
+        self.pasto = pasto
+
+
+def registros_sinteticos(n: int, constelaciones: int = 100, semilla: int = 0) -> Iterator[Tuple[dict, str]]:
+    """
+    Genera n estrellas con el formato de data/config.json y atributos
+    aleatorios reproducibles.
+
+    Yields:
+        (star_data, nombre de constelación)
+    """
+    rng = random.Random(semilla)
+    for star_id in range(1, n + 1):
+        yield {
+            'id': star_id,
+            'label': f"S{star_id}",
+            'coordenates': {'x': rng.uniform(0, 1000), 'y': rng.uniform(0, 1000)},
+            'radius': rng.uniform(0.1, 1.0),
+            'timeToEat': rng.randint(1, 5),
+            'stayDuration': rng.uniform(5, 20),
+            'amountOfEnergy': rng.randint(1, 10),
+            'healthImpact': rng.uniform(-20, 20),
+            'lifeTimeImpact': rng.uniform(-20, 20),
+            'researchEnergyCost': rng.uniform(0.5, 10),
+            'hypergiant': rng.random() < 0.05,
+        }, f"C{star_id % constelaciones}"
+
+
+def _estrellas_objetos(n: int):
+    estrellas = {}
+    for star_data, nombre in registros_sinteticos(n):
+        coords = star_data['coordenates']
+        estrellas[star_data['id']] = Estrella(
+            id=star_data['id'],
+            label=star_data['label'],
+            x=coords['x'],
+            y=coords['y'],
+            constelaciones=[nombre],
+            hipergigante=star_data['hypergiant'],
+            **{atributo: star_data[clave] for atributo, clave, _ in COLUMNAS_NUMERICAS}
+        )
+    return estrellas
+
+
+def _estrellas_tabla(n: int):
+    constructor = ConstructorTablaEstrellas()
+    for star_data, nombre in registros_sinteticos(n):
+        constructor.agregar_registro(star_data, nombre)
+    return constructor.construir()
+
+
+def _estados(clase) -> Callable[[int], list]:
+    """Crea n estados como los que produce simular_viaje (floats nuevos por estado)."""
+    def crear(n: int) -> list:
+        estados = []
+        for i in range(n):
+            distancia = 1.0 + (i % 97) * 0.01
+            energia = 100.0 - distancia * 0.5
+            estados.append(clase(energia, distancia, calcular_salud(energia), 300))
+        return estados
+    return crear
+
+
+CASOS: Dict[str, Tuple[str, Callable[[int], object]]] = {
+    'estrellas_objetos': ('estrellas', _estrellas_objetos),
+    'estrellas_tabla': ('estrellas', _estrellas_tabla),
+    'estados_dict': ('estados', _estados(_EstadoConDict)),
+    'estados_slots': ('estados', _estados(EstadoBurro)),
+}
+
+
+def _memoria_residente() -> Optional[int]:
+    """Bytes residentes del proceso (None si no hay /proc)."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _medir(caso: str, n: int) -> Dict:
+    """Construye un caso y mide la memoria que retiene (en el proceso hijo)."""
+    crear = CASOS[caso][1]
+    usar_tracemalloc = _memoria_residente() is None
+    if usar_tracemalloc:
+        tracemalloc.start()
+        antes = tracemalloc.get_traced_memory()[0]
+    else:
+        antes = _memoria_residente()
+
+    inicio = time.perf_counter()
+    objeto = crear(n)
+    segundos = time.perf_counter() - inicio
+
+    despues = tracemalloc.get_traced_memory()[0] if usar_tracemalloc else _memoria_residente()
+    return {
+        'caso': caso,
+        'n': n,
+        'bytes': despues - antes,
+        'bytes_arreglos': getattr(objeto, 'nbytes', None),
+        'bytes_por_elemento': (despues - antes) / n if n else 0.0,
+        'segundos': segundos,
+        'metodo': 'tracemalloc' if usar_tracemalloc else 'rss',
+    }
+
+
+def medir_caso(caso: str, n: int) -> Dict:
+    """Mide un caso en un proceso nuevo."""
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as ejecutor:
+        return ejecutor.submit(_medir, caso, n).result()
+
+
+def ejecutar(estrellas: int = 1_000_000, estados: int = 10_000_000, verbose: bool = True) -> Dict[str, Dict]:
+    """
+    Mide todos los casos.
+
+    Args:
+        estrellas: Tamaño del catálogo sintético
+        estados: Número de estados de búsqueda
+        verbose: Si True, imprime la tabla de resultados
+
+    Returns:
+        {caso: resultado de la medición}
+    """
+    tamanos = {'estrellas': estrellas, 'estados': estados}
+    resultados = {}
+    for caso, (tipo, _) in CASOS.items():
+        resultados[caso] = medir_caso(caso, tamanos[tipo])
+        if verbose:
+            r = resultados[caso]
+            arreglos = f"  [arreglos: {r['bytes_arreglos'] / 2**20:.1f} MiB]" if r['bytes_arreglos'] else ""
+            print(f"📏 {caso:<18} n={r['n']:>10,}  {r['bytes'] / 2**20:9.1f} MiB  "
+                  f"{r['bytes_por_elemento']:7.1f} B/elemento  {r['segundos']:6.1f} s  ({r['metodo']}){arreglos}")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria de estrellas y estados de búsqueda")
+    parser.add_argument('--estrellas', type=int, default=1_000_000, help="estrellas del catálogo sintético")
+    parser.add_argument('--estados', type=int, default=10_000_000, help="estados de búsqueda a crear")
+    args = parser.parse_args()
+    ejecutar(args.estrellas, args.estados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Benchmark de rendimiento de los algoritmos y de la carga/guardado.
+Responsabilidad: Medir cada operación sobre catálogos sintéticos de tamaño
+creciente (utils/catalog_generator.py) y compararla con una línea base.
+
+Casos:
+- cargar_grafo_desde_json, save_grafo_to_json
+- dijkstra, bellman_ford, obtener_estrellas_alcanzables
+- encontrar_ruta_maxima_estrellas, encontrar_ruta_optima_con_pasto
+- get_reachable_constellations
+
+Por cada caso y tamaño se informa operaciones por segundo, percentiles de
+duración (p50, p90, p99) y el pico de memoria asignada durante una
+ejecución (tracemalloc, medido aparte para no afectar los tiempos).
+Las búsquedas exhaustivas tienen un tamaño máximo: su costo crece de
+forma exponencial con el catálogo.
+
+Una regresión es un caso cuyo p50 supera el de la línea base en más de la
+tolerancia (y en más de 0.05 ms, para no alarmar por ruido en operaciones
+de microsegundos).
+
+Uso:
+    python -m benchmarks.rendimiento --tamanos 100 1000 10000 --salida resultados.json
+    python -m benchmarks.rendimiento --actualizar-linea-base
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from algorithms.bellman_ford import bellman_ford
+from algorithms.dijkstra import dijkstra, obtener_estrellas_alcanzables
+from algorithms.max_stars_route import encontrar_ruta_maxima_estrellas
+from algorithms.optimal_route_with_grass import encontrar_ruta_optima_con_pasto
+from backend.donkey import Donkey
+from utils.catalog_generator import ParametrosCatalogo, escribir_catalogo
+from utils.config_loader import cargar_grafo_desde_json
+from utils.config_saver import save_grafo_to_json
+from utils.intergalactic import get_reachable_constellations
+
+
+LINEA_BASE = os.path.join(os.path.dirname(__file__), 'linea_base.json')
+TAMANOS = (100, 1000, 10000)
+TOLERANCIA = 0.25
+_UMBRAL_RUIDO_MS = 0.05
+_TAMANO_MAXIMO_EXHAUSTIVA = 1000
+
+
+class Contexto:
+    """Catálogo de un tamaño, ya escrito y cargado, compartido por los casos."""
+
+    def __init__(self, estrellas: int, semilla: int, directorio: str):
+        self.estrellas = estrellas
+        self.ruta = os.path.join(directorio, f"catalogo_{estrellas}.json")
+        self.ruta_guardado = os.path.join(directorio, f"guardado_{estrellas}.json")
+        self.parametros = ParametrosCatalogo(
+            estrellas=estrellas, constelaciones=max(1, estrellas // 100), semilla=semilla
+        )
+        escribir_catalogo(self.ruta, self.parametros, verbose=False)
+        shutil.copyfile(self.ruta, self.ruta_guardado)
+        self.grafo = cargar_grafo_desde_json(self.ruta)
+        self.origen = min(self.grafo.estrellas)
+        self.hipergigante = next(
+            (star_id for star_id, e in self.grafo.estrellas.items() if e.hipergigante), None
+        )
+
+    def burro(self) -> Donkey:
+        ajustes = self.parametros.ajustes
+        return Donkey(
+            name="Burro Científico",
+            age=ajustes['startAge'],
+            max_age=ajustes['deathAge'],
+            donkey_energy=ajustes['burroenergiaInicial'],
+            grass_in_basement=ajustes['pasto'],
+        )
+
+
+# nombre -> (crea la operación a medir, tamaño máximo o None)
+CASOS: Dict[str, Tuple[Callable[[Contexto], Optional[Callable[[], object]]], Optional[int]]] = {
+    'cargar_grafo_desde_json': (lambda c: lambda: cargar_grafo_desde_json(c.ruta), None),
+    'save_grafo_to_json': (lambda c: lambda: save_grafo_to_json(c.grafo, c.ruta_guardado), None),
+    'dijkstra': (lambda c: lambda: dijkstra(c.grafo, c.origen), None),
+    'bellman_ford': (lambda c: lambda: bellman_ford(c.grafo, c.origen), None),
+    'obtener_estrellas_alcanzables': (
+        lambda c: lambda: obtener_estrellas_alcanzables(c.grafo, c.origen, c.parametros.ajustes['burroenergiaInicial']),
+        None,
+    ),
+    'encontrar_ruta_maxima_estrellas': (
+        lambda c: lambda: encontrar_ruta_maxima_estrellas(c.grafo, c.burro(), c.origen),
+        _TAMANO_MAXIMO_EXHAUSTIVA,
+    ),
+    'encontrar_ruta_optima_con_pasto': (
+        lambda c: lambda: encontrar_ruta_optima_con_pasto(c.grafo, c.burro(), c.origen),
+        _TAMANO_MAXIMO_EXHAUSTIVA,
+    ),
+    'get_reachable_constellations': (
+        lambda c: (lambda: get_reachable_constellations(c.grafo, c.hipergigante)) if c.hipergigante else None,
+        None,
+    ),
+}
+
+
+def percentil(ordenados: Sequence[float], p: float) -> float:
+    """Percentil por rango más cercano de una lista ya ordenada."""
+    indice = max(0, min(len(ordenados) - 1, int(-(-p * len(ordenados) // 100)) - 1))
+    return ordenados[indice]
+
+
+def medir(operacion: Callable[[], object], tiempo_minimo: float = 1.0,
+          repeticiones_minimas: int = 5, repeticiones_maximas: int = 1000) -> Dict:
+    """
+    Ejecuta una operación (más una de calentamiento) hasta cumplir el tiempo
+    y las repeticiones mínimas, y luego una vez más bajo tracemalloc.
+    """
+    operacion()
+    duraciones = []
+    inicio = time.perf_counter()
+    while (len(duraciones) < repeticiones_minimas
+           or (time.perf_counter() - inicio < tiempo_minimo and len(duraciones) < repeticiones_maximas)):
+        t = time.perf_counter()
+        operacion()
+        duraciones.append(time.perf_counter() - t)
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    operacion()
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    ordenados = sorted(duraciones)
+    media = sum(duraciones) / len(duraciones)
+    return {
+        'repeticiones': len(duraciones),
+        'ops_por_segundo': 1.0 / media if media > 0 else float('inf'),
+        'media_ms': media * 1000,
+        'p50_ms': percentil(ordenados, 50) * 1000,
+        'p90_ms': percentil(ordenados, 90) * 1000,
+        'p99_ms': percentil(ordenados, 99) * 1000,
+        'pico_bytes': pico,
+    }
+
+
+def ejecutar(
+    tamanos: Sequence[int] = TAMANOS,
+    casos: Optional[Sequence[str]] = None,
+    semilla: int = 0,
+    tiempo_minimo: float = 1.0,
+    verbose: bool = True,
+) -> Dict:
+    """
+    Mide los casos en cada tamaño.
+
+    Returns:
+        {'metadatos': {...}, 'resultados': [{caso, estrellas, ...medir()}]}
+    """
+    nombres = list(casos) if casos else list(CASOS)
+    resultados = []
+    with tempfile.TemporaryDirectory(prefix='benchmark_') as directorio:
+        for estrellas in tamanos:
+            with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                contexto = Contexto(estrellas, semilla, directorio)
+            for nombre in nombres:
+                crear, tamano_maximo = CASOS[nombre]
+                operacion = crear(contexto)
+                if operacion is None or (tamano_maximo is not None and estrellas > tamano_maximo):
+                    continue
+                # Los algoritmos imprimen advertencias: no deben contar en el tiempo de consola
+                with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                    medicion = medir(operacion, tiempo_minimo)
+                resultado = {'caso': nombre, 'estrellas': estrellas, **medicion}
+                resultados.append(resultado)
+                if verbose:
+                    _imprimir(resultado)
+    return {
+        'metadatos': {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'procesador': platform.processor() or platform.machine(),
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'semilla': semilla,
+            'tamanos': list(tamanos),
+        },
+        'resultados': resultados,
+    }
+
+
+def _imprimir(r: Dict) -> None:
+    print(f"⏱️  {r['caso']:<32} n={r['estrellas']:>7,}  {r['ops_por_segundo']:10.1f} ops/s  "
+          f"p50 {r['p50_ms']:9.2f} ms  p90 {r['p90_ms']:9.2f} ms  p99 {r['p99_ms']:9.2f} ms  "
+          f"pico {r['pico_bytes'] / 2**20:8.1f} MiB  ({r['repeticiones']} rep.)")
+
+
+def comparar(actual: Dict, base: Dict, tolerancia: float = TOLERANCIA, verbose: bool = True) -> List[Dict]:
+    """
+    Compara el p50 de cada caso con la línea base.
+
+    Returns:
+        Lista de regresiones: {caso, estrellas, base_ms, actual_ms, cambio}
+    """
+    en_base = {(r['caso'], r['estrellas']): r for r in base['resultados']}
+    regresiones = []
+    for r in actual['resultados']:
+        referencia = en_base.get((r['caso'], r['estrellas']))
+        if referencia is None:
+            continue
+        cambio = r['p50_ms'] / referencia['p50_ms'] - 1 if referencia['p50_ms'] > 0 else 0.0
+        regresion = (cambio > tolerancia and r['p50_ms'] - referencia['p50_ms'] > _UMBRAL_RUIDO_MS)
+        if regresion:
+            regresiones.append({
+                'caso': r['caso'], 'estrellas': r['estrellas'],
+                'base_ms': referencia['p50_ms'], 'actual_ms': r['p50_ms'], 'cambio': cambio,
+            })
+        if verbose:
+            marca = '🔴' if regresion else ('🟢' if cambio < -tolerancia else '⚪')
+            print(f"{marca} {r['caso']:<32} n={r['estrellas']:>7,}  p50 {referencia['p50_ms']:9.2f} → "
+                  f"{r['p50_ms']:9.2f} ms  ({cambio:+.0%})")
+    return regresiones
+
+
+def guardar(resultados: Dict, ruta: str) -> None:
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de algoritmos y carga sobre catálogos sintéticos")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=list(TAMANOS), help="estrellas por catálogo")
+    parser.add_argument('--casos', nargs='+', choices=list(CASOS), help="casos a medir (todos por defecto)")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--tiempo-minimo', type=float, default=1.0, help="segundos mínimos por caso")
+    parser.add_argument('--salida', help="archivo JSON para los resultados")
+    parser.add_argument('--linea-base', default=LINEA_BASE, help="resultados de referencia")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA, help="aumento del p50 tolerado (0.25 = 25%%)")
+    parser.add_argument('--actualizar-linea-base', action='store_true', help="guarda estos resultados como línea base")
+    args = parser.parse_args()
+
+    resultados = ejecutar(args.tamanos, args.casos, args.semilla, args.tiempo_minimo)
+    if args.salida:
+        guardar(resultados, args.salida)
+        print(f"💾 Resultados guardados en {args.salida}")
+
+    if args.actualizar_linea_base:
+        guardar(resultados, args.linea_base)
+        print(f"💾 Línea base actualizada: {args.linea_base}")
+        return
+
+    if os.path.exists(args.linea_base):
+        with open(args.linea_base, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        print(f"\n📐 Comparación con {args.linea_base} (tolerancia {args.tolerancia:.0%})")
+        regresiones = comparar(resultados, base, args.tolerancia)
+        if regresiones:
+            print(f"❌ {len(regresiones)} regresión(es)")
+            sys.exit(1)
+        print("✅ Sin regresiones")
+
+
+if __name__ == "__main__":
+    main()
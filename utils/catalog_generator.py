@@ -0,0 +1,285 @@
+"""
+Generador de catálogos sintéticos.
+Responsabilidad: Producir catálogos con el formato de data/config.json y el
+tamaño que haga falta para medir cómo escalan los algoritmos.
+
+- generar_registros(): (star_data, nombre de constelación) en orden de archivo
+- escribir_catalogo(): escribe el JSON por partes, sin tenerlo en memoria
+  (millones de estrellas)
+- generar_grafo(): GrafoConstelaciones en memoria, igual al que se obtiene
+  cargando el archivo escrito
+
+Cada constelación es un cúmulo alrededor de su centro con ids
+consecutivos; sus enlaces van a estrellas de la misma constelación salvo
+una fracción de puentes hacia otras. Una proporción de estrellas aparece
+también en la constelación siguiente (estrellas compartidas, resaltadas en
+rojo por la interfaz). Los valores siguen los rangos de data/config.json.
+
+La salida es reproducible: cada constelación usa su propio generador
+sembrado con (semilla, índice), así que el mismo ParametrosCatalogo
+produce el mismo archivo byte a byte.
+
+Uso:
+    python -m utils.catalog_generator --estrellas 1000000 --constelaciones 500 data/grande.json
+"""
+
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from backend.constellation import GrafoConstelaciones
+from utils.graph_cache import GrafoCompilado
+
+
+# Claves del burro, como en data/config.json
+AJUSTES_POR_DEFECTO: Dict = {
+    'burroenergiaInicial': 100,
+    'estadoSalud': 'Excelente',
+    'pasto': 300,
+    'number': 123,
+    'startAge': 12,
+    'deathAge': 500,
+}
+
+_ESTRELLAS_POR_ESCRITURA = 1000
+
+
+@dataclass(frozen=True)
+class ParametrosCatalogo:
+    """
+    Forma del catálogo a generar.
+
+    grado es el número medio de enlaces salientes por estrella (Poisson,
+    al menos 1); densidad_puentes, la fracción de esos enlaces que van a
+    otra constelación.
+    """
+    estrellas: int = 1000
+    constelaciones: int = 10
+    grado: float = 3.0
+    densidad_puentes: float = 0.05
+    proporcion_hipergigantes: float = 0.05
+    proporcion_compartidas: float = 0.01
+    semilla: int = 0
+    extension: float = 100.0  # Lado del plano, en unidades de mundo
+    ajustes: Dict = field(default_factory=lambda: dict(AJUSTES_POR_DEFECTO))
+
+    def __post_init__(self):
+        if self.constelaciones < 1:
+            raise ValueError("Se necesita al menos una constelación")
+        if self.estrellas < self.constelaciones:
+            raise ValueError("Debe haber al menos una estrella por constelación")
+
+    def limites(self) -> np.ndarray:
+        """Primer id de cada constelación (más el id siguiente al último)."""
+        return 1 + np.arange(self.constelaciones + 1, dtype=np.int64) * self.estrellas // self.constelaciones
+
+    def centros(self) -> np.ndarray:
+        """Centro (x, y) de cada constelación."""
+        rng = np.random.default_rng([self.semilla, self.constelaciones])
+        return rng.uniform(0, self.extension, (self.constelaciones, 2))
+
+
+def nombre_constelacion(indice: int) -> str:
+    return f"Constelación {indice + 1}"
+
+
+def _bloque(p: ParametrosCatalogo, k: int, limites: np.ndarray, centros: np.ndarray) -> List[Dict]:
+    """Estrellas propias de la constelación k, con sus enlaces."""
+    inicio, fin = int(limites[k]), int(limites[k + 1])
+    n = fin - inicio
+    c = p.constelaciones
+    rng = np.random.default_rng([p.semilla, k])
+
+    dispersion = p.extension / (4 * np.sqrt(c))
+    x = np.clip(rng.normal(centros[k, 0], dispersion, n), 0, p.extension).round(1)
+    y = np.clip(rng.normal(centros[k, 1], dispersion, n), 0, p.extension).round(1)
+    radius = rng.uniform(0.1, 1.0, n).round(1)
+    time_to_eat = rng.integers(1, 6, n)
+    stay_duration = rng.uniform(5, 20, n).round(1)
+    amount_of_energy = rng.integers(1, 11, n)
+    health_impact = rng.uniform(-20, 20, n).round(1)
+    life_time_impact = rng.integers(-20, 21, n)
+    research_energy_cost = rng.uniform(0.5, 10, n).round(1)
+    hipergigante = rng.random(n) < p.proporcion_hipergigantes
+
+    # Enlaces: por estrella, max(1, Poisson(grado)) destinos
+    if n == 1 and c == 1:
+        grados = np.zeros(1, dtype=np.int64)
+    else:
+        grados = np.maximum(1, rng.poisson(p.grado, n))
+    total = int(grados.sum())
+    origen = np.repeat(np.arange(n), grados)
+
+    # Dentro de la constelación: cualquier otra estrella del bloque
+    r = rng.integers(0, max(n - 1, 1), total)
+    destino = inicio + r + (r >= origen)
+    dx = x[origen] - x[np.minimum(destino - inicio, n - 1)]
+    dy = y[origen] - y[np.minimum(destino - inicio, n - 1)]
+    distancia = np.hypot(dx, dy)
+
+    if c > 1:
+        # Puentes: estrella al azar de otra constelación; la distancia es
+        # la que hay hasta el centro de esa constelación
+        puente = rng.random(total) < p.densidad_puentes
+        if n == 1:
+            puente[:] = True
+        otra = (k + 1 + rng.integers(0, c - 1, total)) % c
+        tamano_otra = limites[otra + 1] - limites[otra]
+        destino_puente = limites[otra] + (rng.random(total) * tamano_otra).astype(np.int64)
+        distancia_puente = np.hypot(x[origen] - centros[otra, 0], y[origen] - centros[otra, 1])
+        destino = np.where(puente, destino_puente, destino)
+        distancia = np.where(puente, distancia_puente, distancia)
+
+    distancia = np.maximum(1, np.rint(distancia)).astype(np.int64)
+
+    destino = destino.tolist()
+    distancia = distancia.tolist()
+    fin_enlaces = np.cumsum(grados).tolist()
+    x, y = x.tolist(), y.tolist()
+    radius, stay_duration = radius.tolist(), stay_duration.tolist()
+    time_to_eat, amount_of_energy = time_to_eat.tolist(), amount_of_energy.tolist()
+    health_impact, life_time_impact = health_impact.tolist(), life_time_impact.tolist()
+    research_energy_cost, hipergigante = research_energy_cost.tolist(), hipergigante.tolist()
+
+    estrellas = []
+    a = 0
+    for i in range(n):
+        star_id = inicio + i
+        enlaces = []
+        vistos = set()
+        for j in range(a, fin_enlaces[i]):
+            if destino[j] not in vistos:
+                vistos.add(destino[j])
+                enlaces.append({'starId': destino[j], 'distance': distancia[j]})
+        a = fin_enlaces[i]
+        estrellas.append({
+            'id': star_id,
+            'label': f"S{star_id}",
+            'linkedTo': enlaces,
+            'radius': radius[i],
+            'timeToEat': time_to_eat[i],
+            'stayDuration': stay_duration[i],
+            'amountOfEnergy': amount_of_energy[i],
+            'healthImpact': health_impact[i],
+            'lifeTimeImpact': life_time_impact[i],
+            'researchEnergyCost': research_energy_cost[i],
+            'coordenates': {'x': x[i], 'y': y[i]},
+            'hypergiant': hipergigante[i],
+        })
+    return estrellas
+
+
+def generar_registros(p: ParametrosCatalogo) -> Iterator[Tuple[dict, str]]:
+    """
+    Recorre el catálogo en el orden del archivo, una constelación a la vez.
+
+    Yields:
+        (star_data, nombre de constelación). Las estrellas compartidas
+        aparecen al final de la constelación siguiente, sin enlaces propios.
+    """
+    limites = p.limites()
+    centros = p.centros()
+    compartidas: List[dict] = []
+    for k in range(p.constelaciones):
+        nombre = nombre_constelacion(k)
+        estrellas = _bloque(p, k, limites, centros)
+        for star_data in estrellas:
+            yield star_data, nombre
+        for star_data in compartidas:
+            yield dict(star_data, linkedTo=[]), nombre
+
+        compartidas = []
+        if k + 1 < p.constelaciones and p.proporcion_compartidas > 0:
+            rng = np.random.default_rng([p.semilla, k, 1])
+            elegidas = np.flatnonzero(rng.random(len(estrellas)) < p.proporcion_compartidas)
+            compartidas = [estrellas[i] for i in elegidas.tolist()]
+
+
+def escribir_catalogo(ruta: str, p: ParametrosCatalogo, verbose: bool = True) -> Dict:
+    """
+    Escribe el catálogo en ruta por partes (memoria acotada a una
+    constelación). Los ajustes del burro van antes de 'constellations'
+    para que leer_ajustes no tenga que recorrer las estrellas.
+
+    Returns:
+        Resumen: estrellas, apariciones, enlaces, bytes y segundos
+    """
+    inicio = time.perf_counter()
+    apariciones = enlaces = 0
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for clave, valor in p.ajustes.items():
+            f.write(f"{json.dumps(clave)}: {json.dumps(valor, ensure_ascii=False)}, ")
+        f.write('"constellations": [')
+
+        actual = None
+        partes: List[str] = []
+        for star_data, nombre in generar_registros(p):
+            if nombre != actual:
+                partes.append(('' if actual is None else ']}, ')
+                              + '{"name": ' + json.dumps(nombre, ensure_ascii=False) + ', "starts": [')
+                actual = nombre
+            else:
+                partes.append(', ')
+            partes.append(json.dumps(star_data))
+            apariciones += 1
+            enlaces += len(star_data['linkedTo'])
+            if len(partes) >= 2 * _ESTRELLAS_POR_ESCRITURA:
+                f.write(''.join(partes))
+                partes = []
+        partes.append(']}]}\n' if actual is not None else ']}\n')
+        f.write(''.join(partes))
+    os.replace(temporal, ruta)
+
+    resumen = {
+        'estrellas': p.estrellas,
+        'apariciones': apariciones,
+        'enlaces': enlaces,
+        'bytes': os.path.getsize(ruta),
+        'segundos': time.perf_counter() - inicio,
+    }
+    if verbose:
+        print(f"🌌 Catálogo sintético: {resumen['estrellas']:,} estrellas, "
+              f"{p.constelaciones:,} constelaciones, {enlaces:,} enlaces, "
+              f"{resumen['bytes'] / 2**20:.1f} MiB en {resumen['segundos']:.1f} s → {ruta}")
+    return resumen
+
+
+def generar_grafo(p: ParametrosCatalogo) -> GrafoConstelaciones:
+    """
+    Construye el catálogo directamente en memoria. Equivale a escribirlo y
+    cargarlo con cargar_grafo_desde_json, sin pasar por el disco.
+    """
+    return GrafoCompilado.desde_registros(generar_registros(p), verbose=False).a_grafo()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera un catálogo sintético con el formato de data/config.json")
+    parser.add_argument('salida', help="archivo JSON a escribir")
+    parser.add_argument('--estrellas', type=int, default=1000)
+    parser.add_argument('--constelaciones', type=int, default=10)
+    parser.add_argument('--grado', type=float, default=3.0, help="enlaces salientes medios por estrella")
+    parser.add_argument('--puentes', type=float, default=0.05, help="fracción de enlaces hacia otra constelación")
+    parser.add_argument('--hipergigantes', type=float, default=0.05, help="proporción de hipergigantes")
+    parser.add_argument('--compartidas', type=float, default=0.01, help="proporción de estrellas en dos constelaciones")
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+    escribir_catalogo(args.salida, ParametrosCatalogo(
+        estrellas=args.estrellas,
+        constelaciones=args.constelaciones,
+        grado=args.grado,
+        densidad_puentes=args.puentes,
+        proporcion_hipergigantes=args.hipergigantes,
+        proporcion_compartidas=args.compartidas,
+        semilla=args.semilla,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,44 @@ Responsabilidad: Cargar datos desde JSON.
 """
 
 import json
+from collections import deque
+from typing import Deque, Dict, List, Tuple
 from backend.constellation import GrafoConstelaciones
 from backend.donkey import Donkey
+from utils.config_saver import aplicar_diario
+from utils.graph_cache import cargar_grafo_con_cache
+from utils.json_stream import iterar_estrellas, leer_ajustes
+from utils.sharded_catalog import cargar_catalogo_fragmentado, es_catalogo_fragmentado, leer_manifiesto
 
 
-def cargar_grafo_desde_json(ruta: str = "data/config.json") -> GrafoConstelaciones:
+def cargar_grafo_desde_json(ruta: str = "data/config.json", usar_cache: bool = False) -> GrafoConstelaciones:
     """
     Carga un grafo de constelaciones desde un archivo JSON.
+    Aplica además las ediciones del diario que aún no se compactaron en el
+    JSON (utils/config_saver.py).
+    
+    Si la ruta es un catálogo fragmentado (utils/sharded_catalog.py)
+    retorna un GrafoFragmentado que carga las constelaciones a demanda; las
+    ediciones de su diario se aplican al cargar cada constelación.
     
     Args:
-        ruta: Ruta al archivo JSON
+        ruta: Ruta al archivo JSON (o al directorio del catálogo fragmentado)
+        usar_cache: Si True, usa la caché binaria junto al JSON
+                    (utils/graph_cache.py) y la reconstruye si está vieja
         
     Returns:
         GrafoConstelaciones con estrellas y conexiones
     """
+    if es_catalogo_fragmentado(ruta):
+        grafo = cargar_catalogo_fragmentado(ruta)
+        aplicar_diario(grafo, ruta)
+        return grafo
+    
+    if usar_cache:
+        grafo = cargar_grafo_con_cache(ruta)
+        aplicar_diario(grafo, ruta)
+        return grafo
+    
     with open(ruta, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
@@ -60,6 +84,89 @@ def cargar_grafo_desde_json(ruta: str = "data/config.json") -> GrafoConstelacion
                 else:
                     print(f"⚠️  Advertencia: Estrella {target_id} no existe, omitiendo conexión desde {star_id}")
     
+    aplicar_diario(grafo, ruta)
+    return grafo
+
+
+def cargar_grafo_incremental(ruta: str = "data/config.json") -> GrafoConstelaciones:
+    """
+    Carga el grafo en una sola pasada, sin tener el JSON completo en memoria
+    (utils/json_stream.py). Pensado para catálogos muy grandes.
+    
+    Produce el mismo grafo que cargar_grafo_desde_json. Un enlace hacia una
+    estrella que todavía no apareció queda en espera hasta que aparece; los
+    siguientes enlaces de la misma estrella origen esperan detrás de él, así
+    que cada vértice recibe sus vecinos en el mismo orden que con la carga
+    en dos pasadas (el orden decide los desempates de las búsquedas).
+    
+    Args:
+        ruta: Ruta al archivo JSON
+        
+    Returns:
+        GrafoConstelaciones con estrellas y conexiones
+    """
+    grafo = GrafoConstelaciones()
+    # origen -> enlaces (destino, distancia) en espera, en orden del archivo
+    en_espera: Dict[int, Deque[Tuple[int, float]]] = {}
+    # destino aún desconocido -> orígenes cuya cola está detenida en él
+    bloqueados_por: Dict[int, List[int]] = {}
+    
+    def avanzar_cola(origen: int, al_final: bool = False) -> None:
+        """Agrega los enlaces en espera de un origen hasta el primer destino desconocido."""
+        cola = en_espera[origen]
+        while cola:
+            destino, distancia = cola[0]
+            if grafo.obtener_estrella(destino) is not None:
+                grafo.add_edge(origen, destino, distancia)
+            elif al_final:
+                print(f"⚠️  Advertencia: Estrella {destino} no existe, omitiendo conexión desde {origen}")
+            else:
+                bloqueados_por.setdefault(destino, []).append(origen)
+                return
+            cola.popleft()
+        del en_espera[origen]
+    
+    for star_data, constellation_name in iterar_estrellas(ruta):
+        star_id = star_data['id']
+        nueva = grafo.obtener_estrella(star_id) is None
+        coords = star_data.get('coordenates', {})
+        grafo.agregar_estrella(
+            id=star_id,
+            label=star_data.get('label', str(star_id)),
+            x=coords.get('x', 0),
+            y=coords.get('y', 0),
+            radius=star_data.get('radius', 1.0),
+            constelaciones=[constellation_name],
+            hipergigante=star_data.get('hypergiant', False),
+            time_to_eat=star_data.get('timeToEat', 1.0),
+            stay_duration=star_data.get('stayDuration', 5.0),
+            amount_of_energy=star_data.get('amountOfEnergy', 10.0),
+            health_impact=star_data.get('healthImpact', 0.0),
+            life_time_impact=star_data.get('lifeTimeImpact', 0.0),
+            research_energy_cost=star_data.get('researchEnergyCost', 1.0),
+        )
+        
+        # Enlaces propios: directos mientras no haya nada en espera
+        for link in star_data.get('linkedTo', []):
+            enlace = (link['starId'], link.get('distance', 1.0))
+            if star_id in en_espera:
+                en_espera[star_id].append(enlace)
+            elif grafo.obtener_estrella(enlace[0]) is not None:
+                grafo.add_edge(star_id, *enlace)
+            else:
+                en_espera[star_id] = deque([enlace])
+                bloqueados_por.setdefault(enlace[0], []).append(star_id)
+        
+        # Enlaces de otras estrellas que esperaban a esta
+        if nueva and star_id in bloqueados_por:
+            for origen in bloqueados_por.pop(star_id):
+                avanzar_cola(origen)
+    
+    # Los destinos que nunca aparecieron se omiten (como en la carga normal)
+    for origen in list(en_espera):
+        avanzar_cola(origen, al_final=True)
+    
+    aplicar_diario(grafo, ruta)
     return grafo
 
 
@@ -67,14 +174,20 @@ def crear_burro_desde_json(ruta: str = "data/config.json") -> Donkey:
     """
     Crea un burro desde un archivo JSON.
     
+    Solo lee las claves del burro: las constelaciones se saltan sin
+    construirlas (utils/json_stream.py). En un catálogo fragmentado se
+    leen del manifiesto.
+    
     Args:
-        ruta: Ruta al archivo JSON
+        ruta: Ruta al archivo JSON (o al directorio del catálogo fragmentado)
         
     Returns:
         Donkey con configuración inicial
     """
-    with open(ruta, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if es_catalogo_fragmentado(ruta):
+        data = leer_manifiesto(ruta)['ajustes']
+    else:
+        data = leer_ajustes(ruta, ('startAge', 'deathAge', 'burroenergiaInicial', 'pasto'))
     
     return Donkey(
         name="Burro Científico",
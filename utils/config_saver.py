@@ -1,38 +1,294 @@
 """
 Utilidad para guardar configuración editada al JSON
+Responsabilidad: Persistir las ediciones de estrellas en data/config.json.
+
+- save_grafo_to_json(): guardado completo (todas las estrellas)
+- GuardadorConfiguracion: guardado incremental, solo de las estrellas
+  editadas (GrafoConstelaciones.estrellas_modificadas), opcionalmente a un
+  diario de ediciones que se compacta en el JSON cada cierto número de
+  entradas
+- aplicar_diario(): aplica al grafo las ediciones del diario que todavía
+  no se compactaron (lo usan los cargadores de utils/config_loader.py)
+
+El JSON siempre se reescribe de forma atómica (archivo temporal + rename):
+un corte a mitad de escritura deja el archivo anterior intacto.
+
+El diario (<ruta>.diario) tiene una línea JSON por estrella guardada:
+    {"id": 5, "campos": {"amountOfEnergy": 3, "healthImpact": -0.5}}
+Los valores son absolutos, así que aplicar dos veces una entrada no cambia
+el resultado; una última línea cortada (corte durante el append) se ignora.
+
+Con un catálogo fragmentado (utils/sharded_catalog.py) la ruta es el
+directorio: el diario va dentro (ediciones.diario) y compactar reescribe
+solo los archivos de las constelaciones propias de las estrellas editadas.
 """
 import json
+import os
+import tempfile
 from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from utils.sharded_catalog import GrafoFragmentado, archivos_propios, es_catalogo_fragmentado
+
+
+# atributo de Estrella -> clave en data/config.json
+CAMPOS_EDITABLES: Dict[str, str] = {
+    'amount_of_energy': 'amountOfEnergy',
+    'time_to_eat': 'timeToEat',
+    'stay_duration': 'stayDuration',
+    'health_impact': 'healthImpact',
+    'life_time_impact': 'lifeTimeImpact',
+}
+
+EXTENSION_DIARIO = '.diario'
+DIARIO_FRAGMENTADO = 'ediciones' + EXTENSION_DIARIO
+COMPACTAR_CADA = 200
+
+
+def ruta_diario(ruta: str) -> str:
+    """Ruta del diario de ediciones de un catálogo (dentro del directorio si está fragmentado)."""
+    if es_catalogo_fragmentado(ruta):
+        return os.path.join(ruta, DIARIO_FRAGMENTADO)
+    return ruta + EXTENSION_DIARIO
+
+
+def _campos_estrella(estrella) -> Dict:
+    """Campos editables de una estrella, con las claves del JSON."""
+    return {clave: getattr(estrella, atributo) for atributo, clave in CAMPOS_EDITABLES.items()}
+
+
+def _escribir_json_atomico(data: Dict, ruta: str, indent: Optional[int] = 2) -> None:
+    """Escribe el JSON en un temporal del mismo directorio y lo renombra."""
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(prefix=Path(ruta).name + '.', suffix='.tmp', dir=directorio)
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(ruta):
+            os.chmod(temporal, os.stat(ruta).st_mode & 0o7777)  # mkstemp crea con 0600
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+def _actualizar_fragmentos(directorio: str, cambios: Dict[int, Dict]) -> None:
+    """Aplica {id: campos} en los archivos de constelación que guardan esas estrellas."""
+    for archivo, ids in archivos_propios(directorio, cambios).items():
+        with open(archivo, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        ids = set(ids)
+        for star_data in data['starts']:
+            if star_data['id'] in ids:
+                star_data.update(cambios[star_data['id']])
+        # Compacto, como los escribe exportar_catalogo_fragmentado
+        _escribir_json_atomico(data, archivo, indent=None)
+
+
+def _actualizar_json(ruta: str, cambios: Dict[int, Dict]) -> None:
+    """Aplica {id: campos} a todas las apariciones de esas estrellas en el JSON."""
+    if es_catalogo_fragmentado(ruta):
+        _actualizar_fragmentos(ruta, cambios)
+        return
+
+    # Leer el JSON actual para preservar otros campos
+    with open(ruta, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    for constellation in data['constellations']:
+        for star_data in constellation['starts']:
+            campos = cambios.get(star_data['id'])
+            if campos:
+                star_data.update(campos)
+
+    _escribir_json_atomico(data, ruta)
+
+
+def leer_diario(ruta: str) -> Dict[int, Dict]:
+    """
+    Lee el diario de ediciones de un catálogo.
+
+    Returns:
+        {id: campos}, con la última edición de cada campo ({} si no hay diario)
+    """
+    cambios: Dict[int, Dict] = {}
+    try:
+        f = open(ruta_diario(ruta), 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return cambios
+    with f:
+        for linea in f:
+            try:
+                entrada = json.loads(linea)
+            except json.JSONDecodeError:
+                continue  # Línea cortada por un corte durante el append
+            cambios.setdefault(entrada['id'], {}).update(entrada['campos'])
+    return cambios
+
+
+def aplicar_diario(grafo, ruta: str = "data/config.json") -> int:
+    """
+    Aplica al grafo las ediciones del diario que aún no están en el JSON.
+    No marca las estrellas como modificadas: ya están guardadas.
+
+    En un GrafoFragmentado no carga constelaciones: las ediciones quedan
+    registradas y se aplican cuando se carga cada constelación.
+
+    Returns:
+        Número de estrellas actualizadas (en un GrafoFragmentado, solo las
+        ya cargadas)
+    """
+    atributos = {clave: atributo for atributo, clave in CAMPOS_EDITABLES.items()}
+    cambios = leer_diario(ruta)
+    fragmentado = isinstance(grafo, GrafoFragmentado)
+    if fragmentado:
+        grafo.registrar_ediciones(cambios)
+    aplicadas = 0
+    for star_id, campos in cambios.items():
+        estrella = grafo.estrellas.get(star_id) if fragmentado else grafo.obtener_estrella(star_id)
+        if estrella is None:
+            continue
+        for clave, valor in campos.items():
+            setattr(estrella, atributos[clave], valor)
+        aplicadas += 1
+    return aplicadas
 
 
 def save_grafo_to_json(grafo, ruta="data/config.json"):
     """
     Guarda el estado actual del grafo al archivo JSON.
-    
+
+    Escribe todas las estrellas, así que también incorpora (y elimina) el
+    diario de ediciones pendiente.
+
     Args:
         grafo: GrafoConstelaciones con los datos actualizados
-        ruta: Ruta al archivo JSON
+        ruta: Ruta al archivo JSON (o al directorio del catálogo fragmentado)
     """
-    # Leer el JSON actual para preservar otros campos
+    if es_catalogo_fragmentado(ruta):
+        # Solo las estrellas cargadas pueden haberse editado: el resto se
+        # queda como está en los archivos más el diario
+        cambios = leer_diario(ruta)
+        for star_id, estrella in grafo.estrellas.items():
+            cambios[star_id] = _campos_estrella(estrella)
+        _actualizar_fragmentos(ruta, cambios)
+        if os.path.exists(ruta_diario(ruta)):
+            os.remove(ruta_diario(ruta))
+        grafo.estrellas_modificadas.clear()
+        return True
+
     with open(ruta, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
+
     # Actualizar solo las estrellas
     for constellation in data['constellations']:
         for star_data in constellation['starts']:
-            star_id = star_data['id']
-            estrella = grafo.obtener_estrella(star_id)
-            
+            estrella = grafo.obtener_estrella(star_data['id'])
             if estrella:
-                # Actualizar campos editables
-                star_data['amountOfEnergy'] = estrella.amount_of_energy
-                star_data['timeToEat'] = estrella.time_to_eat
-                star_data['stayDuration'] = estrella.stay_duration
-                star_data['healthImpact'] = estrella.health_impact
-                star_data['lifeTimeImpact'] = estrella.life_time_impact
-    
-    # Guardar con formato bonito
-    with open(ruta, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+                star_data.update(_campos_estrella(estrella))
+
+    _escribir_json_atomico(data, ruta)
+    if os.path.exists(ruta_diario(ruta)):
+        os.remove(ruta_diario(ruta))
+    grafo.estrellas_modificadas.clear()
+
     return True
+
+
+class GuardadorConfiguracion:
+    """
+    Guardado incremental de las estrellas editadas.
+
+    Con usar_diario=True cada guardado solo agrega al diario las estrellas
+    modificadas (costo proporcional a las ediciones, no al catálogo); cada
+    `compactar_cada` entradas el diario se incorpora al JSON. Sin diario,
+    cada guardado reescribe el JSON actualizando solo esas estrellas.
+    """
+
+    def __init__(
+        self,
+        grafo,
+        ruta: str = "data/config.json",
+        usar_diario: bool = True,
+        compactar_cada: int = COMPACTAR_CADA,
+    ):
+        self.grafo = grafo
+        self.ruta = ruta
+        self.usar_diario = usar_diario
+        self.compactar_cada = compactar_cada
+        self.entradas_diario = self._contar_entradas()
+
+    def _contar_entradas(self) -> int:
+        try:
+            with open(ruta_diario(self.ruta), 'rb') as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
+
+    def _cambios(self, ids: Iterable[int]) -> Dict[int, Dict]:
+        cambios = {}
+        for star_id in ids:
+            estrella = self.grafo.obtener_estrella(star_id)
+            if estrella is not None:
+                cambios[star_id] = _campos_estrella(estrella)
+        return cambios
+
+    def guardar(self, ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Guarda las estrellas modificadas.
+
+        Args:
+            ids: Estrellas a guardar (None = grafo.estrellas_modificadas)
+
+        Returns:
+            Número de estrellas escritas
+        """
+        ids = set(self.grafo.estrellas_modificadas if ids is None else ids)
+        cambios = self._cambios(sorted(ids))
+        if not cambios:
+            return 0
+
+        if self.usar_diario:
+            lineas = ''.join(
+                json.dumps({'id': star_id, 'campos': campos}, ensure_ascii=False) + '\n'
+                for star_id, campos in cambios.items()
+            ).encode('utf-8')
+            with open(ruta_diario(self.ruta), 'a+b') as f:
+                # Tras una línea cortada, empezar en una línea nueva
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        lineas = b'\n' + lineas
+                f.write(lineas)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entradas_diario += len(cambios)
+            if isinstance(self.grafo, GrafoFragmentado):
+                # Que recargar una constelación no deshaga lo ya guardado
+                self.grafo.registrar_ediciones(cambios)
+        else:
+            _actualizar_json(self.ruta, cambios)
+
+        self.grafo.estrellas_modificadas -= ids
+        if self.usar_diario and self.entradas_diario >= self.compactar_cada:
+            self.compactar()
+        return len(cambios)
+
+    def compactar(self) -> bool:
+        """
+        Incorpora el diario al JSON y lo elimina.
+
+        Returns:
+            True si había ediciones que compactar
+        """
+        cambios = leer_diario(self.ruta)
+        if cambios:
+            _actualizar_json(self.ruta, cambios)
+        diario = ruta_diario(self.ruta)
+        if os.path.exists(diario):
+            os.remove(diario)
+        self.entradas_diario = 0
+        return bool(cambios)
@@ -0,0 +1,447 @@
+"""
+Caché binaria del grafo.
+Responsabilidad: Guardar junto a data/config.json el grafo ya procesado
+(columnas de estrellas, adyacencia CSR y pertenencia a constelaciones) en
+un archivo binario versionado, y cargarlo con memory-mapping.
+
+El archivo se identifica por la huella del config: si cambian su fecha de
+modificación o su tamaño se compara el SHA-256 del contenido, y si no
+coincide la caché se reconstruye sola.
+
+Formato (todas las cifras en little-endian):
+    MAGIA (8 bytes) | versión uint32 | longitud de metadatos uint32 |
+    metadatos JSON | relleno hasta 64 | arreglos (cada uno alineado a 64)
+
+Los metadatos guardan la huella del config, los nombres de constelación y
+el tipo, forma y desplazamiento de cada arreglo.
+"""
+
+import gc
+import hashlib
+import json
+import math
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.constellation import GrafoConstelaciones
+from backend.star_table import (
+    ATRIBUTOS_FLOAT, COLUMNAS_NUMERICAS, ConstructorTablaEstrellas, TablaEstrellas,
+)
+from utils.json_stream import iterar_estrellas
+
+
+MAGIA = b'GRAFOBIN'
+VERSION_CACHE = 1
+EXTENSION_CACHE = '.grafocache'
+
+_ALINEACION = 64
+_CABECERA = struct.Struct('<8sII')
+
+
+def ruta_cache(ruta_config: str) -> str:
+    """Ruta del archivo de caché de un config (en la misma carpeta)."""
+    return ruta_config + EXTENSION_CACHE
+
+
+def huella_archivo(ruta: str) -> Dict:
+    """
+    Huella de un archivo: fecha de modificación, tamaño y SHA-256.
+    """
+    estado = os.stat(ruta)
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return {'mtime_ns': estado.st_mtime_ns, 'tamano': estado.st_size, 'sha256': h.hexdigest()}
+
+
+class GrafoCompilado:
+    """
+    Grafo de data/config.json en forma de arreglos.
+
+    Attributes:
+        tabla: TablaEstrellas (fila = posición del ID ordenado)
+        inicio_adyacencia: int64[N+1]; las aristas de la fila i están en
+            [inicio_adyacencia[i], inicio_adyacencia[i+1])
+        destinos: int64[E], fila del destino de cada arista
+        distancias: float64[E]
+        aparicion_filas, aparicion_constelacion: int64[M], cada aparición
+            de una estrella en el config (fila, índice de constelación), en
+            el orden del archivo
+        enteros_estrella: uint16[N], bit k activo si el atributo
+            ATRIBUTOS_FLOAT[k] era entero en el JSON
+        enteros_distancia: bool[E], si la distancia era entera en el JSON
+
+    Las aristas de cada fila conservan el orden del archivo y los enteros
+    del JSON se recuperan como int, de modo que a_grafo() produce el mismo
+    grafo que cargar_grafo_desde_json (mismos tipos y mismo orden de
+    vecinos, que decide los desempates de las búsquedas).
+    """
+
+    ARREGLOS = (
+        'inicio_adyacencia', 'destinos', 'distancias', 'aparicion_filas',
+        'aparicion_constelacion', 'enteros_estrella', 'enteros_distancia',
+    )
+
+    def __init__(
+        self,
+        tabla: TablaEstrellas,
+        inicio_adyacencia: np.ndarray,
+        destinos: np.ndarray,
+        distancias: np.ndarray,
+        aparicion_filas: np.ndarray,
+        aparicion_constelacion: np.ndarray,
+        enteros_estrella: np.ndarray,
+        enteros_distancia: np.ndarray
+    ):
+        self.tabla = tabla
+        self.inicio_adyacencia = inicio_adyacencia
+        self.destinos = destinos
+        self.distancias = distancias
+        self.aparicion_filas = aparicion_filas
+        self.aparicion_constelacion = aparicion_constelacion
+        self.enteros_estrella = enteros_estrella
+        self.enteros_distancia = enteros_distancia
+
+    @classmethod
+    def desde_config(cls, data: dict, verbose: bool = True) -> 'GrafoCompilado':
+        """
+        Procesa el contenido de data/config.json con las mismas reglas que
+        cargar_grafo_desde_json.
+
+        Args:
+            data: JSON ya cargado
+            verbose: Si True, avisa de los enlaces a estrellas inexistentes
+        """
+        registros = (
+            (star_data, constellation.get('name', 'Sin nombre'))
+            for constellation in data.get('constellations', [])
+            for star_data in constellation.get('starts', [])  # "starts" (typo del JSON)
+        )
+        return cls.desde_registros(registros, verbose)
+
+    @classmethod
+    def desde_registros(cls, registros: Iterable[Tuple[dict, str]], verbose: bool = True) -> 'GrafoCompilado':
+        """
+        Procesa estrellas (star_data, nombre de constelación) en orden del
+        archivo, p. ej. las de utils/json_stream.iterar_estrellas().
+
+        Los enlaces se acumulan en array.array (8 bytes por valor), así que
+        nunca se guarda el JSON completo.
+        """
+        constructor = ConstructorTablaEstrellas()
+        enteros = array('H')
+        origenes = array('q')
+        destinos = array('q')
+        distancias = array('d')
+        distancia_entera = array('b')
+
+        for star_data, nombre in registros:
+            coords = star_data.get('coordenates', {})
+            valores = (coords.get('x', 0), coords.get('y', 0)) + tuple(
+                star_data.get(clave, defecto) for _, clave, defecto in COLUMNAS_NUMERICAS
+            )
+            constructor.agregar(
+                star_data['id'],
+                label=star_data.get('label', str(star_data['id'])),
+                constelacion=nombre,
+                hipergigante=star_data.get('hypergiant', False),
+                **dict(zip(ATRIBUTOS_FLOAT, valores))
+            )
+            enteros.append(_mascara_enteros(valores))
+            for link in star_data.get('linkedTo', []):
+                distancia = link.get('distance', 1.0)
+                origenes.append(star_data['id'])
+                destinos.append(link['starId'])
+                distancias.append(distancia)
+                distancia_entera.append(_es_entero(distancia))
+
+        ids_aparicion, aparicion_constelacion = constructor.apariciones()
+        tabla = constructor.construir()
+        del constructor  # Liberar las filas acumuladas antes de procesar las aristas
+        aparicion_filas = np.searchsorted(tabla.ids, ids_aparicion)
+        del ids_aparicion
+
+        # Máscara de enteros de la primera aparición de cada estrella
+        _, primeras = np.unique(aparicion_filas, return_index=True)
+        enteros_estrella = np.frombuffer(enteros, dtype=np.uint16)[primeras]
+
+        # Aristas: solo hacia estrellas existentes, agrupadas por origen
+        # conservando el orden del archivo
+        destinos_ids = np.frombuffer(destinos, dtype=np.int64)
+        filas_destino = np.searchsorted(tabla.ids, destinos_ids)
+        existe = filas_destino < len(tabla)
+        existe[existe] = tabla.ids[filas_destino[existe]] == destinos_ids[existe]
+        if verbose:
+            for indice in np.flatnonzero(~existe).tolist():
+                print(f"⚠️  Advertencia: Estrella {destinos[indice]} no existe, "
+                      f"omitiendo conexión desde {origenes[indice]}")
+
+        del destinos_ids, destinos
+        filas_origen = np.searchsorted(tabla.ids, np.frombuffer(origenes, dtype=np.int64)[existe])
+        del origenes
+        orden = np.argsort(filas_origen, kind='stable')
+        inicio_adyacencia = np.zeros(len(tabla) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas_origen, minlength=len(tabla)), out=inicio_adyacencia[1:])
+        del filas_origen
+
+        filas_destino = filas_destino[existe][orden]
+        distancias = np.frombuffer(distancias, dtype=np.float64)[existe][orden]
+        distancia_entera = np.frombuffer(distancia_entera, dtype=np.int8)[existe][orden].astype(bool)
+
+        return cls(
+            tabla,
+            inicio_adyacencia,
+            filas_destino,
+            distancias,
+            aparicion_filas,
+            aparicion_constelacion,
+            enteros_estrella,
+            distancia_entera,
+        )
+
+    def vecinos(self, star_id: int) -> List[Tuple[int, float]]:
+        """Lista de (id_vecino, distancia) de una estrella, en orden del archivo."""
+        fila = self.tabla.fila(star_id)
+        inicio, fin = int(self.inicio_adyacencia[fila]), int(self.inicio_adyacencia[fila + 1])
+        return list(zip(self.tabla.ids[self.destinos[inicio:fin]].tolist(),
+                        self.distancias[inicio:fin].tolist()))
+
+    def a_grafo(self) -> GrafoConstelaciones:
+        """
+        Construye el GrafoConstelaciones (equivalente a cargar_grafo_desde_json).
+
+        El recolector cíclico se pausa mientras tanto: la construcción solo
+        crea objetos vivos y, en catálogos grandes, sus pasadas sobre el
+        grafo a medio construir se llevaban más tiempo que la propia carga.
+        """
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return self._construir_grafo()
+        finally:
+            if recolector_activo:
+                gc.enable()
+
+    def _construir_grafo(self) -> GrafoConstelaciones:
+        tabla = self.tabla
+        ids = tabla.ids.tolist()
+        enteros = self.enteros_estrella.tolist()
+        columnas = []
+        for k, atributo in enumerate(ATRIBUTOS_FLOAT):
+            bit = 1 << k
+            columnas.append([
+                int(valor) if mascara & bit else valor
+                for valor, mascara in zip(getattr(tabla, atributo).tolist(), enteros)
+            ])
+        hipergigante = tabla.hipergigante.tolist()
+        nombres = tabla.nombres_constelaciones
+        bloque = bytes(tabla.etiquetas)
+        inicio_etiquetas = tabla.inicio_etiquetas.tolist()
+        x, y, radius, time_to_eat, stay_duration, amount_of_energy, \
+            health_impact, life_time_impact, research_energy_cost = columnas
+
+        grafo = GrafoConstelaciones()
+        agregar_estrella = grafo.agregar_estrella
+
+        # PASO 1: estrellas, en el orden de aparición del archivo
+        for fila, constelacion in zip(self.aparicion_filas.tolist(), self.aparicion_constelacion.tolist()):
+            agregar_estrella(
+                ids[fila],
+                bloque[inicio_etiquetas[fila]:inicio_etiquetas[fila + 1]].decode('utf-8'),
+                x[fila], y[fila], radius[fila],
+                [nombres[constelacion]] if constelacion >= 0 else None,
+                hipergigante[fila],
+                time_to_eat[fila], stay_duration[fila], amount_of_energy[fila],
+                health_impact[fila], life_time_impact[fila], research_energy_cost[fila],
+            )
+
+        # PASO 2: conexiones (ya filtradas a estrellas existentes)
+        destinos = self.destinos.tolist()
+        distancias = [
+            int(d) if entero else d
+            for d, entero in zip(self.distancias.tolist(), self.enteros_distancia.tolist())
+        ]
+        inicio = self.inicio_adyacencia.tolist()
+        vertices = [grafo.graph[star_id] for star_id in ids]
+        for fila, vertice in enumerate(vertices):
+            for arista in range(inicio[fila], inicio[fila + 1]):
+                # Equivale a grafo.add_edge: ambos vértices ya existen
+                vertice.add_neighbor(vertices[destinos[arista]], distancias[arista])
+
+        return grafo
+
+    def arreglos(self) -> Dict[str, np.ndarray]:
+        """Todos los arreglos a guardar, con su nombre."""
+        tabla = self.tabla
+        resultado = {
+            'ids': tabla.ids,
+            'hipergigante': tabla.hipergigante,
+            'etiquetas': np.frombuffer(bytes(tabla.etiquetas), dtype=np.uint8),
+            'inicio_etiquetas': tabla.inicio_etiquetas,
+            'inicio_pertenencia': tabla.inicio_pertenencia,
+            'pertenencia': tabla.pertenencia,
+        }
+        for atributo in ATRIBUTOS_FLOAT:
+            resultado[atributo] = getattr(tabla, atributo)
+        for nombre in self.ARREGLOS:
+            resultado[nombre] = getattr(self, nombre)
+        return resultado
+
+    @classmethod
+    def desde_arreglos(cls, arreglos: Dict[str, np.ndarray], nombres_constelaciones: List[str]) -> 'GrafoCompilado':
+        """Inverso de arreglos()."""
+        tabla = TablaEstrellas(
+            arreglos['ids'],
+            {atributo: arreglos[atributo] for atributo in ATRIBUTOS_FLOAT},
+            arreglos['hipergigante'],
+            arreglos['etiquetas'],
+            arreglos['inicio_etiquetas'],
+            nombres_constelaciones,
+            arreglos['inicio_pertenencia'],
+            arreglos['pertenencia'],
+        )
+        return cls(tabla, *(arreglos[nombre] for nombre in cls.ARREGLOS))
+
+
+def _es_entero(valor) -> bool:
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _mascara_enteros(valores) -> int:
+    mascara = 0
+    for k, valor in enumerate(valores):
+        if _es_entero(valor):
+            mascara |= 1 << k
+    return mascara
+
+
+def _alinear(posicion: int) -> int:
+    return (posicion + _ALINEACION - 1) // _ALINEACION * _ALINEACION
+
+
+def guardar_cache(compilado: GrafoCompilado, ruta: str, huella: Dict) -> None:
+    """
+    Escribe la caché de forma atómica (archivo temporal + os.replace).
+
+    Args:
+        compilado: Grafo procesado
+        ruta: Archivo de caché
+        huella: huella_archivo() del config del que procede
+    """
+    arreglos = compilado.arreglos()
+    descripcion = {}
+    desplazamiento = 0
+    for nombre, arreglo in arreglos.items():
+        descripcion[nombre] = {
+            'dtype': arreglo.dtype.newbyteorder('<').str,
+            'forma': list(arreglo.shape),
+            'desplazamiento': desplazamiento,
+        }
+        desplazamiento = _alinear(desplazamiento + arreglo.nbytes)
+
+    metadatos = json.dumps({
+        'huella': huella,
+        'nombres_constelaciones': compilado.tabla.nombres_constelaciones,
+        'arreglos': descripcion,
+    }).encode('utf-8')
+    inicio_datos = _alinear(_CABECERA.size + len(metadatos))
+
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'wb') as f:
+        f.write(_CABECERA.pack(MAGIA, VERSION_CACHE, len(metadatos)))
+        f.write(metadatos)
+        for nombre, arreglo in arreglos.items():
+            f.seek(inicio_datos + descripcion[nombre]['desplazamiento'])
+            f.write(np.ascontiguousarray(arreglo, dtype=descripcion[nombre]['dtype']).tobytes())
+    os.replace(temporal, ruta)
+
+
+def leer_cache(ruta: str) -> Optional[Tuple[Dict, GrafoCompilado]]:
+    """
+    Abre una caché con memory-mapping (sin copiar los arreglos).
+
+    Returns:
+        (huella guardada, grafo compilado), o None si el archivo no existe,
+        es de otra versión o está dañado
+    """
+    try:
+        with open(ruta, 'rb') as f:
+            magia, version, longitud = _CABECERA.unpack(f.read(_CABECERA.size))
+            if magia != MAGIA or version != VERSION_CACHE:
+                return None
+            metadatos = json.loads(f.read(longitud).decode('utf-8'))
+        inicio_datos = _alinear(_CABECERA.size + longitud)
+
+        # Vista ndarray del mapeo: las rebanadas de np.memmap son mucho más
+        # lentas de indexar elemento a elemento
+        memoria = np.memmap(ruta, dtype=np.uint8, mode='r').view(np.ndarray)
+        arreglos = {}
+        for nombre, d in metadatos['arreglos'].items():
+            tipo = np.dtype(d['dtype'])
+            inicio = inicio_datos + d['desplazamiento']
+            cantidad = math.prod(d['forma'])
+            fin = inicio + cantidad * tipo.itemsize
+            if fin > len(memoria):
+                return None
+            arreglos[nombre] = memoria[inicio:fin].view(tipo).reshape(d['forma'])
+        return metadatos['huella'], GrafoCompilado.desde_arreglos(arreglos, metadatos['nombres_constelaciones'])
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+
+def cargar_compilado(ruta_config: str = "data/config.json", verbose: bool = False) -> GrafoCompilado:
+    """
+    Retorna el grafo compilado de un config, desde la caché si sigue
+    vigente o reconstruyéndola si no.
+
+    La caché es vigente si coinciden la fecha de modificación y el tamaño
+    del config, o, si no coinciden, su SHA-256. Si la caché no se puede
+    escribir (p. ej. carpeta de solo lectura) se devuelve igualmente el
+    grafo procesado.
+    """
+    archivo_cache = ruta_cache(ruta_config)
+    estado = os.stat(ruta_config)
+
+    leido = leer_cache(archivo_cache)
+    if leido is not None:
+        huella_guardada, compilado = leido
+        if (huella_guardada.get('mtime_ns') == estado.st_mtime_ns
+                and huella_guardada.get('tamano') == estado.st_size):
+            return compilado
+        huella = huella_archivo(ruta_config)
+        if huella_guardada.get('sha256') == huella['sha256']:
+            # Mismo contenido con otra fecha: se reescribe la caché con la
+            # huella nueva para no volver a calcular el hash en cada arranque
+            try:
+                guardar_cache(compilado, archivo_cache, huella)
+            except OSError:
+                pass
+            return compilado
+        if verbose:
+            print(f"♻️  Caché del grafo desactualizada: {archivo_cache}")
+        # Soltar el mapeo antes de reemplazar el archivo (necesario en Windows)
+        leido = compilado = None
+    else:
+        huella = huella_archivo(ruta_config)
+
+    # Lectura incremental: el JSON nunca está completo en memoria
+    compilado = GrafoCompilado.desde_registros(iterar_estrellas(ruta_config))
+
+    try:
+        guardar_cache(compilado, archivo_cache, huella)
+        if verbose:
+            print(f"💾 Caché del grafo guardada: {archivo_cache}")
+    except OSError as e:
+        if verbose:
+            print(f"⚠️  No se pudo guardar la caché del grafo: {e}")
+    return compilado
+
+
+def cargar_grafo_con_cache(ruta_config: str = "data/config.json", verbose: bool = False) -> GrafoConstelaciones:
+    """Como cargar_grafo_desde_json, pero usando la caché binaria."""
+    return cargar_compilado(ruta_config, verbose).a_grafo()
@@ -0,0 +1,244 @@
+"""
+Lector incremental de catálogos JSON.
+Responsabilidad: Recorrer data/config.json sin cargar el archivo completo
+en memoria.
+
+json.load construye el diccionario entero antes de poder usar una sola
+estrella; en catálogos de varios GB eso multiplica el tamaño del archivo en
+memoria. Este lector mantiene solo un bloque del archivo y decodifica de a
+una estrella (con json.JSONDecoder.raw_decode, en C), saltándose sin
+construirlos los valores que no interesan.
+
+- iterar_estrellas(): (star_data, nombre de constelación) en orden del archivo
+- leer_ajustes(): claves de primer nivel (energía inicial, pasto, edades...)
+  sin construir 'constellations'
+"""
+
+import json
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+
+# Todo lo que no abre ni cierra una estructura: texto sin comillas ni
+# corchetes y cadenas completas (con escapes). Al saltar un valor se avanza
+# de corchete en corchete sin pasar por Python en cada carácter.
+_NEUTRO = re.compile(r'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*', re.S)
+_ESPACIOS = re.compile(r'[ \t\n\r]*')
+_RESTO_NUMERO = re.compile(r'[0-9.eE+-]*')
+
+TAMANO_BLOQUE = 1 << 20
+
+
+class LectorJSONIncremental:
+    """
+    Analizador JSON dirigido por el llamador.
+
+    El llamador recorre la estructura que le interesa con claves() y
+    elementos(), y por cada valor decide si lo construye (valor()) o lo
+    salta (saltar_valor()).
+
+    Ejemplo:
+        for clave in lector.claves():
+            if clave == 'pasto':
+                pasto = lector.valor()
+            else:
+                lector.saltar_valor()
+    """
+
+    def __init__(self, archivo: TextIO, tamano_bloque: int = TAMANO_BLOQUE):
+        self._archivo = archivo
+        self._tamano_bloque = tamano_bloque
+        self._buffer = ""
+        self._pos = 0
+        self._fin_archivo = False
+        self._decodificador = json.JSONDecoder()
+
+    # ------------------------------------------------------------------
+    # Buffer
+    # ------------------------------------------------------------------
+
+    def _leer_mas(self, minimo: int = 0) -> bool:
+        """
+        Descarta lo ya consumido y agrega al menos un bloque.
+
+        Returns:
+            False si el archivo ya terminó
+        """
+        if self._fin_archivo:
+            return False
+        bloque = self._archivo.read(max(self._tamano_bloque, minimo))
+        if not bloque:
+            self._fin_archivo = True
+            return False
+        self._buffer = self._buffer[self._pos:] + bloque
+        self._pos = 0
+        return True
+
+    def _siguiente(self) -> str:
+        """Siguiente carácter significativo (sin consumirlo); '' al final."""
+        while True:
+            self._pos = _ESPACIOS.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._leer_mas():
+                return ''
+
+    def _consumir(self, esperados: str) -> str:
+        caracter = self._siguiente()
+        if not caracter or caracter not in esperados:
+            raise ValueError(
+                f"JSON inválido: se esperaba uno de {esperados!r} y se encontró {caracter or 'fin de archivo'!r}"
+            )
+        self._pos += 1
+        return caracter
+
+    # ------------------------------------------------------------------
+    # Recorrido
+    # ------------------------------------------------------------------
+
+    def claves(self) -> Iterator[str]:
+        """
+        Recorre un objeto. Por cada clave que entrega, el llamador debe
+        consumir su valor (valor() o saltar_valor()) antes de pedir la
+        siguiente.
+        """
+        self._consumir('{')
+        if self._siguiente() == '}':
+            self._pos += 1
+            return
+        while True:
+            clave = self.valor()
+            if not isinstance(clave, str):
+                raise ValueError(f"JSON inválido: clave no textual {clave!r}")
+            self._consumir(':')
+            yield clave
+            if self._consumir(',}') == '}':
+                return
+
+    def elementos(self) -> Iterator[None]:
+        """
+        Recorre un arreglo. Por cada elemento, el llamador debe consumirlo
+        (valor(), saltar_valor(), claves()...) antes de pedir el siguiente.
+        """
+        self._consumir('[')
+        if self._siguiente() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self._consumir(',]') == ']':
+                return
+
+    def valor(self):
+        """Decodifica el siguiente valor completo."""
+        if not self._siguiente():
+            raise ValueError("JSON inválido: fin de archivo inesperado")
+        while True:
+            try:
+                valor, fin = self._decodificador.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Valor cortado por el borde del bloque: leer más y reintentar
+                if self._leer_mas(len(self._buffer)):
+                    continue
+                raise
+            # Un número al borde del bloque puede seguir en el próximo
+            # ("12" de "12.5e3")
+            if (isinstance(valor, (int, float)) and not isinstance(valor, bool)
+                    and _RESTO_NUMERO.fullmatch(self._buffer, fin) and self._leer_mas()):
+                continue
+            self._pos = fin
+            return valor
+
+    def saltar_valor(self) -> None:
+        """Avanza sobre el siguiente valor sin construirlo."""
+        caracter = self._siguiente()
+        if caracter not in ('{', '['):
+            self.valor()  # Cadena, número o literal: pequeños
+            return
+
+        profundidad = 0
+        while True:
+            self._pos = _NEUTRO.match(self._buffer, self._pos).end()
+            if self._pos >= len(self._buffer):
+                if not self._leer_mas():
+                    raise ValueError("JSON inválido: fin de archivo dentro de un valor")
+                continue
+            caracter = self._buffer[self._pos]
+            if caracter == '"':
+                # Cadena cortada por el borde del bloque
+                if not self._leer_mas():
+                    raise ValueError("JSON inválido: cadena sin cerrar")
+                continue
+            self._pos += 1
+            if caracter in '{[':
+                profundidad += 1
+            else:
+                profundidad -= 1
+                if profundidad == 0:
+                    return
+
+
+def iterar_estrellas(ruta: str = "data/config.json") -> Iterator[Tuple[dict, str]]:
+    """
+    Recorre las estrellas de un catálogo de a una.
+
+    Yields:
+        (star_data, nombre de la constelación), en el orden del archivo.
+        star_data es el diccionario de la estrella tal como está en el JSON.
+
+    Si en una constelación 'starts' aparece antes que 'name', sus estrellas
+    se retienen hasta conocer el nombre (o hasta el final de la
+    constelación, con 'Sin nombre' como en cargar_grafo_desde_json).
+    """
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lector = LectorJSONIncremental(f)
+        for clave in lector.claves():
+            if clave != 'constellations':
+                lector.saltar_valor()
+                continue
+            for _ in lector.elementos():
+                nombre: Optional[str] = None
+                pendientes: List[dict] = []
+                for clave_constelacion in lector.claves():
+                    if clave_constelacion == 'name':
+                        nombre = lector.valor()
+                        for star_data in pendientes:
+                            yield star_data, nombre
+                        pendientes = []
+                    elif clave_constelacion == 'starts':  # "starts" (typo del JSON)
+                        for _ in lector.elementos():
+                            star_data = lector.valor()
+                            if nombre is None:
+                                pendientes.append(star_data)
+                            else:
+                                yield star_data, nombre
+                    else:
+                        lector.saltar_valor()
+                for star_data in pendientes:
+                    yield star_data, 'Sin nombre'
+
+
+def leer_ajustes(ruta: str = "data/config.json", claves: Optional[Sequence[str]] = None) -> Dict:
+    """
+    Lee claves de primer nivel del catálogo sin construir las constelaciones.
+
+    Args:
+        ruta: Ruta al archivo JSON
+        claves: Claves a leer (None = todas menos 'constellations')
+
+    Returns:
+        {clave: valor} de las claves presentes. Si se piden claves
+        concretas, la lectura se detiene en cuanto aparecen todas.
+    """
+    buscadas = set(claves) if claves is not None else None
+    ajustes = {}
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lector = LectorJSONIncremental(f)
+        for clave in lector.claves():
+            if clave == 'constellations' or (buscadas is not None and clave not in buscadas):
+                lector.saltar_valor()
+                continue
+            ajustes[clave] = lector.valor()
+            if buscadas is not None and buscadas <= ajustes.keys():
+                break
+    return ajustes
@@ -0,0 +1,276 @@
+"""
+Barrido de escenarios.
+Responsabilidad: Ejecutar los planificadores de ruta para cada punto de una
+rejilla de configuraciones iniciales del burro y devolver una tabla.
+
+"¿Cuál es la mejor ruta si el burro empieza con X energía e Y pasto?":
+la rejilla usa las mismas claves que data/config.json (burroenergiaInicial,
+pasto, startAge, deathAge) y los valores que no se barren se toman de la
+configuración base.
+
+- El grafo se preprocesa una sola vez: se toma una InstantaneaGrafo y cada
+  proceso de trabajo la convierte en GrafoConstelaciones al iniciarse.
+- Cada punto se guarda en disco (un JSON por punto) con una clave que
+  incluye la huella del grafo, así que volver a ejecutar un barrido solo
+  calcula los puntos nuevos o los de un grafo modificado.
+"""
+
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+from backend.constellation import GrafoConstelaciones
+from backend.donkey import Donkey
+from backend.snapshot import InstantaneaGrafo
+from utils.json_stream import leer_ajustes
+from algorithms.max_stars_route import encontrar_ruta_maxima_estrellas
+from algorithms.optimal_route_with_grass import encontrar_ruta_optima_con_pasto
+from algorithms.heuristic_route import encontrar_ruta_beam_search, encontrar_ruta_greedy
+
+
+# Planificadores disponibles: nombre -> función (grafo, burro, posicion) -> dict
+PLANIFICADORES: Dict[str, Callable] = {
+    'max_estrellas': encontrar_ruta_maxima_estrellas,
+    'pasto': encontrar_ruta_optima_con_pasto,
+    'beam': encontrar_ruta_beam_search,
+    'greedy': encontrar_ruta_greedy,
+}
+
+# Claves de data/config.json que describen al burro y su valor por defecto
+# (los mismos que usa crear_burro_desde_json)
+PARAMETROS_BURRO: Dict[str, float] = {
+    'burroenergiaInicial': 100,
+    'pasto': 300,
+    'startAge': 0,
+    'deathAge': 3567,
+}
+
+DIRECTORIO_CACHE = ".cache/barridos"
+
+# Versión del formato de las entradas de caché
+_VERSION_CACHE = 1
+
+# Grafo reconstruido en cada proceso de trabajo (ver _inicializar_proceso)
+_GRAFO: Optional[GrafoConstelaciones] = None
+
+
+def cargar_configuracion_base(ruta: str = "data/config.json") -> Dict[str, float]:
+    """Lee los parámetros del burro de un archivo de configuración (sin las constelaciones)."""
+    data = leer_ajustes(ruta, tuple(PARAMETROS_BURRO))
+    return {clave: data.get(clave, defecto) for clave, defecto in PARAMETROS_BURRO.items()}
+
+
+def huella_grafo(instantanea: InstantaneaGrafo) -> str:
+    """
+    Hash SHA-256 del contenido de la instantánea (aristas y parámetros de
+    las estrellas). Cambia si se edita cualquier estrella o camino.
+    """
+    h = hashlib.sha256()
+    for star_id in sorted(instantanea.adyacencia):
+        h.update(repr((star_id, sorted(instantanea.adyacencia[star_id]))).encode())
+    for star_id in sorted(instantanea.estrellas):
+        e = instantanea.estrellas[star_id]
+        h.update(repr((
+            star_id, sorted(e.constelaciones), e.hipergigante, e.time_to_eat,
+            e.stay_duration, e.amount_of_energy, e.health_impact,
+            e.life_time_impact, e.research_energy_cost
+        )).encode())
+    return h.hexdigest()
+
+
+def _crear_burro(punto: Dict[str, float]) -> Donkey:
+    """Crea el burro de un punto de la rejilla (como crear_burro_desde_json)."""
+    return Donkey(
+        name="Burro Científico",
+        age=punto['startAge'],
+        max_age=punto['deathAge'],
+        donkey_energy=punto['burroenergiaInicial'],
+        grass_in_basement=punto['pasto']
+    )
+
+
+def _resolver_punto(grafo: GrafoConstelaciones, planificador: str, punto: Dict, posicion_inicial: int) -> Dict:
+    """Ejecuta un planificador para un punto y resume el resultado."""
+    inicio = time.perf_counter()
+    resultado = PLANIFICADORES[planificador](grafo, _crear_burro(punto), posicion_inicial)
+    segundos = time.perf_counter() - inicio
+
+    estado_final = resultado.get('estado_final', {})
+    return {
+        'estrellas_visitadas': resultado['estrellas_visitadas'],
+        'distancia_total': resultado['distancia_total'],
+        'pasto_usado': resultado.get('pasto_usado', 0),
+        'energia_final': estado_final.get('energia'),
+        'edad_final': estado_final.get('edad'),
+        'salud_final': estado_final.get('salud'),
+        'ruta': list(resultado['ruta']),
+        'exploraciones': resultado.get('exploraciones', 0),
+        'segundos': segundos,
+    }
+
+
+def _inicializar_proceso(instantanea: InstantaneaGrafo) -> None:
+    """Inicializador de ProcessPoolExecutor: reconstruye el grafo una vez."""
+    global _GRAFO
+    _GRAFO = instantanea.a_grafo()
+
+
+def _resolver_en_proceso(argumentos) -> Dict:
+    return _resolver_punto(_GRAFO, *argumentos)
+
+
+class BarridoEscenarios:
+    """
+    Ejecuta planificadores sobre todos los puntos de una rejilla.
+
+    Ejemplo:
+        barrido = BarridoEscenarios(
+            InstantaneaGrafo.desde_grafo(grafo),
+            {'burroenergiaInicial': [40, 70, 100], 'pasto': [0, 50, 200]}
+        )
+        filas = barrido.ejecutar(procesos=4)
+        guardar_csv(filas, "barrido.csv")
+    """
+
+    def __init__(
+        self,
+        instantanea: InstantaneaGrafo,
+        rejilla: Dict[str, Sequence[float]],
+        base: Optional[Dict[str, float]] = None,
+        planificadores: Sequence[str] = ('max_estrellas', 'pasto'),
+        posicion_inicial: int = 1,
+        directorio_cache: Optional[str] = DIRECTORIO_CACHE
+    ):
+        """
+        Args:
+            instantanea: Grafo sobre el que se planifica
+            rejilla: {clave de config.json: valores a probar}
+            base: Valores de las claves que no se barren (por defecto los
+                  de data/config.json)
+            planificadores: Nombres en PLANIFICADORES
+            posicion_inicial: ID de la estrella inicial
+            directorio_cache: Carpeta de la caché en disco (None = sin caché)
+        """
+        desconocidas = set(rejilla) - set(PARAMETROS_BURRO)
+        if desconocidas:
+            raise ValueError(f"Claves de rejilla desconocidas: {sorted(desconocidas)}")
+        faltantes = set(planificadores) - set(PLANIFICADORES)
+        if faltantes:
+            raise ValueError(f"Planificadores desconocidos: {sorted(faltantes)}")
+
+        self.instantanea = instantanea
+        self.rejilla = {clave: list(valores) for clave, valores in rejilla.items()}
+        self.base = dict(PARAMETROS_BURRO)
+        self.base.update(base if base is not None else cargar_configuracion_base())
+        self.planificadores = list(planificadores)
+        self.posicion_inicial = posicion_inicial
+        self.directorio_cache = directorio_cache
+        self.huella = huella_grafo(instantanea)
+
+    def puntos(self) -> List[Dict[str, float]]:
+        """Producto cartesiano de la rejilla sobre la configuración base."""
+        claves = list(self.rejilla)
+        puntos = []
+        for valores in itertools.product(*(self.rejilla[c] for c in claves)):
+            punto = dict(self.base)
+            punto.update(zip(claves, valores))
+            puntos.append(punto)
+        return puntos
+
+    def _ruta_cache(self, planificador: str, punto: Dict) -> Optional[str]:
+        if self.directorio_cache is None:
+            return None
+        clave = json.dumps(
+            [_VERSION_CACHE, self.huella, planificador, self.posicion_inicial,
+             [punto[c] for c in PARAMETROS_BURRO]]
+        )
+        nombre = hashlib.sha256(clave.encode()).hexdigest()[:32]
+        return os.path.join(self.directorio_cache, planificador, f"{nombre}.json")
+
+    def _leer_cache(self, ruta: Optional[str]) -> Optional[Dict]:
+        if ruta is None or not os.path.exists(ruta):
+            return None
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _escribir_cache(self, ruta: Optional[str], resultado: Dict) -> None:
+        if ruta is None:
+            return
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f)
+        os.replace(temporal, ruta)
+
+    def ejecutar(self, procesos: int = 1, verbose: bool = False) -> List[Dict]:
+        """
+        Resuelve todos los puntos (usando la caché cuando existe).
+
+        Args:
+            procesos: Si > 1, resuelve los puntos pendientes en paralelo
+            verbose: Si True, imprime el progreso
+
+        Returns:
+            Una fila por (planificador, punto): parámetros del burro, nombre
+            del planificador, resultado resumido y 'desde_cache'
+        """
+        tareas = [(p, punto) for p in self.planificadores for punto in self.puntos()]
+        resultados: List[Optional[Dict]] = []
+        pendientes = []
+
+        for indice, (planificador, punto) in enumerate(tareas):
+            resultado = self._leer_cache(self._ruta_cache(planificador, punto))
+            resultados.append(resultado)
+            if resultado is None:
+                pendientes.append(indice)
+
+        if verbose:
+            print(f"\n🧮 Barrido: {len(tareas)} puntos, {len(tareas) - len(pendientes)} en caché, "
+                  f"{len(pendientes)} por calcular ({procesos} procesos)")
+
+        argumentos = [(tareas[i][0], tareas[i][1], self.posicion_inicial) for i in pendientes]
+        if procesos > 1 and len(pendientes) > 1:
+            with ProcessPoolExecutor(
+                max_workers=procesos,
+                initializer=_inicializar_proceso,
+                initargs=(self.instantanea,)
+            ) as ejecutor:
+                calculados = list(ejecutor.map(_resolver_en_proceso, argumentos))
+        else:
+            grafo = self.instantanea.a_grafo() if pendientes else None
+            calculados = [_resolver_punto(grafo, *args) for args in argumentos]
+
+        for indice, resultado in zip(pendientes, calculados):
+            self._escribir_cache(self._ruta_cache(*tareas[indice]), resultado)
+            resultados[indice] = dict(resultado, desde_cache=False)
+
+        filas = []
+        for (planificador, punto), resultado in zip(tareas, resultados):
+            resultado.setdefault('desde_cache', True)
+            fila = dict(punto)
+            fila['planificador'] = planificador
+            fila.update(resultado)
+            filas.append(fila)
+        return filas
+
+
+def guardar_csv(filas: List[Dict], ruta: str) -> None:
+    """Escribe la tabla del barrido en CSV (la ruta como IDs separados por '-')."""
+    if not filas:
+        return
+    columnas = list(filas[0])
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas)
+        escritor.writeheader()
+        for fila in filas:
+            fila = dict(fila)
+            fila['ruta'] = '-'.join(map(str, fila['ruta']))
+            escritor.writerow(fila)
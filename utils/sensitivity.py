@@ -0,0 +1,402 @@
+"""
+Análisis de sensibilidad Monte-Carlo.
+Responsabilidad: Medir qué tan robusta es una ruta cuando los parámetros de
+las estrellas (los que se editan en StarEditorPanel) no son exactos.
+
+Por cada muestra se perturban healthImpact, lifeTimeImpact, timeToEat y
+stayDuration según distribuciones configurables y se vuelve a simular la
+ruta (o se vuelve a planificar). El resultado es la probabilidad de
+supervivencia y percentiles de energía, edad, pasto, pasos y distancia.
+
+- Ruta fija: cada bloque de muestras se simula vectorizado con
+  DonkeyPopulation (una muestra = un burro).
+- Replanificación: por muestra se ejecuta el planificador sobre el grafo
+  perturbado y la ruta resultante se simula con simular_itinerario.
+
+Los bloques se reparten en un ProcessPoolExecutor. Cada bloque tiene su
+propia semilla derivada de la semilla global (np.random.SeedSequence), así
+que el resultado no depende del número de procesos.
+"""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.batch_simulator import (
+    ConfiguracionBurro, DTYPE_RESULTADO, MOTIVO_COMPLETADO, MOTIVO_MUERTE,
+    MOTIVO_SIN_RUTA, MOTIVO_YA_VISITADA, SALUDES, camino_mas_corto,
+    simular_itinerario
+)
+from backend.population import DonkeyPopulation
+from backend.snapshot import InstantaneaGrafo
+
+
+# Atributos de Estrella que se pueden perturbar (y su nombre en el JSON)
+PARAMETROS: Dict[str, str] = {
+    'health_impact': 'healthImpact',
+    'life_time_impact': 'lifeTimeImpact',
+    'time_to_eat': 'timeToEat',
+    'stay_duration': 'stayDuration',
+}
+
+# Los tiempos no pueden ser negativos, y comer 1 kg siempre toma tiempo (el
+# mismo mínimo que StarEditorPanel; los simuladores dividen por timeToEat)
+_MINIMOS: Dict[str, float] = {'time_to_eat': 0.5, 'stay_duration': 0.0}
+
+PERCENTILES: Tuple[int, ...] = (5, 25, 50, 75, 95)
+_CAMPOS_PERCENTILES: Tuple[str, ...] = ('energia', 'edad', 'pasto', 'pasos', 'distancia')
+
+# Contexto del análisis en cada proceso de trabajo (ver _inicializar_proceso)
+_CONTEXTO: Optional[dict] = None
+
+
+@dataclass(frozen=True)
+class Distribucion:
+    """
+    Perturbación de un parámetro de estrella.
+
+    Tipos:
+    - 'normal': valor + N(0, escala)
+    - 'relativa': valor * (1 + N(0, escala))
+    - 'uniforme': valor + U(-escala, escala)
+
+    `minimo` acota los valores por abajo; para timeToEat y stayDuration
+    nunca baja de los mínimos del módulo (_MINIMOS).
+    """
+    tipo: str = 'normal'
+    escala: float = 0.0
+    minimo: Optional[float] = None
+
+    def muestrear(self, base: np.ndarray, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Retorna una matriz (n, len(base)) de valores perturbados."""
+        forma = (n, base.shape[0])
+        if self.tipo == 'normal':
+            valores = base + rng.normal(0.0, self.escala, forma)
+        elif self.tipo == 'relativa':
+            valores = base * (1.0 + rng.normal(0.0, self.escala, forma))
+        elif self.tipo == 'uniforme':
+            valores = base + rng.uniform(-self.escala, self.escala, forma)
+        else:
+            raise ValueError(f"Tipo de distribución desconocido: {self.tipo}")
+
+        if self.minimo is not None:
+            valores = np.maximum(valores, self.minimo)
+        return valores
+
+
+def _muestrear_parametros(
+    instantanea: InstantaneaGrafo,
+    distribuciones: Dict[str, Distribucion],
+    ids: List[int],
+    rng: np.random.Generator,
+    n: int
+) -> Dict[str, np.ndarray]:
+    """Matrices (n, estrellas) por parámetro; las columnas siguen `ids`."""
+    muestras = {}
+    for parametro in PARAMETROS:
+        base = np.array([getattr(instantanea.estrellas[i], parametro) for i in ids], dtype=np.float64)
+        distribucion = distribuciones.get(parametro)
+        if distribucion is None:
+            muestras[parametro] = np.broadcast_to(base, (n, len(ids)))
+            continue
+        valores = distribucion.muestrear(base, rng, n)
+        if parametro in _MINIMOS:
+            valores = np.maximum(valores, _MINIMOS[parametro])
+        muestras[parametro] = valores
+    return muestras
+
+
+def _planificar_tramos(
+    instantanea: InstantaneaGrafo,
+    ruta: Sequence[int]
+) -> Tuple[List[List[Tuple[int, int, float]]], int]:
+    """
+    Tramos de cada paso de una ruta fija (no dependen de la muestra).
+
+    Returns:
+        (tramos por paso válido, motivo si la ruta se corta antes)
+    """
+    visitadas = set()
+    posicion = ruta[0]
+    pasos = []
+    for destino in ruta[1:]:
+        if destino in visitadas:
+            return pasos, MOTIVO_YA_VISITADA
+        tramos = camino_mas_corto(instantanea, posicion, destino, visitadas)
+        if tramos is None:
+            return pasos, MOTIVO_SIN_RUTA
+        pasos.append(tramos)
+        visitadas.add(destino)
+        posicion = destino
+    return pasos, MOTIVO_COMPLETADO
+
+
+def _simular_ruta_vectorizada(
+    instantanea: InstantaneaGrafo,
+    configuracion: ConfiguracionBurro,
+    ruta: Sequence[int],
+    muestras: Dict[str, np.ndarray],
+    columna: Dict[int, int],
+    investigar: bool
+) -> np.ndarray:
+    """
+    simular_itinerario para n muestras a la vez (una por burro).
+
+    Produce los mismos campos que simular_itinerario con cada grafo
+    perturbado, pero aplicando cada tramo a toda la población.
+    """
+    n = next(iter(muestras.values())).shape[0]
+    poblacion = DonkeyPopulation(
+        np.full(n, configuracion.energia), configuracion.edad,
+        configuracion.edad_maxima, configuracion.pasto
+    )
+    paso_muerte = np.full(n, -1, dtype=np.int32)
+    pasos = np.zeros(n, dtype=np.int32)
+    distancia = np.zeros(n, dtype=np.float64)
+
+    tramos_por_paso, motivo_final = _planificar_tramos(instantanea, ruta)
+
+    for paso, tramos in enumerate(tramos_por_paso, 1):
+        vivos_al_salir = poblacion.alive.copy()
+        if not vivos_al_salir.any():
+            break
+
+        recorrido = 0.0
+        for desde, hasta, peso in tramos:
+            origen = instantanea.obtener_estrella(desde)
+            estrella = instantanea.obtener_estrella(hasta)
+            c = columna[hasta]
+            poblacion.trip(
+                peso,
+                time_to_eat_kg=muestras['time_to_eat'][:, c],
+                time_of_stance=0,
+                is_star=bool(set(origen.constelaciones) & set(estrella.constelaciones)),
+                health_impact=muestras['health_impact'][:, c],
+                life_time_impact=muestras['life_time_impact'][:, c],
+                research_energy_cost=estrella.research_energy_cost,
+            )
+            recorrido += peso
+
+        llegaron = vivos_al_salir & poblacion.alive
+        paso_muerte[vivos_al_salir & ~poblacion.alive] = paso
+        distancia[llegaron] += recorrido
+
+        destino = tramos[-1][1] if tramos else ruta[paso]
+        estrella = instantanea.obtener_estrella(destino)
+        if estrella.hipergigante:
+            poblacion.hyper_star(0)
+
+        if investigar:
+            c = columna[destino]
+            murieron = poblacion.stay_of_star(
+                time_to_eat_kg=muestras['time_to_eat'][:, c],
+                time_of_stance=muestras['stay_duration'][:, c],
+                health_impact=muestras['health_impact'][:, c],
+                life_time_impact=muestras['life_time_impact'][:, c],
+                research_energy_cost=estrella.research_energy_cost,
+            )
+            paso_muerte[murieron] = paso
+
+        pasos[llegaron] += 1
+
+    resultado = np.empty(n, dtype=DTYPE_RESULTADO)
+    resultado['energia'] = poblacion.energy
+    resultado['edad'] = poblacion.age
+    resultado['pasto'] = poblacion.grass
+    resultado['salud'] = poblacion.health
+    resultado['vivo'] = poblacion.alive
+    resultado['paso_muerte'] = paso_muerte
+    resultado['pasos'] = pasos
+    resultado['motivo'] = np.where(paso_muerte >= 0, MOTIVO_MUERTE, motivo_final)
+    resultado['distancia'] = distancia
+    return resultado
+
+
+def _instantanea_perturbada(
+    instantanea: InstantaneaGrafo,
+    muestras: Dict[str, np.ndarray],
+    ids: List[int],
+    fila: int
+) -> InstantaneaGrafo:
+    """Copia de la instantánea con los parámetros de una muestra."""
+    estrellas = {}
+    for c, star_id in enumerate(ids):
+        estrella = copy.copy(instantanea.estrellas[star_id])
+        for parametro, valores in muestras.items():
+            setattr(estrella, parametro, float(valores[fila, c]))
+        estrellas[star_id] = estrella
+    return InstantaneaGrafo(instantanea.adyacencia, estrellas, instantanea.constelaciones)
+
+
+def _analizar_bloque(contexto: dict, n: int, semilla: np.random.SeedSequence) -> np.ndarray:
+    """Muestrea y simula un bloque de n muestras."""
+    instantanea = contexto['instantanea']
+    ids = contexto['ids']
+    rng = np.random.default_rng(semilla)
+    muestras = _muestrear_parametros(instantanea, contexto['distribuciones'], ids, rng, n)
+
+    if contexto['planificador'] is None:
+        return _simular_ruta_vectorizada(
+            instantanea, contexto['configuracion'], contexto['ruta'],
+            muestras, {star_id: c for c, star_id in enumerate(ids)},
+            contexto['investigar']
+        )
+
+    # Replanificar: cada muestra tiene su propio grafo perturbado
+    filas = []
+    for fila in range(n):
+        perturbada = _instantanea_perturbada(instantanea, muestras, ids, fila)
+        plan = contexto['planificador'](
+            perturbada.a_grafo(),
+            contexto['configuracion'].crear_burro(),
+            contexto['ruta'][0]
+        )
+        filas.append(simular_itinerario(
+            perturbada, contexto['configuracion'], plan['ruta'], contexto['investigar']
+        ))
+    return np.array(filas, dtype=DTYPE_RESULTADO)
+
+
+def _inicializar_proceso(contexto: dict) -> None:
+    """Inicializador de ProcessPoolExecutor: guarda el contexto del análisis."""
+    global _CONTEXTO
+    _CONTEXTO = contexto
+
+
+def _analizar_bloque_en_proceso(argumentos) -> np.ndarray:
+    return _analizar_bloque(_CONTEXTO, *argumentos)
+
+
+def resumir(resultados: np.ndarray) -> Dict:
+    """
+    Agrega resultados de simulación (DTYPE_RESULTADO).
+
+    Returns:
+        Dict con muestras, supervivencia, percentiles por campo, muertes por
+        paso y distribución de salud final
+    """
+    n = resultados.shape[0]
+    if n == 0:
+        return {'muestras': 0, 'supervivencia': 0.0, 'percentiles': {}, 'muertes_por_paso': {}, 'salud': {}}
+
+    percentiles = {
+        campo: dict(zip(PERCENTILES, np.percentile(resultados[campo], PERCENTILES).tolist()))
+        for campo in _CAMPOS_PERCENTILES
+    }
+    pasos_muerte = resultados['paso_muerte'][resultados['paso_muerte'] >= 0]
+    muertes = {int(p): int(c) for p, c in enumerate(np.bincount(pasos_muerte)) if c}
+    salud = {
+        SALUDES[codigo]: int(c)
+        for codigo, c in enumerate(np.bincount(resultados['salud'], minlength=len(SALUDES))) if c
+    }
+
+    return {
+        'muestras': n,
+        'supervivencia': float(resultados['vivo'].mean()),
+        'percentiles': percentiles,
+        'muertes_por_paso': muertes,
+        'salud': salud,
+    }
+
+
+class AnalisisSensibilidad:
+    """
+    Análisis Monte-Carlo de una ruta frente a parámetros de estrella inciertos.
+
+    Ejemplo:
+        analisis = AnalisisSensibilidad(
+            InstantaneaGrafo.desde_grafo(grafo),
+            ConfiguracionBurro.desde_burro(burro),
+            ruta=[1, 2, 3, 13],
+            distribuciones={'health_impact': Distribucion('normal', 2.0)}
+        )
+        for parcial in analisis.iterar(10000, procesos=4, semilla=7):
+            print(parcial['muestras'], parcial['supervivencia'])
+    """
+
+    def __init__(
+        self,
+        instantanea: InstantaneaGrafo,
+        configuracion: ConfiguracionBurro,
+        ruta: Sequence[int],
+        distribuciones: Dict[str, Distribucion],
+        planificador: Optional[Callable] = None,
+        investigar: bool = True
+    ):
+        """
+        Args:
+            instantanea: Grafo de referencia
+            configuracion: Estado inicial del burro
+            ruta: Ruta a evaluar (con planificador, solo se usa ruta[0])
+            distribuciones: {atributo de Estrella: Distribucion}, ver PARAMETROS
+            planificador: Si se indica, función (grafo, burro, posicion) -> dict
+                          con 'ruta' (p. ej. encontrar_ruta_greedy) que se
+                          ejecuta por muestra; debe ser serializable con pickle
+            investigar: Si True, el burro investiga cada destino
+
+        Raises:
+            ValueError: Si la ruta está vacía o algún parámetro no es perturbable
+        """
+        if not ruta:
+            raise ValueError("El itinerario está vacío: debe empezar por la estrella de partida")
+
+        desconocidos = set(distribuciones) - set(PARAMETROS)
+        if desconocidos:
+            raise ValueError(f"Parámetros no perturbables: {sorted(desconocidos)}")
+
+        self.contexto = {
+            'instantanea': instantanea,
+            'configuracion': configuracion,
+            'ruta': list(ruta),
+            'distribuciones': dict(distribuciones),
+            'planificador': planificador,
+            'investigar': investigar,
+            'ids': sorted(instantanea.estrellas),
+        }
+
+    def iterar(
+        self,
+        muestras: int,
+        tamano_bloque: int = 2000,
+        procesos: int = 1,
+        semilla: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Ejecuta el análisis por bloques y produce un resumen acumulado tras
+        cada bloque (en orden de bloque, así que es reproducible).
+
+        Yields:
+            resumir() de todas las muestras procesadas hasta el momento
+        """
+        tamanos = [min(tamano_bloque, muestras - i) for i in range(0, muestras, tamano_bloque)]
+        semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+        # Los bloques se copian una sola vez, en su lugar del arreglo final
+        resultados = np.empty(muestras, dtype=DTYPE_RESULTADO)
+        procesadas = 0
+
+        if procesos > 1 and len(tamanos) > 1:
+            with ProcessPoolExecutor(
+                max_workers=procesos,
+                initializer=_inicializar_proceso,
+                initargs=(self.contexto,)
+            ) as ejecutor:
+                for bloque in ejecutor.map(_analizar_bloque_en_proceso, zip(tamanos, semillas)):
+                    resultados[procesadas:procesadas + len(bloque)] = bloque
+                    procesadas += len(bloque)
+                    yield resumir(resultados[:procesadas])
+        else:
+            for n, semilla_bloque in zip(tamanos, semillas):
+                bloque = _analizar_bloque(self.contexto, n, semilla_bloque)
+                resultados[procesadas:procesadas + n] = bloque
+                procesadas += n
+                yield resumir(resultados[:procesadas])
+
+    def ejecutar(self, muestras: int, **opciones) -> Dict:
+        """Ejecuta el análisis completo y retorna el resumen final."""
+        resumen = resumir(np.empty(0, dtype=DTYPE_RESULTADO))
+        for resumen in self.iterar(muestras, **opciones):
+            pass
+        return resumen
@@ -0,0 +1,534 @@
+"""
+Catálogo fragmentado por constelaciones.
+Responsabilidad: Guardar el universo como un directorio (manifiesto + un
+archivo por constelación + aristas entre constelaciones) y cargar cada
+constelación recién cuando una búsqueda o el renderizador la necesita.
+
+Formato del directorio:
+    manifest.json           ajustes del burro y lista de constelaciones
+                            (archivo, número de estrellas, límites x/y y
+                            posición de sus aristas en aristas.jsonl)
+    indice.npy              (id, constelación propia) ordenado por id
+    constelaciones/NNNNN.json
+                            {"name", "miembros": ids en orden,
+                             "starts": estrellas propias con "linkedTo"}
+    aristas.jsonl           una línea por constelación con las aristas que
+                            salen de sus estrellas hacia otra constelación:
+                            [origen, destino, distancia, posición]
+
+Cada estrella se guarda una sola vez, en su constelación propia (la
+primera en la que aparece), con todas sus constelaciones en
+"constellations". La posición de cada arista entre constelaciones es su
+lugar en la lista de vecinos, así que al cargar se reconstruye el mismo
+orden de vecinos que con cargar_grafo_desde_json (el orden decide los
+desempates de las búsquedas).
+"""
+
+import gc
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.constellation import GrafoConstelaciones
+from backend.graph import Vertex
+from backend.star import Estrella
+from utils.graph_cache import GrafoCompilado
+from utils.json_stream import iterar_estrellas, leer_ajustes
+
+
+MANIFIESTO = 'manifest.json'
+VERSION_FRAGMENTOS = 1
+INDICE = 'indice.npy'
+ARISTAS = 'aristas.jsonl'
+DIRECTORIO_CONSTELACIONES = 'constelaciones'
+
+
+@contextmanager
+def _sin_recolector():
+    """
+    Pausa el recolector cíclico mientras se carga una constelación. Como en
+    GrafoCompilado.a_grafo: la carga solo crea objetos vivos y, con mucho
+    grafo ya en memoria, las pasadas del recolector costaban más que la
+    propia carga.
+    """
+    recolector_activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if recolector_activo:
+            gc.enable()
+
+
+def es_catalogo_fragmentado(ruta: str) -> bool:
+    """True si la ruta es un directorio con manifiesto."""
+    return os.path.isfile(os.path.join(ruta, MANIFIESTO))
+
+
+def leer_manifiesto(directorio: str) -> Dict:
+    """Lee y valida el manifiesto de un catálogo fragmentado."""
+    with open(os.path.join(directorio, MANIFIESTO), 'r', encoding='utf-8') as f:
+        manifiesto = json.load(f)
+    if manifiesto.get('version') != VERSION_FRAGMENTOS:
+        raise ValueError(
+            f"Versión de catálogo fragmentado no soportada: {manifiesto.get('version')!r}"
+        )
+    return manifiesto
+
+
+def archivos_propios(directorio: str, ids: Iterable[int]) -> Dict[str, List[int]]:
+    """
+    Agrupa estrellas por el archivo de su constelación propia (el único que
+    guarda sus datos). Los IDs que no están en el catálogo se omiten.
+
+    Returns:
+        {ruta del archivo: ids}
+    """
+    manifiesto = leer_manifiesto(directorio)
+    indice = np.load(os.path.join(directorio, manifiesto['indice']))
+    ids_catalogo, propias = indice[:, 0], indice[:, 1]
+    por_archivo: Dict[str, List[int]] = {}
+    for star_id in ids:
+        i = int(np.searchsorted(ids_catalogo, star_id))
+        if i < len(ids_catalogo) and ids_catalogo[i] == star_id:
+            archivo = manifiesto['constelaciones'][int(propias[i])]['archivo']
+            por_archivo.setdefault(os.path.join(directorio, archivo), []).append(star_id)
+    return por_archivo
+
+
+def _estrella_a_json(estrella: Estrella, enlaces: List[Dict]) -> Dict:
+    """Estrella con el formato de data/config.json (más sus constelaciones)."""
+    return {
+        'id': estrella.id,
+        'label': estrella.label,
+        'coordenates': {'x': estrella.x, 'y': estrella.y},
+        'radius': estrella.radius,
+        'timeToEat': estrella.time_to_eat,
+        'stayDuration': estrella.stay_duration,
+        'amountOfEnergy': estrella.amount_of_energy,
+        'healthImpact': estrella.health_impact,
+        'lifeTimeImpact': estrella.life_time_impact,
+        'researchEnergyCost': estrella.research_energy_cost,
+        'hypergiant': estrella.hipergigante,
+        'constellations': list(estrella.constelaciones),
+        'linkedTo': enlaces,
+    }
+
+
+def exportar_catalogo_fragmentado(
+    grafo: GrafoConstelaciones,
+    directorio: str,
+    ajustes: Optional[Dict] = None,
+    verbose: bool = True,
+) -> Dict:
+    """
+    Escribe un grafo como catálogo fragmentado.
+
+    Args:
+        grafo: Grafo completo (p. ej. de cargar_grafo_desde_json)
+        directorio: Directorio destino (se crea si no existe)
+        ajustes: Claves de primer nivel del config (energía, pasto, edades)
+        verbose: Si True, imprime un resumen
+
+    Returns:
+        El manifiesto escrito
+    """
+    nombres = list(grafo.constelaciones)
+    posicion_nombre = {nombre: i for i, nombre in enumerate(nombres)}
+
+    # Constelación propia de cada estrella: la de su primera aparición
+    propia: Dict[int, int] = {}
+    for star_id, estrella in grafo.estrellas.items():
+        if not estrella.constelaciones:
+            raise ValueError(f"La estrella {star_id} no pertenece a ninguna constelación")
+        propia[star_id] = posicion_nombre[estrella.constelaciones[0]]
+
+    estrellas_por_fragmento: List[List[Dict]] = [[] for _ in nombres]
+    cruzadas_por_fragmento: List[List[list]] = [[] for _ in nombres]
+    for star_id, estrella in grafo.estrellas.items():
+        fragmento = propia[star_id]
+        enlaces = []
+        for posicion, (vecino, distancia) in enumerate(grafo.graph[star_id].neighbors.items()):
+            if propia[vecino.id] == fragmento:
+                enlaces.append({'starId': vecino.id, 'distance': distancia})
+            else:
+                cruzadas_por_fragmento[fragmento].append([star_id, vecino.id, distancia, posicion])
+        estrellas_por_fragmento[fragmento].append(_estrella_a_json(estrella, enlaces))
+
+    os.makedirs(os.path.join(directorio, DIRECTORIO_CONSTELACIONES), exist_ok=True)
+
+    fragmentos = []
+    with open(os.path.join(directorio, ARISTAS), 'wb') as archivo_aristas:
+        for i, nombre in enumerate(nombres):
+            archivo = f"{DIRECTORIO_CONSTELACIONES}/{i:05d}.json"
+            estrellas = estrellas_por_fragmento[i]
+            with open(os.path.join(directorio, archivo), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'name': nombre,
+                    'miembros': list(grafo.constelaciones[nombre]),
+                    'starts': estrellas,
+                }, f, ensure_ascii=False)
+
+            aristas = None
+            if cruzadas_por_fragmento[i]:
+                linea = (json.dumps({'constelacion': i, 'enlaces': cruzadas_por_fragmento[i]}) + '\n').encode('utf-8')
+                aristas = [archivo_aristas.tell(), len(linea)]
+                archivo_aristas.write(linea)
+
+            limites = None
+            if estrellas:
+                xs = [e['coordenates']['x'] for e in estrellas]
+                ys = [e['coordenates']['y'] for e in estrellas]
+                limites = [min(xs), min(ys), max(xs), max(ys)]
+
+            fragmentos.append({
+                'name': nombre,
+                'archivo': archivo,
+                'estrellas': len(estrellas),
+                'limites': limites,
+                'aristas': aristas,
+            })
+
+    indice = np.array(sorted(propia.items()), dtype=np.int64).reshape(-1, 2)
+    np.save(os.path.join(directorio, INDICE), indice)
+
+    # El manifiesto se escribe al final: un catálogo a medio exportar no
+    # tiene manifiesto y no se puede abrir
+    manifiesto = {
+        'version': VERSION_FRAGMENTOS,
+        'ajustes': ajustes or {},
+        'indice': INDICE,
+        'aristas': ARISTAS,
+        'constelaciones': fragmentos,
+    }
+    temporal = os.path.join(directorio, MANIFIESTO + '.tmp')
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, indent=2, ensure_ascii=False)
+    os.replace(temporal, os.path.join(directorio, MANIFIESTO))
+
+    if verbose:
+        cruzadas = sum(len(c) for c in cruzadas_por_fragmento)
+        print(f"🗂️  Catálogo fragmentado: {len(nombres)} constelaciones, "
+              f"{len(propia)} estrellas, {cruzadas} aristas entre constelaciones → {directorio}")
+    return manifiesto
+
+
+def fragmentar_catalogo(ruta_config: str, directorio: str, verbose: bool = True) -> Dict:
+    """
+    Convierte un data/config.json en catálogo fragmentado.
+    Lee el JSON de forma incremental (utils/json_stream.py).
+    """
+    grafo = GrafoCompilado.desde_registros(iterar_estrellas(ruta_config), verbose=False).a_grafo()
+    return exportar_catalogo_fragmentado(grafo, directorio, leer_ajustes(ruta_config), verbose)
+
+
+class GrafoFragmentado(GrafoConstelaciones):
+    """
+    GrafoConstelaciones que carga cada constelación la primera vez que se
+    consulta una de sus estrellas.
+
+    get_vertex(), obtener_estrella() y obtener_constelacion() cargan la
+    constelación que haga falta; get_vertices() devuelve todos los IDs del
+    catálogo sin cargar nada. Un vecino de otra constelación todavía no
+    cargada es un Vertex sin datos hasta que se consulta.
+
+    Lo que recorre directamente self.estrellas o self.graph (p. ej.
+    obtener_hipergigantes o InstantaneaGrafo) solo ve lo ya cargado:
+    llamar antes a cargar_todo() si se necesita el universo completo.
+    """
+
+    def __init__(self, directorio: str):
+        super().__init__()
+        self.directorio = directorio
+        manifiesto = leer_manifiesto(directorio)
+        self.ajustes: Dict = manifiesto['ajustes']
+        self.fragmentos: List[Dict] = manifiesto['constelaciones']
+        self._ruta_aristas = os.path.join(directorio, manifiesto['aristas'])
+
+        indice = np.load(os.path.join(directorio, manifiesto['indice']))
+        self._ids = np.ascontiguousarray(indice[:, 0])
+        self._propias = np.ascontiguousarray(indice[:, 1])
+        self._posicion_nombre = {f['name']: i for i, f in enumerate(self.fragmentos)}
+        self._cargados = set()
+        # Constelaciones cuyas vecinas ya se cargaron (cargar_region con vecinos)
+        self._vecinos_cargados = set()
+        # Orden de cada estrella en el catálogo completo: (constelación propia,
+        # posición) empaquetados en un entero (ver ordenar_estrellas)
+        self._orden: Dict[int, int] = {}
+        self._orden_maximo = -1
+        self._desordenadas = False
+        # Ediciones guardadas que aún no están en los archivos (diario)
+        self._ediciones: Dict[int, Dict] = {}
+
+        # Los nombres se conocen desde el inicio; los miembros, al cargar
+        self.constelaciones = {f['name']: [] for f in self.fragmentos}
+
+    # ------------------------------------------------------------------
+    # Consultas (cargan lo necesario)
+    # ------------------------------------------------------------------
+
+    def get_vertex(self, id):
+        if id not in self.estrellas:
+            self._cargar_estrella(id)
+        return self.graph.get(id)
+
+    def get_vertices(self):
+        return self._ids.tolist()
+
+    def obtener_estrella(self, id: int) -> Optional[Estrella]:
+        estrella = self.estrellas.get(id)
+        if estrella is None and self._cargar_estrella(id):
+            estrella = self.estrellas.get(id)
+        return estrella
+
+    def obtener_constelacion(self, nombre: str) -> List[int]:
+        fragmento = self._posicion_nombre.get(nombre)
+        if fragmento is not None and fragmento not in self._cargados:
+            self.cargar_fragmento(fragmento)
+        return self.constelaciones.get(nombre, [])
+
+    @property
+    def constelaciones_cargadas(self) -> List[str]:
+        """Nombres de las constelaciones ya cargadas."""
+        return [self.fragmentos[i]['name'] for i in sorted(self._cargados)]
+
+    def _cargar_estrella(self, star_id) -> bool:
+        """Carga la constelación propia de una estrella. False si no existe o ya estaba."""
+        i = int(np.searchsorted(self._ids, star_id))
+        if i >= len(self._ids) or self._ids[i] != star_id:
+            return False
+        fragmento = int(self._propias[i])
+        if fragmento in self._cargados:
+            return False
+        self.cargar_fragmento(fragmento)
+        return True
+
+    # ------------------------------------------------------------------
+    # Carga
+    # ------------------------------------------------------------------
+
+    def _leer_fragmento(self, fragmento: int) -> Tuple[Dict, List[list]]:
+        """Lee del disco una constelación y sus aristas hacia otras."""
+        info = self.fragmentos[fragmento]
+        with open(os.path.join(self.directorio, info['archivo']), 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        cruzadas = []
+        if info['aristas']:
+            inicio, longitud = info['aristas']
+            with open(self._ruta_aristas, 'rb') as f:
+                f.seek(inicio)
+                cruzadas = json.loads(f.read(longitud))['enlaces']
+        return datos, cruzadas
+
+    def registrar_ediciones(self, cambios: Dict[int, Dict]) -> None:
+        """
+        Registra ediciones guardadas que los archivos de las constelaciones
+        todavía no tienen ({id: campos con las claves del JSON}, p. ej. el
+        diario de utils/config_saver.py). Se aplican por encima de lo leído
+        cada vez que se carga o recarga la constelación de esas estrellas;
+        las estrellas ya cargadas no se tocan.
+        """
+        for star_id, campos in cambios.items():
+            self._ediciones.setdefault(star_id, {}).update(campos)
+
+    def _vertice(self, star_id) -> Vertex:
+        vertice = self.graph.get(star_id)
+        if vertice is None:
+            vertice = self.graph[star_id] = Vertex(star_id)
+        return vertice
+
+    def _aplicar_fragmento(self, fragmento: int, datos: Dict, cruzadas: List[list]) -> None:
+        """Incorpora al grafo una constelación leída (o la actualiza si se recarga)."""
+        # PASO 1: estrellas propias. Si ya existían (recarga) se actualizan
+        # en su lugar para no invalidar referencias (editor, simulador)
+        pendientes = []
+        for posicion_estrella, star_data in enumerate(datos['starts']):
+            star_id = star_data['id']
+            if star_id in self._ediciones:
+                star_data = {**star_data, **self._ediciones[star_id]}
+            coords = star_data['coordenates']
+            valores = dict(
+                label=star_data['label'],
+                x=coords['x'],
+                y=coords['y'],
+                radius=star_data['radius'],
+                constelaciones=list(star_data['constellations']),
+                hipergigante=star_data['hypergiant'],
+                time_to_eat=star_data['timeToEat'],
+                stay_duration=star_data['stayDuration'],
+                amount_of_energy=star_data['amountOfEnergy'],
+                health_impact=star_data['healthImpact'],
+                life_time_impact=star_data['lifeTimeImpact'],
+                research_energy_cost=star_data['researchEnergyCost'],
+            )
+            estrella = self.estrellas.get(star_id)
+            if estrella is None:
+                estrella = self.estrellas[star_id] = Estrella(id=star_id, **valores)
+                orden = fragmento << 32 | posicion_estrella
+                self._orden[star_id] = orden
+                if orden < self._orden_maximo:
+                    self._desordenadas = True
+                else:
+                    self._orden_maximo = orden
+            else:
+                for atributo, valor in valores.items():
+                    setattr(estrella, atributo, valor)
+
+            # Como en agregar_estrella, vértice y estrella comparten la lista
+            vertice = self._vertice(star_id)
+            vertice.x, vertice.y = estrella.x, estrella.y
+            vertice.constelaciones = estrella.constelaciones
+            vertice.neighbors.clear()
+            pendientes.append((vertice, star_data['linkedTo']))
+
+        # PASO 2: vecinos, intercalando las aristas entre constelaciones en
+        # su posición original
+        por_origen: Dict[int, List[list]] = {}
+        for arista in cruzadas:
+            por_origen.setdefault(arista[0], []).append(arista)
+        for vertice, enlaces in pendientes:
+            externas = por_origen.get(vertice.id, ())
+            propias = iter(enlaces)
+            k = 0
+            for posicion in range(len(enlaces) + len(externas)):
+                if k < len(externas) and externas[k][3] == posicion:
+                    _, destino, distancia, _ = externas[k]
+                    k += 1
+                else:
+                    enlace = next(propias)
+                    destino, distancia = enlace['starId'], enlace['distance']
+                vertice.add_neighbor(self._vertice(destino), distancia)
+
+        self.constelaciones[datos['name']] = list(datos['miembros'])
+        self._cargados.add(fragmento)
+        self.bump_version()
+
+    def ordenar_estrellas(self) -> None:
+        """
+        Devuelve self.estrellas al orden del catálogo completo (el que da
+        cargar_grafo_desde_json) si una carga lo alteró.
+
+        cargar_constelaciones() y sus variantes ya lo hacen; las cargas de
+        una sola constelación que disparan las consultas no, para no
+        reordenar en cada paso de una búsqueda. Quien dependa del orden de
+        self.estrellas (p. ej. el orden de dibujado) debe llamarlo antes.
+        """
+        if not self._desordenadas:
+            return
+        ordenadas = sorted(self.estrellas.items(), key=lambda item: self._orden[item[0]])
+        self.estrellas.clear()
+        self.estrellas.update(ordenadas)
+        self._desordenadas = False
+
+    def cargar_fragmento(self, fragmento: int) -> None:
+        """Carga (o recarga) una constelación por su posición en el manifiesto."""
+        with _sin_recolector():
+            self._aplicar_fragmento(fragmento, *self._leer_fragmento(fragmento))
+
+    def cargar_constelaciones(
+        self,
+        nombres: Optional[Iterable[str]] = None,
+        hilos: int = 4,
+        recargar: bool = False,
+    ) -> int:
+        """
+        Carga varias constelaciones, leyendo y decodificando los archivos en
+        paralelo. Se incorporan al grafo en el orden del manifiesto.
+
+        Args:
+            nombres: Constelaciones a cargar (None = todas)
+            hilos: Hilos de lectura
+            recargar: Si True, vuelve a leer también las ya cargadas
+
+        Returns:
+            Número de constelaciones leídas
+        """
+        if nombres is None:
+            fragmentos: Sequence[int] = range(len(self.fragmentos))
+        else:
+            fragmentos = sorted(self._posicion_nombre[nombre] for nombre in nombres)
+        fragmentos = [i for i in fragmentos if recargar or i not in self._cargados]
+        if not fragmentos:
+            return 0
+        if hilos <= 1 or len(fragmentos) == 1:
+            with _sin_recolector():
+                for fragmento in fragmentos:
+                    self._aplicar_fragmento(fragmento, *self._leer_fragmento(fragmento))
+        else:
+            with _sin_recolector(), ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+                for fragmento, leido in zip(fragmentos, ejecutor.map(self._leer_fragmento, fragmentos)):
+                    self._aplicar_fragmento(fragmento, *leido)
+        self.ordenar_estrellas()
+        return len(fragmentos)
+
+    def cargar_todo(self, hilos: int = 4) -> int:
+        """Carga todas las constelaciones que falten."""
+        return self.cargar_constelaciones(None, hilos)
+
+    def recargar(self, nombres: Optional[Iterable[str]] = None, hilos: int = 4) -> int:
+        """Vuelve a leer del disco constelaciones ya cargadas (None = todas las cargadas)."""
+        if nombres is None:
+            nombres = self.constelaciones_cargadas
+        return self.cargar_constelaciones(nombres, hilos, recargar=True)
+
+    def cargar_region(
+        self,
+        x_min: float,
+        y_min: float,
+        x_max: float,
+        y_max: float,
+        hilos: int = 4,
+        vecinos: bool = False,
+    ) -> int:
+        """
+        Carga las constelaciones cuyas estrellas propias caen (según los
+        límites del manifiesto) en el rectángulo dado.
+
+        Args:
+            hilos: Hilos de lectura
+            vecinos: Si True, carga también las constelaciones de los
+                     vecinos de esas estrellas (un solo nivel), para que las
+                     aristas que salen del rectángulo tengan sus dos extremos
+
+        Returns:
+            Número de constelaciones leídas
+        """
+        fragmentos = [
+            i for i, f in enumerate(self.fragmentos)
+            if f['limites'] is not None
+            and f['limites'][0] <= x_max and f['limites'][2] >= x_min
+            and f['limites'][1] <= y_max and f['limites'][3] >= y_min
+        ]
+        leidas = self.cargar_constelaciones([self.fragmentos[i]['name'] for i in fragmentos], hilos)
+        if vecinos:
+            pendientes = [i for i in fragmentos if i not in self._vecinos_cargados]
+            self._vecinos_cargados.update(pendientes)
+            leidas += self.cargar_constelaciones(self._constelaciones_vecinas(pendientes), hilos)
+        return leidas
+
+    def _constelaciones_vecinas(self, fragmentos: Iterable[int]) -> List[str]:
+        """Constelaciones propias de los vecinos aún sin cargar de las estrellas de `fragmentos`."""
+        faltan = set()
+        for fragmento in fragmentos:
+            for star_id in self.constelaciones[self.fragmentos[fragmento]['name']]:
+                vertice = self.graph.get(star_id)
+                if vertice is None:
+                    continue
+                for vecino in vertice.neighbors:
+                    if vecino.id not in self.estrellas:
+                        faltan.add(vecino.id)
+        if not faltan:
+            return []
+
+        ids = np.fromiter(faltan, dtype=self._ids.dtype, count=len(faltan))
+        posiciones = np.minimum(np.searchsorted(self._ids, ids), len(self._ids) - 1)
+        existen = self._ids[posiciones] == ids
+        return [self.fragmentos[int(i)]['name'] for i in np.unique(self._propias[posiciones[existen]])]
+
+def cargar_catalogo_fragmentado(directorio: str) -> GrafoFragmentado:
+    """Abre un catálogo fragmentado sin cargar ninguna constelación."""
+    return GrafoFragmentado(directorio)
@@ -3,9 +3,9 @@ Paneles de acciones de la interfaz.
 Responsabilidad: Gestionar botones de acción y estrellas alcanzables.
 """
 
-import pygame
 from views.config import (Colors, Fonts, Spacing, Icons, ButtonSizes)
 from views.components import Panel, Button
+from views.font_cache import get_font
 
 
 class ActionsPanel:
@@ -25,8 +25,8 @@ class ActionsPanel:
         self.panel = Panel(x, y, width, height, "🎮 Acciones")
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, Fonts.SUBTITLE_SIZE)
-        self.button_font = pygame.font.Font(None, Fonts.NORMAL_SIZE)
+        self.title_font = get_font(Fonts.SUBTITLE_SIZE)
+        self.button_font = get_font(Fonts.NORMAL_SIZE)
         
         # Callbacks
         self.on_travel = on_travel
@@ -116,6 +116,14 @@ class ActionsPanel:
         for button in self.buttons:
             button.update(mouse_pos, mouse_pressed)
     
+    def bounds(self):
+        """Rectángulo del panel y sus botones (los últimos salen del panel)."""
+        return self.panel.rect.unionall([button.rect for button in self.buttons])
+    
+    def render_key(self):
+        """Estado de los botones: el panel se repinta solo si cambia."""
+        return tuple((b.text, b.enabled, b.hovered, b.pressed) for b in self.buttons)
+    
     def draw(self, screen):
         """Dibuja el panel."""
         self.panel.draw(screen, self.title_font)
@@ -138,8 +146,8 @@ class ReachableStarsPanel:
         self.panel = Panel(x, y, width, height, "🌟 Estrellas Alcanzables")
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, Fonts.SUBTITLE_SIZE)
-        self.normal_font = pygame.font.Font(None, Fonts.SMALL_SIZE)
+        self.title_font = get_font(Fonts.SUBTITLE_SIZE)
+        self.normal_font = get_font(Fonts.SMALL_SIZE)
         
         self.reachable = []
         self.content_x = x + Spacing.PANEL_PADDING
@@ -154,6 +162,14 @@ class ReachableStarsPanel:
         self.reachable = reachable_list
         self.scroll_offset = 0
     
+    def render_key(self):
+        """Estrellas visibles en la lista: el panel se repinta solo si cambian."""
+        visibles = self.reachable[self.scroll_offset:self.scroll_offset + self.max_visible]
+        return (
+            bool(self.reachable),
+            tuple((s.get('label', f"Estrella {s['id']}"), s['distancia']) for s in visibles),
+        )
+    
     def draw(self, screen):
         """Dibuja el panel."""
         self.panel.draw(screen, self.title_font)
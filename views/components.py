@@ -197,31 +197,39 @@ class Tooltip:
         """Oculta el tooltip."""
         self.visible = False
     
-    def draw(self, screen, font):
-        """Dibuja el tooltip."""
+    def bounds(self, screen_size, font):
+        """Rectángulo que ocupa el tooltip (None si está oculto)."""
         if not self.visible or not self.text:
-            return
-        
-        # Renderizar texto
-        lines = self.text.split('\n')
-        surfaces = [font.render(line, True, Colors.TEXT_PRIMARY) for line in lines]
+            return None
         
         # Calcular tamaño del tooltip
-        max_width = max(s.get_width() for s in surfaces)
-        total_height = sum(s.get_height() for s in surfaces) + (len(surfaces) - 1) * 5
+        sizes = [font.size(line) for line in self.text.split('\n')]
+        max_width = max(w for w, _ in sizes)
+        total_height = sum(h for _, h in sizes) + (len(sizes) - 1) * 5
         
         width = max_width + self.padding * 2
         height = total_height + self.padding * 2
         
         # Ajustar posición para que no salga de la pantalla
         x, y = self.position
-        if x + width > screen.get_width():
-            x = screen.get_width() - width - 10
-        if y + height > screen.get_height():
-            y = screen.get_height() - height - 10
+        if x + width > screen_size[0]:
+            x = screen_size[0] - width - 10
+        if y + height > screen_size[1]:
+            y = screen_size[1] - height - 10
+        return pygame.Rect(x, y, width, height)
+    
+    def draw(self, screen, font):
+        """Dibuja el tooltip."""
+        bg_rect = self.bounds(screen.get_size(), font)
+        if bg_rect is None:
+            return
+        x, y = bg_rect.topleft
+        
+        # Renderizar texto
+        lines = self.text.split('\n')
+        surfaces = [font.render(line, True, Colors.TEXT_PRIMARY) for line in lines]
         
         # Dibujar fondo
-        bg_rect = pygame.Rect(x, y, width, height)
         pygame.draw.rect(screen, Colors.PANEL_BG, bg_rect, border_radius=5)
         pygame.draw.rect(screen, Colors.PANEL_BORDER, bg_rect, 2, border_radius=5)
         
@@ -262,16 +270,29 @@ class Notification:
             if notif['time'] <= 0:
                 self.notifications.remove(notif)
     
-    def draw(self, screen, font):
-        """Dibuja las notificaciones."""
+    def _layout(self, font):
+        """Posición del texto de cada notificación: (notificación, text_rect)."""
         y_offset = 0
         for notif in self.notifications:
+            text_rect = pygame.Rect((0, 0), font.size(notif['text']))
+            text_rect.centerx = self.x + self.width // 2
+            text_rect.top = self.y + y_offset
+            yield notif, text_rect
+            y_offset += text_rect.height + 15
+    
+    def bounds(self, font):
+        """Rectángulos que ocupan las notificaciones (con su fondo)."""
+        return [text_rect.inflate(20, 10) for _, text_rect in self._layout(font)]
+    
+    def draw(self, screen, font):
+        """Dibuja las notificaciones."""
+        for notif, text_rect in self._layout(font):
             # Crear superficie con alpha
-            text_surface = font.render(notif['text'], True, notif['color'])
+            # Copia: el texto renderizado puede venir del caché compartido
+            text_surface = font.render(notif['text'], True, notif['color']).copy()
             text_surface.set_alpha(notif['alpha'])
             
             # Fondo semi-transparente
-            text_rect = text_surface.get_rect(centerx=self.x + self.width // 2, top=self.y + y_offset)
             bg_rect = text_rect.inflate(20, 10)
             
             bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
@@ -280,5 +301,3 @@ class Notification:
             
             screen.blit(bg_surface, bg_rect)
             screen.blit(text_surface, text_rect)
-            
-            y_offset += text_rect.height + 15
@@ -88,6 +88,10 @@ class Fonts:
     SMALL_SIZE = 14
     TINY_SIZE = 12
 
+# Registro de fuentes y caché de textos (views/font_cache.py)
+class FontCache:
+    MAX_TEXT_BYTES = 8 * 1024 * 1024    # Memoria máxima de textos renderizados
+
 # Espaciado
 class Spacing:
     PADDING = 20
@@ -149,6 +153,32 @@ class GraphScale:
     
     CONNECTION_WIDTH = 2                # Grosor de conexiones
     ACTIVE_CONNECTION_WIDTH = 4         # Grosor de camino activo
+    CONNECTION_LAYER_MARGIN = 40        # Margen de la capa de conexiones (etiquetas)
+    
+    SPATIAL_CELL_SIZE = 64              # Celda del índice espacial de estrellas (px)
+    CULL_MARGIN = 80                    # Margen fuera de pantalla que aún se dibuja (brillo, etiquetas)
+    
+    MIN_ZOOM = 0.05                     # Zoom mínimo (rueda del mouse sobre el grafo)
+    MAX_ZOOM = 8.0                      # Zoom máximo
+    ZOOM_STEP = 1.2                     # Factor por cada paso de la rueda
+
+# Nivel de detalle según el zoom (views/level_of_detail.py)
+class LevelOfDetail:
+    CLUSTER_SPACING = 20                # Separación aparente (px) bajo la cual se dibujan grupos
+    LABEL_SPACING = 60                  # Separación aparente (px) bajo la cual se ocultan las distancias
+    CLUSTER_TILE = 24                   # Casilla de agrupación en pantalla (px, aproximado)
+    MIN_CLUSTER_RADIUS = 3              # Radio del disco de un grupo de una estrella
+    MAX_CLUSTER_RADIUS = 14
+
+# Perfilador de frames (views/frame_profiler.py)
+class Profiling:
+    HISTORY_FRAMES = 600                # Frames guardados para exportar (~10 s)
+    WINDOW_FRAMES = 120                 # Frames usados por la capa superpuesta
+    FRAME_BUDGET_MS = 1000 / FPS        # Presupuesto por frame
+    HISTOGRAM_BIN_MS = 2                # Ancho de cada barra del histograma
+    HISTOGRAM_BINS = 17                 # La última barra junta todo lo mayor
+    OVERLAY_WIDTH = 300
+    TRACE_PREFIX = "frame_trace_"       # Archivo exportado: frame_trace_<fecha>.json
 
 # Iconos y símbolos (usando emojis/caracteres)
 class Icons:
@@ -6,6 +6,7 @@ Responsabilidad: Dibujar las conexiones (aristas) del grafo.
 import pygame
 import math
 from views.config import Colors, GraphScale
+from views.font_cache import get_font
 
 
 class ConnectionRenderer:
@@ -67,7 +68,7 @@ class ConnectionRenderer:
         
         # Crear el texto
         font_size = 18 if is_path else 14
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         
         # REQUERIMIENTO 0.5: Color rojo para caminos bloqueados
         if is_blocked:
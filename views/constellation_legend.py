@@ -5,6 +5,7 @@ Muestra qué color corresponde a cada constelación.
 
 import pygame
 from views.config import Colors, Fonts, Spacing
+from views.font_cache import get_font
 
 
 class ConstellationLegend:
@@ -24,12 +25,27 @@ class ConstellationLegend:
         
         # Fuentes
         try:
-            self.font_title = pygame.font.Font(None, Fonts.SUBTITLE_SIZE)
-            self.font_item = pygame.font.Font(None, Fonts.SMALL_SIZE)
+            self.font_title = get_font(Fonts.SUBTITLE_SIZE)
+            self.font_item = get_font(Fonts.SMALL_SIZE)
         except:
             self.font_title = pygame.font.SysFont('Arial', Fonts.SUBTITLE_SIZE)
             self.font_item = pygame.font.SysFont('Arial', Fonts.SMALL_SIZE)
     
+    def rect(self):
+        """Rectángulo que ocupa la leyenda (alto 0 si no hay constelaciones)."""
+        cantidad = len(self.grafo.constelaciones)
+        if not cantidad:
+            return pygame.Rect(self.x, self.y, self.width, 0)
+        panel_height = min(
+            self.max_height,
+            60 + cantidad * 25 + Spacing.PADDING * 2
+        )
+        return pygame.Rect(self.x, self.y, self.width, panel_height)
+    
+    def render_key(self):
+        """Constelaciones y su cantidad de estrellas: se repinta solo si cambian."""
+        return tuple(sorted((nombre, len(ids)) for nombre, ids in self.grafo.constelaciones.items()))
+    
     def draw(self, screen):
         """Dibuja la leyenda de constelaciones."""
         constelaciones = sorted(self.grafo.listar_constelaciones())
@@ -38,12 +54,8 @@ class ConstellationLegend:
             return
         
         # Fondo del panel
-        panel_height = min(
-            self.max_height,
-            60 + len(constelaciones) * 25 + Spacing.PADDING * 2
-        )
-        
-        panel_rect = pygame.Rect(self.x, self.y, self.width, panel_height)
+        panel_rect = self.rect()
+        panel_height = panel_rect.height
         pygame.draw.rect(screen, Colors.PANEL_BG, panel_rect)
         pygame.draw.rect(screen, Colors.PANEL_BORDER, panel_rect, 2)
         
@@ -119,9 +131,10 @@ class ScaleLegend:
         self.x = x
         self.y = y
         self.width = width
+        self.rect = pygame.Rect(x, y, width, 80)
         
         try:
-            self.font = pygame.font.Font(None, Fonts.SMALL_SIZE)
+            self.font = get_font(Fonts.SMALL_SIZE)
         except:
             self.font = pygame.font.SysFont('Arial', Fonts.SMALL_SIZE)
     
@@ -134,9 +147,8 @@ class ScaleLegend:
             board_height_um: Alto del tablero en unidades de medida
         """
         # Fondo
-        panel_rect = pygame.Rect(self.x, self.y, self.width, 80)
-        pygame.draw.rect(screen, Colors.PANEL_BG, panel_rect)
-        pygame.draw.rect(screen, Colors.PANEL_BORDER, panel_rect, 2)
+        pygame.draw.rect(screen, Colors.PANEL_BG, self.rect)
+        pygame.draw.rect(screen, Colors.PANEL_BORDER, self.rect, 2)
         
         # Título
         title = "Escala del Tablero"
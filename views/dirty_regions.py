@@ -0,0 +1,112 @@
+"""
+Compositor de regiones sucias de la ventana.
+Responsabilidad: Repintar y enviar a la pantalla solo lo que cambió
+desde el frame anterior.
+
+- DirtyRegions junta los rectángulos que cambiaron en el frame. El frame
+  se repinta recortado (set_clip) a la unión de esos rectángulos y solo
+  ellos se pasan a pygame.display.update(rects). Si no cambió nada, no se
+  dibuja ni se presenta nada.
+- CachedLayer guarda la imagen de un panel y solo lo vuelve a pintar
+  cuando cambia su clave (los datos que muestra). El resto de los frames
+  es un blit.
+
+Uso en cada frame:
+    1. Calcular qué cambió: layer.check(clave, rect) y dirty.add(rect)
+    2. screen.set_clip(dirty.clip()) y dibujar todo en orden (los paneles
+       con layer.draw(screen, pintar))
+    3. dirty.present()
+
+Las capas se copian de la pantalla justo después de pintarlas, así que
+sus píxeles transparentes (esquinas redondeadas) guardan lo que hay
+debajo: el fondo liso de la ventana.
+"""
+
+from typing import List, Optional
+
+import pygame
+
+
+_UNSET = object()
+
+
+class CachedLayer:
+    """Imagen de un panel, repintada solo cuando cambia su clave."""
+
+    def __init__(self):
+        self.surface = None
+        self.rect = None
+        self.key = _UNSET
+        self._pending = None
+
+    def check(self, key, rect) -> bool:
+        """
+        Registra la clave y el rectángulo del frame actual.
+
+        Returns:
+            True si el panel cambió: su rectángulo debe marcarse como sucio
+            antes de dibujar
+        """
+        rect = pygame.Rect(rect)
+        self._pending = (key, rect)
+        return key != self.key or rect != self.rect
+
+    def draw(self, screen, paint):
+        """
+        Dibuja la capa: paint(screen) si cambió (y guarda el resultado),
+        o la imagen guardada si no.
+        """
+        key, rect = self._pending
+        if key != self.key or rect != self.rect:
+            paint(screen)
+            area = rect.clip(screen.get_rect())
+            self.surface = screen.subsurface(area).copy() if area.width and area.height else None
+            self.key = key
+            self.rect = rect
+        elif self.surface is not None:
+            screen.blit(self.surface, self.rect)
+
+
+class DirtyRegions:
+    """Rectángulos de la ventana que cambiaron en el frame actual."""
+
+    def __init__(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.rects: List[pygame.Rect] = []
+        # El primer frame se pinta completo
+        self.full = True
+        # Píxeles enviados a la pantalla en el último frame
+        self.last_area = 0
+
+    def invalidate(self):
+        """Repinta y presenta la ventana completa en este frame."""
+        self.full = True
+
+    def add(self, rect):
+        """Marca un rectángulo como sucio."""
+        if self.full:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def clip(self) -> Optional[pygame.Rect]:
+        """Región a repintar en este frame, o None si no cambió nada."""
+        if self.full:
+            return self.screen_rect.copy()
+        if not self.rects:
+            return None
+        return self.rects[0].unionall(self.rects[1:])
+
+    def present(self):
+        """Envía a la pantalla las regiones sucias y empieza un frame nuevo."""
+        if self.full:
+            pygame.display.flip()
+            self.last_area = self.screen_rect.width * self.screen_rect.height
+        elif self.rects:
+            pygame.display.update(self.rects)
+            self.last_area = sum(r.width * r.height for r in self.rects)
+        else:
+            self.last_area = 0
+        self.rects = []
+        self.full = False
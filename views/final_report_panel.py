@@ -12,6 +12,7 @@ import pygame
 from typing import Optional
 from backend.constellation import GrafoConstelaciones
 from backend.simulator import SimuladorViaje
+from views.font_cache import get_font
 
 
 class FinalReportPanel:
@@ -45,10 +46,10 @@ class FinalReportPanel:
         self.warning_color = (255, 200, 100)
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, 36)
-        self.subtitle_font = pygame.font.Font(None, 26)
-        self.text_font = pygame.font.Font(None, 22)
-        self.small_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(36)
+        self.subtitle_font = get_font(26)
+        self.text_font = get_font(22)
+        self.small_font = get_font(18)
         
         # Botones
         self.close_button_rect = pygame.Rect(x + width - 45, y + 10, 35, 35)
@@ -0,0 +1,116 @@
+"""
+Registro de fuentes y caché de textos renderizados.
+Responsabilidad: Que la interfaz no cree fuentes ni vuelva a renderizar
+el mismo texto en cada frame.
+
+- get_font(size, face=None): una sola fuente por (face, size) para toda la
+  interfaz. Devuelve un CachedFont, que se usa igual que pygame.font.Font
+- CachedFont.render(): pasa por text_cache, un caché LRU de Surfaces de
+  texto por (fuente, texto, antialias, color, fondo) acotado en bytes
+
+Las Surfaces devueltas son compartidas: quien necesite modificarlas
+(set_alpha, fill, dibujar encima) debe trabajar sobre una copia.
+
+Uso:
+    font = get_font(Fonts.SMALL_SIZE)
+    screen.blit(font.render("Hola", True, Colors.TEXT_PRIMARY), (x, y))
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+from views.config import FontCache
+
+
+class TextCache:
+    """Caché LRU de textos renderizados, acotado por los bytes de sus Surfaces."""
+
+    def __init__(self, max_bytes=FontCache.MAX_TEXT_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()  # clave -> Surface, del menos al más reciente
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Retorna el texto renderizado con `font` (un CachedFont)."""
+        key = (font.key, text, antialias, color, background)
+        try:
+            surface = self._entries.get(key)
+        except TypeError:
+            # pygame.Color no es hashable: se renderiza sin caché
+            return font.font.render(text, antialias, color, background)
+
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.font.render(text, antialias, color, background)
+        size = surface.get_pitch() * surface.get_height()
+        if size <= self.max_bytes:
+            self._entries[key] = surface
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.get_pitch() * evicted.get_height()
+                self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Vacía el caché (los contadores se conservan)."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict:
+        return {
+            'entradas': len(self._entries),
+            'bytes': self.bytes,
+            'aciertos': self.hits,
+            'fallos': self.misses,
+            'desalojos': self.evictions,
+        }
+
+
+text_cache = TextCache()
+
+
+class CachedFont:
+    """
+    Fuente compartida del registro. render() pasa por text_cache; el resto
+    de los métodos (size, get_height, get_linesize...) son los de la
+    pygame.font.Font original.
+    """
+
+    __slots__ = ('font', 'key')
+
+    def __init__(self, font, key):
+        self.font = font
+        self.key = key
+
+    def render(self, text, antialias, color, background=None):
+        return text_cache.render(self, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+_fonts: Dict[Tuple[Optional[str], int], CachedFont] = {}
+
+
+def get_font(size, face=None) -> CachedFont:
+    """
+    Fuente compartida de un tamaño.
+
+    Args:
+        size: Tamaño en puntos
+        face: Archivo de fuente (None = fuente por defecto de pygame)
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = CachedFont(pygame.font.Font(face, size), key)
+    return font
@@ -0,0 +1,266 @@
+"""
+Perfilador de frames del game loop.
+Responsabilidad: Medir cuánto tarda cada etapa de un frame, contar las
+Surfaces y fuentes creadas por frame, mostrarlo en una capa superpuesta y
+exportar la traza para analizarla fuera del juego.
+
+- F3 muestra/oculta la capa (histograma del tiempo de frame y desglose
+  por etapa)
+- F4 exporta los frames registrados en formato Trace Event
+  (chrome://tracing o https://ui.perfetto.dev)
+
+Las etapas se miden como vueltas de cronómetro: mark(nombre) asigna a
+`nombre` el tiempo transcurrido desde la marca anterior, así que las
+etapas de un frame suman su duración completa.
+
+Apagado, cada marca cuesta solo la comprobación de `self.enabled`. Los
+contadores reemplazan pygame.Surface y pygame.font.Font por subclases
+que cuentan instancias, y solo mientras el perfilador está encendido.
+Se cuentan las Surfaces creadas con pygame.Surface(...) (no las que
+devuelven render, copy o transform).
+"""
+
+import json
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import pygame
+from views.config import Colors, PanelSizes, Profiling, WINDOW_HEIGHT
+
+
+# Orden de las etapas dentro de un frame
+STAGES = (
+    'eventos', 'actualizacion', 'fondo', 'conexiones', 'rutas', 'estrellas',
+    'paneles', 'superposiciones', 'perfilador', 'presentacion', 'espera',
+)
+
+_ORIGINAL_SURFACE = pygame.Surface
+_ORIGINAL_FONT = pygame.font.Font
+
+# Creaciones desde el último end_frame()
+_allocations = {'surfaces': 0, 'fonts': 0}
+
+
+class _CountingSurface(_ORIGINAL_SURFACE):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _allocations['surfaces'] += 1
+
+
+class _CountingFont(_ORIGINAL_FONT):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _allocations['fonts'] += 1
+
+
+def _install_counters():
+    pygame.Surface = _CountingSurface
+    pygame.font.Font = _CountingFont
+
+
+def _uninstall_counters():
+    pygame.Surface = _ORIGINAL_SURFACE
+    pygame.font.Font = _ORIGINAL_FONT
+
+
+class FrameProfiler:
+    """
+    Registra la duración de cada etapa de los últimos frames.
+
+    Cada frame se guarda como (inicio, [(etapa, inicio, duración)],
+    surfaces, fuentes), con tiempos de time.perf_counter().
+    """
+
+    def __init__(self, history=Profiling.HISTORY_FRAMES):
+        self.enabled = False
+        self.frames = deque(maxlen=history)
+        self._stages = []
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._font = None
+        self._background = None
+
+    def toggle(self):
+        """Enciende o apaga el perfilador (y su capa superpuesta)."""
+        self.enabled = not self.enabled
+        if self.enabled:
+            _install_counters()
+            self.begin_frame()
+        else:
+            _uninstall_counters()
+
+    def begin_frame(self):
+        """Comienza un frame nuevo."""
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        self._stages = []
+        _allocations['surfaces'] = _allocations['fonts'] = 0
+
+    def mark(self, stage):
+        """Cierra una etapa: le asigna el tiempo desde la marca anterior."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._stages.append((stage, self._last, now - self._last))
+        self._last = now
+
+    def end_frame(self):
+        """Guarda el frame actual."""
+        if not self.enabled:
+            return
+        self.frames.append(
+            (self._frame_start, self._stages, _allocations['surfaces'], _allocations['fonts'])
+        )
+
+    def _window(self):
+        frames = list(self.frames)
+        return frames[-Profiling.WINDOW_FRAMES:]
+
+    def stats(self) -> Dict:
+        """
+        Resumen de los últimos Profiling.WINDOW_FRAMES frames.
+
+        Returns:
+            Dict con fps, trabajo_ms (media, p95, máx; sin la espera de
+            clock.tick), etapas {nombre: ms medios}, surfaces y fuentes
+            medias por frame
+        """
+        window = self._window()
+        if not window:
+            return {'frames': 0, 'fps': 0.0, 'trabajo_ms': 0.0, 'trabajo_p95_ms': 0.0,
+                    'trabajo_max_ms': 0.0, 'etapas': {}, 'surfaces': 0.0, 'fuentes': 0.0}
+
+        n = len(window)
+        etapas = {}
+        trabajos = []
+        duracion_total = 0.0
+        for _, stages, _, _ in window:
+            trabajo = 0.0
+            for nombre, _, duracion in stages:
+                etapas[nombre] = etapas.get(nombre, 0.0) + duracion
+                duracion_total += duracion
+                if nombre != 'espera':
+                    trabajo += duracion
+            trabajos.append(trabajo * 1000)
+
+        trabajos.sort()
+        return {
+            'frames': n,
+            'fps': n / duracion_total if duracion_total > 0 else 0.0,
+            'trabajo_ms': sum(trabajos) / n,
+            'trabajo_p95_ms': trabajos[min(n - 1, int(n * 0.95))],
+            'trabajo_max_ms': trabajos[-1],
+            'etapas': {nombre: total * 1000 / n for nombre, total in etapas.items()},
+            'surfaces': sum(f[2] for f in window) / n,
+            'fuentes': sum(f[3] for f in window) / n,
+        }
+
+    def histogram(self) -> List[int]:
+        """Frames por rango de tiempo de trabajo (Profiling.HISTOGRAM_BIN_MS ms cada uno)."""
+        bins = [0] * Profiling.HISTOGRAM_BINS
+        for _, stages, _, _ in self._window():
+            trabajo = sum(d for nombre, _, d in stages if nombre != 'espera') * 1000
+            bins[min(int(trabajo // Profiling.HISTOGRAM_BIN_MS), Profiling.HISTOGRAM_BINS - 1)] += 1
+        return bins
+
+    def export_trace(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Escribe los frames registrados en formato Trace Event.
+
+        Cada frame es un evento 'frame' con sus etapas anidadas; las
+        Surfaces y fuentes creadas van como contadores.
+
+        Returns:
+            Ruta del archivo, o None si no hay frames registrados
+        """
+        if not self.frames:
+            return None
+        if path is None:
+            path = f"{Profiling.TRACE_PREFIX}{time.strftime('%Y%m%d_%H%M%S')}.json"
+
+        origen = self.frames[0][0]
+
+        def us(t):
+            return round((t - origen) * 1e6, 1)
+
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'game loop'}}]
+        for numero, (inicio, stages, surfaces, fuentes) in enumerate(self.frames):
+            duracion = sum(d for _, _, d in stages)
+            events.append({'name': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1, 'ts': us(inicio),
+                           'dur': round(duracion * 1e6, 1), 'args': {'frame': numero}})
+            for nombre, comienzo, d in stages:
+                events.append({'name': nombre, 'ph': 'X', 'pid': 1, 'tid': 1,
+                               'ts': us(comienzo), 'dur': round(d * 1e6, 1)})
+            events.append({'name': 'asignaciones', 'ph': 'C', 'pid': 1, 'ts': us(inicio),
+                           'args': {'surfaces': surfaces, 'fuentes': fuentes}})
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+    def bounds(self):
+        """Rectángulo de la capa superpuesta (None si está apagado)."""
+        if not self.enabled:
+            return None
+        ancho = Profiling.OVERLAY_WIDTH
+        alto = 130 + 14 * len(STAGES)
+        return pygame.Rect(PanelSizes.RIGHT_PANEL_X - ancho - 10, WINDOW_HEIGHT - alto - 10, ancho, alto)
+
+    def draw(self, screen):
+        """Dibuja la capa superpuesta (abajo a la derecha del área del grafo)."""
+        if not self.enabled:
+            return
+
+        # Recursos propios con las clases originales: no cuentan como asignaciones
+        if self._font is None:
+            self._font = _ORIGINAL_FONT(None, 16)
+        x, y, ancho, alto = self.bounds()
+        if self._background is None:
+            self._background = _ORIGINAL_SURFACE((ancho, alto), pygame.SRCALPHA)
+            self._background.fill((0, 0, 0, 190))
+
+        screen.blit(self._background, (x, y))
+        pygame.draw.rect(screen, Colors.PANEL_BORDER, (x, y, ancho, alto), 1)
+
+        stats = self.stats()
+        presupuesto = Profiling.FRAME_BUDGET_MS
+        color = Colors.TEXT_SUCCESS if stats['trabajo_p95_ms'] <= presupuesto else Colors.TEXT_DANGER
+        lineas = [
+            ("Perfilador (F3 ocultar, F4 exportar)", Colors.TEXT_TITLE),
+            (f"FPS {stats['fps']:.1f}   trabajo {stats['trabajo_ms']:.1f} ms", color),
+            (f"p95 {stats['trabajo_p95_ms']:.1f} ms   máx {stats['trabajo_max_ms']:.1f} ms", color),
+        ]
+        cy = y + 6
+        for texto, c in lineas:
+            screen.blit(self._font.render(texto, True, c), (x + 8, cy))
+            cy += 16
+
+        # Histograma del tiempo de trabajo, con la línea del presupuesto
+        bins = self.histogram()
+        alto_hist = 40
+        ancho_barra = (ancho - 16) // len(bins)
+        maximo = max(bins) or 1
+        base = cy + alto_hist + 4
+        for i, cantidad in enumerate(bins):
+            h = int(alto_hist * cantidad / maximo)
+            en_presupuesto = (i + 1) * Profiling.HISTOGRAM_BIN_MS <= presupuesto
+            pygame.draw.rect(screen, Colors.ENERGY_HIGH if en_presupuesto else Colors.ENERGY_LOW,
+                             (x + 8 + i * ancho_barra, base - h, ancho_barra - 1, h))
+        limite = x + 8 + int(presupuesto / Profiling.HISTOGRAM_BIN_MS * ancho_barra)
+        pygame.draw.line(screen, Colors.TEXT_HIGHLIGHT, (limite, base - alto_hist), (limite, base), 1)
+        cy = base + 6
+
+        # Desglose por etapa: ms medios y barra relativa al presupuesto
+        for nombre in STAGES:
+            ms = stats['etapas'].get(nombre, 0.0)
+            screen.blit(self._font.render(f"{nombre:<15}", True, Colors.TEXT_SECONDARY), (x + 8, cy))
+            screen.blit(self._font.render(f"{ms:6.2f} ms", True, Colors.TEXT_PRIMARY), (x + 120, cy))
+            largo = min(ancho - 200, int((ancho - 200) * ms / presupuesto))
+            pygame.draw.rect(screen, Colors.TEXT_INFO, (x + 190, cy + 3, largo, 8))
+            cy += 14
+
+        cy += 6
+        texto = f"Surfaces/frame {stats['surfaces']:.1f}   Fuentes/frame {stats['fuentes']:.1f}"
+        screen.blit(self._font.render(texto, True, Colors.TEXT_PRIMARY), (x + 8, cy))
@@ -4,9 +4,8 @@ Responsabilidad: Procesar y responder a eventos de usuario (mouse, teclado).
 """
 
 import pygame
-from views.config import Colors, Icons, GameState
+from views.config import Colors, Icons, GameState, PanelSizes
 from algorithms.dijkstra import encontrar_camino_mas_corto
-from utils.config_saver import save_grafo_to_json
 
 
 class GameEventHandler:
@@ -42,6 +41,11 @@ class GameEventHandler:
     
     def _handle_single_event(self, event, mouse_pos):
         """Procesa un evento individual."""
+        # Teclas, clics, rueda y eventos de ventana repintan la ventana completa;
+        # el movimiento del mouse solo ensucia lo que cambia (hover, tooltip)
+        if event.type != pygame.MOUSEMOTION:
+            self.gm.renderer.invalidate()
+        
         if event.type == pygame.QUIT:
             self.gm.running = False
         
@@ -58,6 +62,9 @@ class GameEventHandler:
             # Delegar scroll al panel de control de caminos si está visible
             elif self.gm.path_control_panel.visible:
                 self.gm.path_control_panel.handle_event(event)
+            # Sobre el área del grafo, la rueda acerca o aleja la vista
+            elif PanelSizes.GRAPH_X <= mouse_pos[0] < PanelSizes.GRAPH_X + PanelSizes.GRAPH_WIDTH:
+                self.gm.graph_renderer.zoom_at(mouse_pos, event.y)
     
     def _handle_keyboard(self, event):
         """Maneja eventos de teclado."""
@@ -67,6 +74,24 @@ class GameEventHandler:
             self._on_eat_click()
         elif event.key == pygame.K_i:
             self._on_investigate_click()
+        elif event.key == pygame.K_F3:
+            self._on_toggle_profiler()
+        elif event.key == pygame.K_F4:
+            self._on_export_trace()
+    
+    def _on_toggle_profiler(self):
+        """Muestra u oculta el perfilador de frames."""
+        self.gm.profiler.toggle()
+        estado = "activado" if self.gm.profiler.enabled else "desactivado"
+        self.gm.notification.add(f"⏱️ Perfilador de frames {estado}", Colors.TEXT_INFO)
+    
+    def _on_export_trace(self):
+        """Exporta los frames registrados por el perfilador."""
+        ruta = self.gm.profiler.export_trace()
+        if ruta:
+            self.gm.notification.add(f"💾 Traza exportada: {ruta}", Colors.TEXT_SUCCESS)
+        else:
+            self.gm.notification.add("⚠️ Sin frames registrados: activa el perfilador con F3", Colors.TEXT_DANGER)
     
     def _handle_mouse_button(self, event, mouse_pos):
         """Maneja clicks del mouse."""
@@ -102,6 +127,7 @@ class GameEventHandler:
             if result == "save":
                 self._save_config()
             elif result == "close":
+                self._compact_journal()
                 self.gm._update_ui()
         # Verificar si se hace clic en el panel de información de estrella
         elif self.gm.star_info_panel.visible:
@@ -142,15 +168,30 @@ class GameEventHandler:
         )
     
     def _save_config(self):
-        """Guarda la configuración al JSON."""
+        """Guarda las estrellas editadas (en el diario si está activo)."""
         try:
-            save_grafo_to_json(self.gm.grafo)
-            self.gm.notification.show(
-                "✅ Configuración guardada en config.json",
-                Colors.HEALTH_POSITIVE
+            self.gm.guardador.guardar()
+            if self.gm.guardador.entradas_diario:
+                mensaje = "✅ Cambios guardados (se pasan a config.json al cerrar el editor)"
+            else:
+                mensaje = "✅ Configuración guardada en config.json"
+            self.gm.notification.add(mensaje, Colors.HEALTH_POSITIVE)
+        except Exception as e:
+            self.gm.notification.add(
+                f"❌ Error al guardar: {e}",
+                Colors.HEALTH_NEGATIVE
             )
+    
+    def _compact_journal(self):
+        """Incorpora a config.json las ediciones del diario (al cerrar el editor)."""
+        try:
+            if self.gm.guardador.compactar():
+                self.gm.notification.add(
+                    "✅ Configuración guardada en config.json",
+                    Colors.HEALTH_POSITIVE
+                )
         except Exception as e:
-            self.gm.notification.show(
+            self.gm.notification.add(
                 f"❌ Error al guardar: {e}",
                 Colors.HEALTH_NEGATIVE
             )
@@ -16,9 +16,14 @@ from views.final_report_panel import FinalReportPanel
 from views.components import Tooltip, Notification
 from views.game_events import GameEventHandler
 from views.game_renderer import GameRenderer
+from views.frame_profiler import FrameProfiler
+from views.font_cache import get_font
 from backend.simulator import SimuladorViaje
+from backend.clock import AnimatedClock
+from backend.events import ConsoleSubscriber
 from algorithms.dijkstra import encontrar_camino_mas_corto
 from utils.config_loader import cargar_grafo_desde_json, crear_burro_desde_json
+from utils.config_saver import GuardadorConfiguracion
 from utils.sound_manager import SoundManager
 
 
@@ -45,18 +50,29 @@ class GameManager:
         self.running = True
         
         # Cargar datos
-        self.grafo = cargar_grafo_desde_json()
+        self.grafo = cargar_grafo_desde_json(usar_cache=True)
         self.burro = crear_burro_desde_json()
-        self.simulador = SimuladorViaje(self.grafo, self.burro, posicion_inicial=1)
+        # Guardado incremental de las estrellas editadas (diario de ediciones)
+        self.guardador = GuardadorConfiguracion(self.grafo)
+        # Reloj animado: las horas simuladas no bloquean el game loop
+        self.simulador = SimuladorViaje(
+            self.grafo, self.burro, posicion_inicial=1, clock=AnimatedClock()
+        )
+        # El juego muestra en consola el progreso del viaje
+        self.burro.events.subscribe(ConsoleSubscriber())
         
         # Gestor de sonidos
         self.sound_manager = SoundManager(enabled=True)
         
+        # Perfilador de frames (F3 muestra la capa, F4 exporta la traza)
+        self.profiler = FrameProfiler()
+        
         # Renderizador del grafo
         self.graph_renderer = GraphRenderer(
             self.grafo,
             offset_x=PanelSizes.LEFT_PANEL_WIDTH,
-            offset_y=0
+            offset_y=0,
+            profiler=self.profiler
         )
         
         # Event handler
@@ -80,8 +96,8 @@ class GameManager:
         )
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, 36)
-        self.normal_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(36)
+        self.normal_font = get_font(20)
         
         # Estado de interacción
         self.selected_star_id = None
@@ -246,8 +262,11 @@ class GameManager:
         """Actualiza el estado del juego."""
         mouse_pos = pygame.mouse.get_pos()
         
-        # Actualizar renderizador del grafo
-        self.graph_renderer.update(mouse_pos, self.simulador.posicion_actual)
+        # Actualizar renderizador del grafo (con la animación de la estadía
+        # que programa el reloj del viaje)
+        clock = self.simulador.clock
+        stay_progress = clock.animation_progress() if clock.is_animating() else None
+        self.graph_renderer.update(mouse_pos, self.simulador.posicion_actual, stay_progress)
         
         # Actualizar notificaciones
         self.notification.update()
@@ -286,13 +305,24 @@ class GameManager:
     def run(self):
         """Loop principal del juego."""
         while self.running:
+            self.profiler.begin_frame()
             self.event_handler.handle_events()
+            self.profiler.mark('eventos')
             
             if self.state == GameState.PLAYING:
                 self.update()
+            self.profiler.mark('actualizacion')
             
             self.renderer.draw()
             self.clock.tick(FPS)
+            self.profiler.mark('espera')
+            self.profiler.end_frame()
+        
+        # Las ediciones que quedaron en el diario pasan a config.json
+        try:
+            self.guardador.compactar()
+        except OSError as e:
+            print(f"❌ Error al guardar las ediciones pendientes: {e}")
         
         pygame.quit()
         sys.exit()
@@ -7,6 +7,8 @@ import pygame
 from views.config import (WINDOW_WIDTH, WINDOW_HEIGHT, Colors, GameState, PanelSizes,
                           BOARD_WIDTH_UM, BOARD_HEIGHT_UM)
 from views.constellation_legend import ConstellationLegend, ScaleLegend
+from views.dirty_regions import CachedLayer, DirtyRegions
+from views.font_cache import get_font
 
 
 class GameRenderer:
@@ -17,6 +19,7 @@ class GameRenderer:
     - Dibujar fondo y áreas
     - Coordinar dibujado de todos los paneles
     - Renderizar estado de Game Over
+    - Repintar y presentar solo las regiones que cambiaron
     """
     
     def __init__(self, screen, game_manager):
@@ -28,6 +31,25 @@ class GameRenderer:
         self.screen = screen
         self.gm = game_manager
         
+        # Regiones sucias del frame y estado con que se pintó el anterior
+        self.dirty = DirtyRegions(screen.get_size())
+        self.graph_area = pygame.Rect(
+            PanelSizes.LEFT_PANEL_WIDTH, 0,
+            PanelSizes.GRAPH_WIDTH, PanelSizes.GRAPH_HEIGHT
+        )
+        self._graph_key = None
+        self._last_graph_rects = []
+        self._last_overlay_rects = []
+        self._last_modal = False
+        
+        # Paneles en caché: se repintan solo cuando cambian sus datos
+        self.donkey_layer = CachedLayer()
+        self.reachable_layer = CachedLayer()
+        self.actions_layer = CachedLayer()
+        self.star_info_layer = CachedLayer()
+        self.constellation_legend_layer = CachedLayer()
+        self.scale_legend_layer = CachedLayer()
+        
         # Leyendas (REQUERIMIENTO: mostrar colores de constelaciones)
         self.constellation_legend = None
         self.scale_legend = None
@@ -51,47 +73,142 @@ class GameRenderer:
     def update_legends(self):
         """Actualiza las leyendas cuando se carga un nuevo grafo."""
         self._initialize_legends()
+        self.invalidate()
+    
+    def invalidate(self):
+        """Repinta la ventana completa en el próximo frame."""
+        self.dirty.invalidate()
     
     def draw(self):
-        """Dibuja todos los elementos del juego."""
+        """
+        Dibuja los elementos del juego que cambiaron desde el frame anterior.
+        
+        Primero se marcan como sucias las regiones que cambiaron (grafo,
+        paneles, superposiciones); luego se repinta todo recortado a esas
+        regiones, en el mismo orden de siempre, y solo ellas se presentan.
+        Las ventanas modales y el Game Over repintan la ventana completa.
+        """
+        gm = self.gm
+        modal = (gm.star_editor.visible or gm.intergalactic_panel.visible or
+                 gm.path_control_panel.visible or gm.final_report_panel.visible or
+                 gm.state == GameState.GAME_OVER)
+        if modal or self._last_modal:
+            self.dirty.invalidate()
+        self._last_modal = modal
+        
+        graph_state = self._graph_state()
+        self._mark_dirty(graph_state)
+        
+        clip = self.dirty.clip()
+        if clip is None:
+            # Nada cambió: no se dibuja ni se presenta
+            self.dirty.present()
+            return
+        self.screen.set_clip(clip)
+        
         # 1. Fondo
         self.screen.fill(Colors.BACKGROUND)
         
-        # 2. Área del grafo con fondo especial
-        self._draw_graph_area()
-        
-        # 3. Grafo de constelaciones
-        self._draw_graph()
+        # 2 y 3. Área del grafo y grafo de constelaciones (recortados al área)
+        graph_clip = clip.clip(self.graph_area)
+        if graph_clip.width and graph_clip.height:
+            self.screen.set_clip(graph_clip)
+            self._draw_graph_area()
+            self._draw_graph(*graph_state)
+            self.screen.set_clip(clip)
+        else:
+            gm.profiler.mark('fondo')
         
         # 4. Paneles UI
         self._draw_panels()
         
         # 5. Editor de estrellas (encima)
-        self.gm.star_editor.draw(self.screen)
+        gm.star_editor.draw(self.screen)
         
         # 6. Panel inter-galáctico (encima del editor)
-        self.gm.intergalactic_panel.draw(self.screen)
+        gm.intergalactic_panel.draw(self.screen)
+        gm.profiler.mark('paneles')
         
         # 7. Notificaciones y tooltip
         self._draw_overlays()
         
         # 8. Game Over si aplica
-        if self.gm.state == GameState.GAME_OVER:
+        if gm.state == GameState.GAME_OVER:
             self._draw_game_over()
+        gm.profiler.mark('superposiciones')
+        
+        # 9. Perfilador de frames (F3)
+        gm.profiler.draw(self.screen)
+        gm.profiler.mark('perfilador')
+        
+        # 10. Actualizar pantalla (solo las regiones sucias)
+        self.screen.set_clip(None)
+        self.dirty.present()
+        gm.profiler.mark('presentacion')
+    
+    def _mark_dirty(self, graph_state):
+        """Marca como sucias las regiones que cambiaron desde el frame anterior."""
+        gm = self.gm
         
-        # 9. Actualizar pantalla
-        pygame.display.flip()
+        # Grafo: todo si cambió la vista, las rutas o la posición del burro;
+        # si no, solo lo animado (en su lugar anterior y en el actual)
+        current_star_id, visited_stars, optimal_route, optimal_route_grass = graph_state
+        graph_key = (
+            gm.graph_renderer.view_key(), current_star_id, frozenset(visited_stars),
+            tuple(optimal_route or ()), tuple(optimal_route_grass or ()),
+            tuple(gm.graph_renderer.active_path),
+        )
+        if graph_key != self._graph_key:
+            self._graph_key = graph_key
+            self.dirty.add(self.graph_area)
+        graph_rects = gm.graph_renderer.dirty_rects(current_star_id)
+        for rect in self._last_graph_rects + graph_rects:
+            self.dirty.add(rect.clip(self.graph_area))
+        self._last_graph_rects = graph_rects
+        
+        # Paneles: solo los que cambiaron sus datos
+        for layer, key, rect in self._panel_layers():
+            if layer.check(key, rect):
+                self.dirty.add(rect)
+        
+        # Superposiciones: donde estaban y donde están ahora
+        overlay_rects = gm.notification.bounds(gm.normal_font)
+        tooltip_rect = gm.tooltip.bounds(self.screen.get_size(), get_font(16))
+        if tooltip_rect:
+            overlay_rects.append(tooltip_rect)
+        profiler_rect = gm.profiler.bounds()
+        if profiler_rect:
+            overlay_rects.append(profiler_rect)
+        for rect in self._last_overlay_rects + overlay_rects:
+            self.dirty.add(rect)
+        self._last_overlay_rects = overlay_rects
+    
+    def _panel_layers(self):
+        """(capa, clave, rectángulo) de cada panel en caché."""
+        gm = self.gm
+        layers = [
+            (self.donkey_layer, gm.donkey_panel.render_key(), gm.donkey_panel.panel.rect),
+            (self.reachable_layer, gm.reachable_panel.render_key(), gm.reachable_panel.panel.rect),
+            (self.actions_layer, gm.actions_panel.render_key(), gm.actions_panel.bounds()),
+            (self.star_info_layer, gm.star_info_panel.render_key(), gm.star_info_panel.panel.rect),
+        ]
+        if self.constellation_legend:
+            layers.append((self.constellation_legend_layer, self.constellation_legend.render_key(),
+                           self.constellation_legend.rect()))
+        if self.scale_legend:
+            layers.append((self.scale_legend_layer, (BOARD_WIDTH_UM, BOARD_HEIGHT_UM),
+                           self.scale_legend.rect))
+        return layers
     
     def _draw_graph_area(self):
         """Dibuja el área de fondo del grafo."""
-        graph_area = pygame.Rect(
-            PanelSizes.LEFT_PANEL_WIDTH, 0,
-            PanelSizes.GRAPH_WIDTH, PanelSizes.GRAPH_HEIGHT
-        )
-        pygame.draw.rect(self.screen, Colors.SPACE_DARK, graph_area)
+        pygame.draw.rect(self.screen, Colors.SPACE_DARK, self.graph_area)
     
-    def _draw_graph(self):
-        """Dibuja el grafo de constelaciones con el burro."""
+    def _graph_state(self):
+        """
+        Lo que muestra el grafo: (estrella actual, visitadas, ruta óptima,
+        ruta óptima con pasto).
+        """
         # Obtener estrellas visitadas (REQUERIMIENTO: Una estrella solo se visita una vez)
         # Usar tanto el historial como el atributo 'visitada' de las estrellas
         visited_stars = set(self.gm.simulador.historial_viaje)
@@ -105,21 +222,26 @@ class GameRenderer:
         # Pasar rutas óptimas si están activas
         optimal_route = self.gm.optimal_route if self.gm.show_optimal_route else None
         optimal_route_grass = self.gm.optimal_route_with_grass if self.gm.show_optimal_route else None
+        return self.gm.simulador.posicion_actual, visited_stars, optimal_route, optimal_route_grass
+    
+    def _draw_graph(self, current_star_id, visited_stars, optimal_route, optimal_route_grass):
+        """Dibuja el grafo de constelaciones con el burro."""
+        self.gm.profiler.mark('fondo')
         
         self.gm.graph_renderer.draw(
             self.screen,
-            current_star_id=self.gm.simulador.posicion_actual,
+            current_star_id=current_star_id,
             visited_stars=visited_stars,
             optimal_route=optimal_route,
             optimal_route_with_grass=optimal_route_grass
         )
     
     def _draw_panels(self):
-        """Dibuja todos los paneles de información."""
-        self.gm.donkey_panel.draw(self.screen)
-        self.gm.reachable_panel.draw(self.screen)
-        self.gm.actions_panel.draw(self.screen)
-        self.gm.star_info_panel.draw(self.screen)
+        """Dibuja todos los paneles de información (desde su caché si no cambiaron)."""
+        self.donkey_layer.draw(self.screen, self.gm.donkey_panel.draw)
+        self.reachable_layer.draw(self.screen, self.gm.reachable_panel.draw)
+        self.actions_layer.draw(self.screen, self.gm.actions_panel.draw)
+        self.star_info_layer.draw(self.screen, self.gm.star_info_panel.draw)
         
         # Panel de control de caminos (REQUERIMIENTO 0.5) - se dibuja encima
         if self.gm.path_control_panel.visible:
@@ -131,14 +253,17 @@ class GameRenderer:
         
         # Leyendas (abajo)
         if self.constellation_legend:
-            self.constellation_legend.draw(self.screen)
+            self.constellation_legend_layer.draw(self.screen, self.constellation_legend.draw)
         if self.scale_legend:
-            self.scale_legend.draw(self.screen, BOARD_WIDTH_UM, BOARD_HEIGHT_UM)
+            self.scale_legend_layer.draw(
+                self.screen,
+                lambda screen: self.scale_legend.draw(screen, BOARD_WIDTH_UM, BOARD_HEIGHT_UM)
+            )
     
     def _draw_overlays(self):
         """Dibuja notificaciones y tooltips."""
         self.gm.notification.draw(self.screen, self.gm.normal_font)
-        self.gm.tooltip.draw(self.screen, pygame.font.Font(None, 16))
+        self.gm.tooltip.draw(self.screen, get_font(16))
     
     def _draw_game_over(self):
         """Dibuja la pantalla de Game Over."""
@@ -4,9 +4,13 @@ Responsabilidad: Orquestar la visualización completa del grafo.
 """
 
 import pygame
-from views.config import GraphScale
+from views.config import GraphScale, PanelSizes
 from views.star_visual import StarRenderer, DonkeyRenderer
 from views.connection_visual import ConnectionRenderer
+from views.spatial_index import SpatialGrid
+from views.level_of_detail import ConstellationLOD, LOD_CLUSTERS, LOD_FULL
+from views.sprite_atlas import atlas
+from views.font_cache import get_font
 
 
 class GraphRenderer:
@@ -18,11 +22,14 @@ class GraphRenderer:
     - Coordinar dibujado de conexiones
     - Coordinar dibujado de estrellas
     - Gestionar transformaciones de coordenadas (zoom, pan)
+    - Elegir el nivel de detalle según el zoom
     - Renderizar el burro
     """
     
-    def __init__(self, grafo, offset_x=0, offset_y=0):
+    def __init__(self, grafo, offset_x=0, offset_y=0, profiler=None):
         self.grafo = grafo
+        # FrameProfiler opcional: marca las etapas conexiones, rutas y estrellas
+        self.profiler = profiler
         self.offset_x = offset_x + GraphScale.OFFSET_X
         self.offset_y = offset_y + GraphScale.OFFSET_Y
         
@@ -31,8 +38,9 @@ class GraphRenderer:
         self.pan_x = 0
         self.pan_y = 0
         
-        # Renderizadores
+        # Renderizadores (con un catálogo fragmentado, solo de lo que se ve)
         self.star_renderers = {}
+        self._load_visible_region()
         self._create_star_renderers()
         
         # Burro
@@ -40,34 +48,169 @@ class GraphRenderer:
         
         # Camino activo
         self.active_path = []
+        
+        # Capa de conexiones pre-renderizada y el estado con que se dibujó
+        self._connection_layer = None
+        self._connection_layer_rect = None
+        self._connection_layer_key = None
+        
+        # Índice espacial de las estrellas en pantalla (se rehace con zoom o pan)
+        self._star_index = None
+        self._star_index_key = None
+        self._visible = None
+        self._visible_key = None
+        # Estrellas con animación en curso (hover, brillo o pulso)
+        self._animated_stars = set()
+        
+        # Nivel de detalle según el zoom
+        self.lod = ConstellationLOD(grafo)
+        # Cambia con invalidate_connections(): obliga a repintar todo el grafo
+        self._view_serial = 0
     
     def _create_star_renderers(self):
-        """Crea un StarRenderer para cada estrella del grafo."""
+        """
+        Crea un StarRenderer para cada estrella del grafo que todavía no
+        tiene uno, en el orden de grafo.estrellas (el orden de dibujado).
+        """
+        # Un catálogo fragmentado puede tener las estrellas en el orden en
+        # que las cargó una búsqueda
+        ordenar_estrellas = getattr(self.grafo, 'ordenar_estrellas', None)
+        if ordenar_estrellas is not None:
+            ordenar_estrellas()
+        renderers = {}
         for star_id, estrella in self.grafo.estrellas.items():
-            screen_x, screen_y = self._world_to_screen(estrella.x, estrella.y)
-            self.star_renderers[star_id] = StarRenderer(estrella, screen_x, screen_y)
+            renderer = self.star_renderers.get(star_id)
+            if renderer is None:
+                screen_x, screen_y = self._world_to_screen(estrella.x, estrella.y)
+                renderer = StarRenderer(estrella, screen_x, screen_y)
+            renderers[star_id] = renderer
+        self.star_renderers = renderers
+    
+    def _load_visible_region(self):
+        """
+        Con un catálogo fragmentado (utils/sharded_catalog.py), carga las
+        constelaciones que caen en el área visible del grafo (con el margen
+        de recorte) y las de sus vecinos (para que las aristas que salen de
+        la vista se dibujen completas), y crea los renderers de sus estrellas.
+        """
+        cargar_region = getattr(self.grafo, 'cargar_region', None)
+        if cargar_region is None:
+            return
+        area = pygame.Rect(
+            PanelSizes.GRAPH_X, PanelSizes.GRAPH_Y, PanelSizes.GRAPH_WIDTH, PanelSizes.GRAPH_HEIGHT
+        ).inflate(2 * GraphScale.CULL_MARGIN, 2 * GraphScale.CULL_MARGIN)
+        escala = GraphScale.SCALE_FACTOR * self.zoom
+        if cargar_region(
+            (area.left - self.offset_x - self.pan_x) / escala,
+            (area.top - self.offset_y - self.pan_y) / escala,
+            (area.right - self.offset_x - self.pan_x) / escala,
+            (area.bottom - self.offset_y - self.pan_y) / escala,
+            vecinos=True,
+        ):
+            self._create_star_renderers()
     
     def _world_to_screen(self, world_x, world_y):
         """Convierte coordenadas del mundo a coordenadas de pantalla."""
-        screen_x = int(world_x * GraphScale.SCALE_FACTOR + self.offset_x + self.pan_x)
-        screen_y = int(world_y * GraphScale.SCALE_FACTOR + self.offset_y + self.pan_y)
+        screen_x = int(world_x * GraphScale.SCALE_FACTOR * self.zoom + self.offset_x + self.pan_x)
+        screen_y = int(world_y * GraphScale.SCALE_FACTOR * self.zoom + self.offset_y + self.pan_y)
         return screen_x, screen_y
     
-    def update(self, mouse_pos, current_star_id=None):
+    def zoom_at(self, pos, steps):
+        """
+        Acerca (steps > 0) o aleja (steps < 0) la vista dejando fijo el
+        punto del mundo que está bajo `pos`.
+        
+        Args:
+            pos: Posición de pantalla (x, y), normalmente la del mouse
+            steps: Pasos de la rueda del mouse
+        """
+        zoom = self.zoom * GraphScale.ZOOM_STEP ** steps
+        zoom = max(GraphScale.MIN_ZOOM, min(GraphScale.MAX_ZOOM, zoom))
+        if zoom == self.zoom:
+            return
+        
+        # Punto del mundo bajo el mouse, que debe quedar en el mismo lugar
+        escala = GraphScale.SCALE_FACTOR * self.zoom
+        world_x = (pos[0] - self.offset_x - self.pan_x) / escala
+        world_y = (pos[1] - self.offset_y - self.pan_y) / escala
+        
+        self.zoom = zoom
+        self.pan_x = pos[0] - self.offset_x - world_x * GraphScale.SCALE_FACTOR * zoom
+        self.pan_y = pos[1] - self.offset_y - world_y * GraphScale.SCALE_FACTOR * zoom
+        self._update_star_positions()
+        self._load_visible_region()
+    
+    def _update_star_positions(self):
+        """Recalcula la posición en pantalla de cada estrella tras un cambio de vista."""
+        for renderer in self.star_renderers.values():
+            renderer.screen_x, renderer.screen_y = self._world_to_screen(
+                renderer.estrella.x, renderer.estrella.y
+            )
+    
+    def _spatial_index(self):
+        """Índice de las estrellas en pantalla, rehecho si cambió la vista."""
+        key = (self.zoom, self.pan_x, self.pan_y, len(self.star_renderers))
+        if key != self._star_index_key:
+            self._star_index = SpatialGrid(GraphScale.SPATIAL_CELL_SIZE)
+            for star_id, renderer in self.star_renderers.items():
+                self._star_index.insert(star_id, renderer.screen_x, renderer.screen_y, renderer.radius)
+            self._star_index_key = key
+        return self._star_index
+    
+    def _visible_stars(self, screen):
+        """
+        Estrellas que pueden verse en pantalla (o en la región recortada con
+        set_clip), en el orden de dibujado.
+        
+        El margen cubre el brillo y la etiqueta de las estrellas que están
+        justo fuera del borde.
+        """
+        index = self._spatial_index()
+        clip = screen.get_clip()
+        key = (self._star_index_key, tuple(clip))
+        if key != self._visible_key:
+            viewport = clip.inflate(2 * GraphScale.CULL_MARGIN, 2 * GraphScale.CULL_MARGIN)
+            if index.bounds is None or viewport.contains(index.bounds):
+                self._visible = list(self.star_renderers.items())
+            else:
+                self._visible = [(star_id, self.star_renderers[star_id]) for star_id in index.in_rect(viewport)]
+            self._visible_key = key
+        return self._visible
+    
+    def update(self, mouse_pos, current_star_id=None, stay_progress=None):
         """
         Actualiza el estado de todos los elementos visuales.
         
+        Solo se actualizan las estrellas bajo el mouse, la actual y las que
+        tienen una animación en curso: en el resto update() no cambia nada.
+        
         Args:
             mouse_pos: Posición actual del mouse
             current_star_id: ID de la estrella donde está el burro
+            stay_progress: Progreso de la estadía en curso (0 a 1), o None
         """
+        # Estrellas que cargó una búsqueda sobre un catálogo fragmentado
+        if len(self.grafo.estrellas) != len(self.star_renderers):
+            self._create_star_renderers()
+        
         # Actualizar burro
         self.donkey_renderer.update()
+        self.donkey_renderer.stay_progress = stay_progress
         
         # Actualizar estrellas
-        for star_id, renderer in self.star_renderers.items():
+        candidates = set(self._spatial_index().at_point(*mouse_pos))
+        candidates |= self._animated_stars
+        if current_star_id in self.star_renderers:
+            candidates.add(current_star_id)
+        
+        animated = set()
+        for star_id in candidates:
+            renderer = self.star_renderers[star_id]
             is_current = (star_id == current_star_id)
             renderer.update(mouse_pos, is_current)
+            if renderer.hover or renderer.glow_alpha or renderer.pulse_offset:
+                animated.add(star_id)
+        self._animated_stars = animated
     
     def draw(self, screen, current_star_id=None, visited_stars=None, optimal_route=None, optimal_route_with_grass=None):
         """
@@ -81,9 +224,112 @@ class GraphRenderer:
             optimal_route_with_grass: Lista de IDs de la ruta óptima con pasto (REQUERIMIENTO 2.0)
         """
         visited_stars = visited_stars or set()
+        level = self.lod.level(self.zoom)
         
-        # 1. Conexiones (fondo)
-        self._draw_all_connections(screen)
+        # 1 a 4. Conexiones, rutas óptimas y camino activo, desde la capa
+        # pre-renderizada
+        self._draw_connection_layer(screen, level, optimal_route, optimal_route_with_grass)
+        
+        # 5. Estrellas (con colores por constelación), sin las que quedan fuera de pantalla.
+        # Sobre los grupos solo se dibujan la estrella actual y las animadas (hover)
+        if level == LOD_CLUSTERS:
+            stars = self._highlighted_stars(current_star_id)
+        else:
+            stars = self._visible_stars(screen)
+        for star_id, renderer in stars:
+            is_current = (star_id == current_star_id)
+            is_visited = star_id in visited_stars
+            renderer.draw(screen, is_current, is_visited, self.grafo)
+        
+        # 6. Burro (encima de todo)
+        if current_star_id is not None:
+            current_renderer = self.star_renderers.get(current_star_id)
+            if current_renderer:
+                self.donkey_renderer.draw(screen, current_renderer)
+        if self.profiler:
+            self.profiler.mark('estrellas')
+    
+    def invalidate_connections(self):
+        """Fuerza a redibujar la capa de conexiones en el próximo frame."""
+        self._connection_layer_key = None
+        self._view_serial += 1
+    
+    def view_key(self):
+        """
+        Estado de la vista: si cambia, hay que repintar todo el grafo (las
+        capas en caché se rehacen en el próximo draw).
+        """
+        return (self.zoom, self.pan_x, self.pan_y, self.grafo.version, self._view_serial)
+    
+    def dirty_rects(self, current_star_id=None):
+        """
+        Rectángulos que cambian de un frame a otro con la vista quieta: las
+        estrellas animadas (hover, brillo, pulso de la actual) y el burro.
+        """
+        rects = [self.star_renderers[star_id].bounds() for star_id in self._animated_stars]
+        current_renderer = self.star_renderers.get(current_star_id)
+        if current_renderer:
+            rects.append(current_renderer.bounds())
+            rects.append(self.donkey_renderer.bounds(current_renderer))
+        return rects
+    
+    def _highlighted_stars(self, current_star_id):
+        """Estrella actual y estrellas animadas, en el orden de dibujado."""
+        ids = set(self._animated_stars)
+        if current_star_id in self.star_renderers:
+            ids.add(current_star_id)
+        return [(star_id, self.star_renderers[star_id])
+                for star_id in sorted(ids, key=self._spatial_index().order)]
+    
+    def _draw_clusters(self, screen):
+        """
+        Dibuja cada constelación como grupos de estrellas (nivel LOD_CLUSTERS).
+        
+        Los grupos vienen precalculados por ConstellationLOD; aquí solo se
+        ubican en pantalla y se dibujan con un blits().
+        """
+        viewport = screen.get_rect().inflate(2 * GraphScale.CULL_MARGIN, 2 * GraphScale.CULL_MARGIN)
+        sprites = []
+        for color, world_x, world_y, count in self.lod.clusters(self.zoom):
+            x, y = self._world_to_screen(world_x, world_y)
+            if not viewport.collidepoint(x, y):
+                continue
+            sprite, c = atlas.star(color, ConstellationLOD.cluster_radius(count), False)
+            sprites.append((sprite, (x - c, y - c)))
+        screen.blits(sprites, doreturn=False)
+    
+    def _draw_connection_layer(self, screen, level, optimal_route=None, optimal_route_with_grass=None):
+        """
+        Dibuja las conexiones (o los grupos de estrellas, con la vista muy
+        alejada), las rutas óptimas y el camino activo desde una capa en caché.
+        
+        La capa es una copia opaca de la región de pantalla que ocupan las
+        conexiones, tomada justo después de dibujarlas sobre el fondo del
+        área del grafo (que GameRenderer pinta igual en cada frame). Se
+        rehace solo si cambian el zoom, el desplazamiento, el tamaño de la
+        pantalla, grafo.version (aristas nuevas, caminos bloqueados o
+        habilitados) o las rutas; el resto de los frames es un solo blit,
+        que da los mismos píxeles aunque la pantalla esté recortada.
+        """
+        key = (
+            self.zoom, self.pan_x, self.pan_y, self.grafo.version, screen.get_size(), level,
+            tuple(optimal_route or ()), tuple(optimal_route_with_grass or ()), tuple(self.active_path),
+        )
+        if key == self._connection_layer_key:
+            screen.blit(self._connection_layer, self._connection_layer_rect)
+            if self.profiler:
+                self.profiler.mark('conexiones')
+                self.profiler.mark('rutas')
+            return
+        
+        # 1. Conexiones (fondo). Con la vista muy alejada, las constelaciones
+        # se dibujan como grupos de estrellas
+        if level == LOD_CLUSTERS:
+            self._draw_clusters(screen)
+        else:
+            self._draw_all_connections(screen, show_weights=(level == LOD_FULL))
+        if self.profiler:
+            self.profiler.mark('conexiones')
         
         # 2. Ruta óptima sin pasto (cyan) - REQUERIMIENTO 1.2
         if optimal_route and len(optimal_route) > 1:
@@ -96,26 +342,38 @@ class GraphRenderer:
         # 4. Camino activo (resaltado)
         if self.active_path:
             self._draw_active_path(screen)
+        if self.profiler:
+            self.profiler.mark('rutas')
         
-        # 5. Estrellas (con colores por constelación)
-        for star_id, renderer in self.star_renderers.items():
-            is_current = (star_id == current_star_id)
-            is_visited = star_id in visited_stars
-            renderer.draw(screen, is_current, is_visited, self.grafo)
-        
-        # 6. Burro (encima de todo)
-        if current_star_id is not None:
-            current_renderer = self.star_renderers.get(current_star_id)
-            if current_renderer:
-                self.donkey_renderer.draw(screen, current_renderer)
+        area = self._connections_bounds().clip(screen.get_rect())
+        self._connection_layer = screen.subsurface(area).copy()
+        self._connection_layer_rect = area
+        self._connection_layer_key = key
+    
+    def _connections_bounds(self):
+        """Rectángulo que contiene todas las estrellas y las etiquetas de distancia."""
+        if not self.star_renderers:
+            return pygame.Rect(0, 0, 0, 0)
+        xs = [r.screen_x for r in self.star_renderers.values()]
+        ys = [r.screen_y for r in self.star_renderers.values()]
+        # Las etiquetas van en el punto medio de cada arista: basta un margen
+        # de media etiqueta alrededor de las estrellas
+        margin = GraphScale.CONNECTION_LAYER_MARGIN
+        return pygame.Rect(
+            min(xs) - margin, min(ys) - margin,
+            max(xs) - min(xs) + 2 * margin, max(ys) - min(ys) + 2 * margin
+        )
     
-    def _draw_all_connections(self, screen):
-        """Dibuja todas las conexiones del grafo."""
+    def _draw_all_connections(self, screen, show_weights=True):
+        """Dibuja todas las conexiones del grafo (con o sin las distancias)."""
         drawn_connections = set()
+        viewport = screen.get_rect().inflate(2 * GraphScale.CULL_MARGIN, 2 * GraphScale.CULL_MARGIN)
         
-        for star_id, vertex in self.grafo.graph.items():
-            star1_renderer = self.star_renderers.get(star_id)
-            if not star1_renderer:
+        # En el orden de las estrellas: el de grafo.graph cambia con los
+        # vértices que un catálogo fragmentado crea antes de cargarlos
+        for star_id, star1_renderer in self.star_renderers.items():
+            vertex = self.grafo.graph.get(star_id)
+            if not vertex:
                 continue
             
             for neighbor_vertex, distance in vertex.get_all_connections().items():
@@ -131,6 +389,12 @@ class GraphRenderer:
                 if not star2_renderer:
                     continue
                 
+                # Aristas fuera de pantalla (con margen para la etiqueta)
+                x1, y1 = star1_renderer.screen_x, star1_renderer.screen_y
+                x2, y2 = star2_renderer.screen_x, star2_renderer.screen_y
+                if not viewport.colliderect((min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)):
+                    continue
+                
                 # REQUERIMIENTO 0.5: Verificar si el camino está bloqueado
                 is_blocked = vertex.is_edge_blocked(neighbor_id)
                 
@@ -140,7 +404,7 @@ class GraphRenderer:
                     star2_renderer,
                     distance,
                     is_path=False,
-                    show_weights=True,
+                    show_weights=show_weights,
                     is_blocked=is_blocked
                 )
     
@@ -208,7 +472,7 @@ class GraphRenderer:
             )
             
             # Dibujar números de secuencia
-            font = pygame.font.Font(None, 20)
+            font = get_font(20)
             text = font.render(str(i + 1), True, Colors.TEXT_HIGHLIGHT)
             text_rect = text.get_rect(
                 center=(star1_renderer.screen_x, star1_renderer.screen_y - 25)
@@ -238,8 +502,8 @@ class GraphRenderer:
         Returns:
             ID de la estrella o None si no hay ninguna
         """
-        for star_id, renderer in self.star_renderers.items():
-            if renderer.contains_point(pos):
+        for star_id in self._spatial_index().at_point(*pos):
+            if self.star_renderers[star_id].contains_point(pos):
                 return star_id
         return None
     
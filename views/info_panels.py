@@ -6,6 +6,7 @@ Responsabilidad: Mostrar información del burro y estrellas.
 import pygame
 from views.config import (Colors, Fonts, Spacing, Icons)
 from views.components import Panel, ProgressBar, InfoLabel
+from views.font_cache import get_font
 
 
 class DonkeyInfoPanel:
@@ -22,9 +23,9 @@ class DonkeyInfoPanel:
         self.panel = Panel(x, y, width, height, f"{Icons.DONKEY} Estado del Burro")
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, Fonts.SUBTITLE_SIZE)
-        self.normal_font = pygame.font.Font(None, Fonts.NORMAL_SIZE)
-        self.small_font = pygame.font.Font(None, Fonts.SMALL_SIZE)
+        self.title_font = get_font(Fonts.SUBTITLE_SIZE)
+        self.normal_font = get_font(Fonts.NORMAL_SIZE)
+        self.small_font = get_font(Fonts.SMALL_SIZE)
         
         # Posiciones para elementos
         content_y = y + 60
@@ -85,6 +86,14 @@ class DonkeyInfoPanel:
         self.position_label.update(current_star_name)
         self.distance_label.update(f"{total_distance:.1f} ly")
     
+    def render_key(self):
+        """Datos que se muestran: el panel se repinta solo si cambian."""
+        return (
+            self.energy_bar.current_value, self.grass_bar.current_value,
+            self.health_label.value, self.health_label.color,
+            self.age_label.value, self.position_label.value, self.distance_label.value,
+        )
+    
     def draw(self, screen):
         """Dibuja el panel."""
         self.panel.draw(screen, self.title_font)
@@ -115,9 +124,9 @@ class StarInfoPanel:
         self.visible = False
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, Fonts.SUBTITLE_SIZE)
-        self.normal_font = pygame.font.Font(None, Fonts.NORMAL_SIZE)
-        self.small_font = pygame.font.Font(None, Fonts.SMALL_SIZE)
+        self.title_font = get_font(Fonts.SUBTITLE_SIZE)
+        self.normal_font = get_font(Fonts.NORMAL_SIZE)
+        self.small_font = get_font(Fonts.SMALL_SIZE)
         
         self.estrella = None
         self.distance_to_star = None
@@ -159,6 +168,17 @@ class StarInfoPanel:
         
         return False
     
+    def render_key(self):
+        """Datos que se muestran: el panel se repinta solo si cambian."""
+        if not self.visible or not self.estrella:
+            return None
+        e = self.estrella
+        return (
+            e.label, e.hipergigante, tuple(e.constelaciones),
+            self.distance_to_star, self.energy_needed,
+            e.health_impact, e.life_time_impact,
+        )
+    
     def draw(self, screen):
         """Dibuja el panel."""
         if not self.visible or not self.estrella:
@@ -7,6 +7,7 @@ import pygame
 from typing import List, Dict, Optional
 from views.config import Colors, PanelSizes
 from views.components import Panel, Button
+from views.font_cache import get_font
 
 
 class IntergalacticTravelPanel:
@@ -63,8 +64,8 @@ class IntergalacticTravelPanel:
         )
         
         # Fonts
-        self.font = pygame.font.Font(None, 18)
-        self.title_font = pygame.font.Font(None, 22)
+        self.font = get_font(18)
+        self.title_font = get_font(22)
         
         # Scroll
         self.scroll_offset = 0
@@ -222,7 +223,7 @@ class IntergalacticTravelPanel:
             
             # Beneficios
             benefits_y = self.y + self.height - 140
-            benefit_font = pygame.font.Font(None, 16)
+            benefit_font = get_font(16)
             benefits = [
                 "⚡ +50% energía actual",
                 "🌾 x2 pasto en bodega",
@@ -233,7 +234,7 @@ class IntergalacticTravelPanel:
                 screen.blit(text, (self.x + 10, benefits_y - (i * 18)))
         
         # Botones de acción
-        action_font = pygame.font.Font(None, 18)
+        action_font = get_font(18)
         
         # Travel button - solo habilitado si hay destino seleccionado
         if self.selected_destination is not None:
@@ -0,0 +1,139 @@
+"""
+Nivel de detalle del grafo según el zoom.
+Responsabilidad: Decidir cuánto detalle se dibuja con el zoom actual y
+precalcular, por constelación, los grupos de estrellas que se dibujan
+cuando el grafo está muy alejado.
+
+Niveles (de menos a más detalle):
+- LOD_CLUSTERS: cada constelación se dibuja como grupos de estrellas
+  (una casilla de la rejilla, un disco cuyo tamaño crece con la cantidad
+  de estrellas); sin conexiones ni etiquetas
+- LOD_STARS: estrellas y conexiones, sin las etiquetas de distancia
+- LOD_FULL: todo (el dibujo de siempre)
+
+El nivel depende de la separación aparente entre estrellas: la
+separación típica dentro de las constelaciones (en píxeles a zoom 1)
+multiplicada por el zoom. Un catálogo pequeño se ve con todo el detalle
+desde el principio; uno de miles de estrellas empieza en grupos y gana
+detalle a medida que se acerca la vista.
+
+Los grupos se calculan en coordenadas del mundo con casillas de tamaño
+potencia de 2, así que cada escala de la rejilla se calcula una sola vez
+y sirve para todos los zooms que caen en ella.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+from views.config import Colors, GraphScale, LevelOfDetail
+
+
+LOD_CLUSTERS = 0
+LOD_STARS = 1
+LOD_FULL = 2
+
+
+class ConstellationLOD:
+    """Geometría precalculada por constelación para el nivel de detalle."""
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self._key = None
+        self._spacing = math.inf
+        # exponente de la casilla -> [(color, mundo_x, mundo_y, cantidad)]
+        self._clusters: Dict[int, List[Tuple[tuple, float, float, int]]] = {}
+
+    def _refresh(self):
+        """Descarta la geometría si cambiaron las estrellas del grafo."""
+        key = (len(self.grafo.estrellas), len(self.grafo.constelaciones), self.grafo.version)
+        if key == self._key:
+            return
+        self._key = key
+        self._clusters.clear()
+        self._spacing = self._typical_spacing()
+
+    def _typical_spacing(self):
+        """
+        Separación típica entre estrellas vecinas, en píxeles a zoom 1.
+
+        Es la mediana, entre constelaciones, de sqrt(área / estrellas) de
+        la caja de cada constelación.
+        """
+        grupos = [ids for ids in self.grafo.constelaciones.values() if len(ids) > 1]
+        if not grupos:
+            grupos = [list(self.grafo.estrellas)]
+
+        separaciones = []
+        for ids in grupos:
+            estrellas = [self.grafo.estrellas[i] for i in ids if i in self.grafo.estrellas]
+            if len(estrellas) < 2:
+                continue
+            xs = [e.x for e in estrellas]
+            ys = [e.y for e in estrellas]
+            area = (max(xs) - min(xs)) * (max(ys) - min(ys))
+            separaciones.append(math.sqrt(area / len(estrellas)) * GraphScale.SCALE_FACTOR)
+
+        if not separaciones:
+            return math.inf
+        separaciones.sort()
+        return separaciones[len(separaciones) // 2]
+
+    def level(self, zoom):
+        """Nivel de detalle para un zoom."""
+        self._refresh()
+        separacion = self._spacing * zoom
+        if separacion < LevelOfDetail.CLUSTER_SPACING:
+            return LOD_CLUSTERS
+        if separacion < LevelOfDetail.LABEL_SPACING:
+            return LOD_STARS
+        return LOD_FULL
+
+    def clusters(self, zoom):
+        """
+        Grupos de estrellas de todas las constelaciones para un zoom.
+
+        Returns:
+            Lista de (color, mundo_x, mundo_y, cantidad), con el centro de
+            cada grupo en coordenadas del mundo
+        """
+        self._refresh()
+        casilla = LevelOfDetail.CLUSTER_TILE / (GraphScale.SCALE_FACTOR * zoom)
+        # El margen evita que un zoom de 0.9999... cambie de escala de rejilla
+        exponente = math.ceil(math.log2(casilla) - 1e-9)
+        grupos = self._clusters.get(exponente)
+        if grupos is None:
+            grupos = self._clusters[exponente] = self._build_clusters(2.0 ** exponente)
+        return grupos
+
+    def _build_clusters(self, tile):
+        """Agrupa las estrellas de cada constelación en casillas de `tile` unidades."""
+        grupos = []
+        por_constelacion = {}
+        for estrella in self.grafo.estrellas.values():
+            # Las estrellas compartidas se agrupan con su primera constelación,
+            # la misma que decide su color
+            nombre = estrella.constelaciones[0] if estrella.constelaciones else None
+            por_constelacion.setdefault(nombre, []).append(estrella)
+
+        for nombre, estrellas in por_constelacion.items():
+            if nombre is None:
+                color = Colors.STAR_NORMAL
+            else:
+                indice = self.grafo.obtener_color_constelacion(nombre)
+                color = Colors.CONSTELLATION_COLORS.get(indice, Colors.STAR_NORMAL)
+
+            casillas = {}  # (col, fila) -> [suma_x, suma_y, cantidad]
+            for e in estrellas:
+                acumulado = casillas.setdefault((int(e.x // tile), int(e.y // tile)), [0.0, 0.0, 0])
+                acumulado[0] += e.x
+                acumulado[1] += e.y
+                acumulado[2] += 1
+            for suma_x, suma_y, cantidad in casillas.values():
+                grupos.append((color, suma_x / cantidad, suma_y / cantidad, cantidad))
+        return grupos
+
+    @staticmethod
+    def cluster_radius(count):
+        """Radio en pantalla del disco de un grupo de `count` estrellas."""
+        return min(LevelOfDetail.MAX_CLUSTER_RADIUS,
+                   LevelOfDetail.MIN_CLUSTER_RADIUS + int(math.sqrt(count)))
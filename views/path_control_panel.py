@@ -8,6 +8,7 @@ debido al paso de cometas y meteoritos.
 import pygame
 from typing import Optional, Tuple
 from backend.constellation import GrafoConstelaciones
+from views.font_cache import get_font
 
 
 class PathControlPanel:
@@ -43,10 +44,10 @@ class PathControlPanel:
         self.text_color = (230, 230, 230)
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, 28)
-        self.subtitle_font = pygame.font.Font(None, 22)
-        self.text_font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(28)
+        self.subtitle_font = get_font(22)
+        self.text_font = get_font(20)
+        self.small_font = get_font(18)
         
         # Botones
         self.close_button_rect = pygame.Rect(x + width - 35, y + 5, 30, 30)
@@ -113,12 +114,14 @@ class PathControlPanel:
         for vertex_id, vertex in self.grafo.graph.items():
             for neighbor_vertex in vertex.get_all_connections().keys():
                 vertex.block_edge(neighbor_vertex.id)
+        self.grafo.bump_version()
         print("🔴 TODOS LOS CAMINOS BLOQUEADOS")
     
     def unblock_all_paths(self):
         """Habilita todos los caminos."""
         for vertex_id, vertex in self.grafo.graph.items():
             vertex.blocked_edges.clear()
+        self.grafo.bump_version()
         print("🟢 TODOS LOS CAMINOS HABILITADOS")
     
     def handle_event(self, event) -> bool:
@@ -0,0 +1,59 @@
+"""
+Índice espacial de elementos en pantalla.
+Responsabilidad: Encontrar en tiempo constante (en promedio) las estrellas
+bajo el mouse y las que caen dentro de un rectángulo (la pantalla visible).
+
+Rejilla uniforme: cada elemento (círculo) se guarda en todas las celdas
+que toca su caja. Dentro de cada celda los elementos quedan en orden de
+inserción, de modo que las consultas respetan el orden de dibujado (y de
+desempate) del diccionario original.
+"""
+
+import pygame
+
+
+class SpatialGrid:
+    """Rejilla uniforme de celdas de `cell_size` píxeles."""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self._cells = {}  # (col, fila) -> [(orden, id)]
+        self._count = 0
+        self._order = {}  # id -> orden de inserción
+        self.bounds = None  # Rect que contiene todos los elementos
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, item_id, x, y, radius):
+        """Agrega un círculo; el orden de inserción es el orden de las consultas."""
+        order = self._count
+        self._count += 1
+        self._order[item_id] = order
+        cs = self.cell_size
+        for col in range(int((x - radius) // cs), int((x + radius) // cs) + 1):
+            for row in range(int((y - radius) // cs), int((y + radius) // cs) + 1):
+                self._cells.setdefault((col, row), []).append((order, item_id))
+
+        caja = pygame.Rect(int(x - radius), int(y - radius),
+                           int(2 * radius) + 2, int(2 * radius) + 2)
+        self.bounds = caja if self.bounds is None else self.bounds.union(caja)
+
+    def order(self, item_id):
+        """Posición de inserción de un elemento."""
+        return self._order[item_id]
+
+    def at_point(self, x, y):
+        """Candidatos que pueden contener el punto, en orden de inserción."""
+        cs = self.cell_size
+        return [item_id for _, item_id in self._cells.get((int(x // cs), int(y // cs)), ())]
+
+    def in_rect(self, rect):
+        """Elementos cuya caja toca las celdas del rectángulo, en orden de inserción."""
+        cs = self.cell_size
+        encontrados = {}
+        for col in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for row in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                for order, item_id in self._cells.get((col, row), ()):
+                    encontrados[order] = item_id
+        return [encontrados[order] for order in sorted(encontrados)]
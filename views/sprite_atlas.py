@@ -0,0 +1,128 @@
+"""
+Sprites pre-renderizados de estrellas y del burro.
+Responsabilidad: Dibujar una sola vez cada variante visual (disco de
+estrella, brillo, burro, fondo de etiqueta) y reutilizarla con un blit.
+
+Las variantes se indexan por lo que cambia su aspecto:
+- star(color, radius, hypergiant): disco con el borde dorado de las
+  hipergigantes. El pulso de la estrella actual ya está cuantizado en
+  radios enteros (draw_radius), así que cada fase usa el sprite de su radio
+- star_glow(radius, alpha): brillo de hover; alpha avanza de 15 en 15
+- donkey(size, fraction) y donkey_glow(size): el rebote solo cambia la
+  parte fraccionaria de la altura (en décimas de píxel), que decide dónde
+  cae la cabeza al truncar las coordenadas
+- label_background(size, rgba): fondo semitransparente de las etiquetas
+
+Los discos usan color clave con RLEACCEL (el blit más rápido de pygame
+para sprites opacos); los brillos, alpha por píxel. Los sprites dan los
+mismos píxeles que dibujar las figuras directamente sobre la pantalla.
+"""
+
+import pygame
+from views.config import Colors
+
+
+# Color de fondo transparente de los sprites opacos (no lo usa ninguna estrella)
+_COLORKEY = (255, 0, 255)
+# Variantes del burro por píxel de rebote
+_DONKEY_SUBPIXEL_STEPS = 10
+
+
+class SpriteAtlas:
+    """Diccionario de sprites pre-renderizados, creados la primera vez que se piden."""
+
+    def __init__(self):
+        self._sprites = {}
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        self._sprites.clear()
+
+    def _opaque(self, width, height):
+        surface = pygame.Surface((width, height))
+        surface.fill(_COLORKEY)
+        return surface
+
+    def star(self, color, radius, hypergiant):
+        """
+        Disco de estrella centrado en (c, c).
+
+        Returns:
+            (sprite, c): se dibuja con screen.blit(sprite, (x - c, y - c))
+        """
+        key = ('star', color, radius, hypergiant)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            c = radius + 3
+            surface = self._opaque(2 * c + 1, 2 * c + 1)
+            pygame.draw.circle(surface, color, (c, c), radius)
+            if hypergiant:
+                pygame.draw.circle(surface, Colors.TEXT_TITLE, (c, c), radius + 2, 2)
+            surface.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+            sprite = self._sprites[key] = (surface, c)
+        return sprite
+
+    def star_glow(self, radius, alpha):
+        """Brillo de una estrella de radio `radius`, del tamaño radius * 4."""
+        key = ('star_glow', radius, alpha)
+        surface = self._sprites.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+            glow_radius = int(radius * 1.5)
+            # Gradiente de glow
+            for i in range(glow_radius, 0, -2):
+                glow_alpha = int((i / glow_radius) * alpha * 0.3)
+                pygame.draw.circle(surface, (*Colors.STAR_GLOW, glow_alpha),
+                                   (radius * 2, radius * 2), i)
+            self._sprites[key] = surface
+        return surface
+
+    def donkey_glow(self, size):
+        """Brillo dorado del burro, del tamaño size * 4."""
+        key = ('donkey_glow', size)
+        surface = self._sprites.get(key)
+        if surface is None:
+            surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+            for i in range(size + 12, 0, -2):
+                alpha = int((i / (size + 12)) * 80)
+                pygame.draw.circle(surface, (255, 200, 100, alpha),  # Dorado
+                                   (size * 2, size * 2), i)
+            self._sprites[key] = surface
+        return surface
+
+    def donkey(self, size, fraction, draw_body):
+        """
+        Cuerpo del burro, dibujado por draw_body(surface, x, y, size) con
+        centro en (c, c + fraction).
+
+        Args:
+            fraction: Parte fraccionaria de la altura del burro (0 a 1)
+
+        Returns:
+            (sprite, c): se dibuja con screen.blit(sprite, (int(x) - c, int(y) - c))
+        """
+        step = int(fraction * _DONKEY_SUBPIXEL_STEPS)
+        key = ('donkey', size, step)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            c = size * 3
+            surface = self._opaque(2 * c + 1, 2 * c + 1)
+            draw_body(surface, c, c + step / _DONKEY_SUBPIXEL_STEPS, size)
+            surface.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+            sprite = self._sprites[key] = (surface, c)
+        return sprite
+
+    def label_background(self, size, rgba):
+        """Rectángulo semitransparente de tamaño `size` (ancho, alto)."""
+        key = ('label', size, rgba)
+        surface = self._sprites.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(rgba)
+            self._sprites[key] = surface
+        return surface
+
+
+atlas = SpriteAtlas()
@@ -1,9 +1,9 @@
 """
 Panel de editor de estrellas para ajustar propiedades en tiempo real
 """
-import pygame
 from views.config import Colors, PanelSizes
 from views.components import Panel, Button
+from views.font_cache import get_font
 
 
 class SimpleLabel:
@@ -15,7 +15,7 @@ class SimpleLabel:
         self.text = text
         self.font_size = font_size
         self.color = color or Colors.TEXT_PRIMARY
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
     
     def update(self, text):
         """Actualiza el texto."""
@@ -93,6 +93,10 @@ class StarEditorPanel:
         self.visible = False
         self.current_star = None
     
+    def _editar(self, **campos):
+        """Edita la estrella actual a través del grafo (la marca para guardar)."""
+        self.grafo.actualizar_estrella(self.current_star.id, **campos)
+    
     def _update_labels(self):
         """Actualiza las etiquetas con los valores actuales."""
         if not self.current_star:
@@ -118,42 +122,42 @@ class StarEditorPanel:
         
         # Energía
         if self.energy_minus.rect.collidepoint(pos):
-            self.current_star.amount_of_energy = max(0, self.current_star.amount_of_energy - 1)
+            self._editar(amount_of_energy=max(0, self.current_star.amount_of_energy - 1))
             self._update_labels()
         elif self.energy_plus.rect.collidepoint(pos):
-            self.current_star.amount_of_energy = min(10, self.current_star.amount_of_energy + 1)
+            self._editar(amount_of_energy=min(10, self.current_star.amount_of_energy + 1))
             self._update_labels()
         
         # Tiempo para comer
         elif self.time_minus.rect.collidepoint(pos):
-            self.current_star.time_to_eat = max(0.5, self.current_star.time_to_eat - 0.5)
+            self._editar(time_to_eat=max(0.5, self.current_star.time_to_eat - 0.5))
             self._update_labels()
         elif self.time_plus.rect.collidepoint(pos):
-            self.current_star.time_to_eat = min(10, self.current_star.time_to_eat + 0.5)
+            self._editar(time_to_eat=min(10, self.current_star.time_to_eat + 0.5))
             self._update_labels()
         
         # Tiempo de estadía
         elif self.stay_minus.rect.collidepoint(pos):
-            self.current_star.stay_duration = max(1, self.current_star.stay_duration - 1)
+            self._editar(stay_duration=max(1, self.current_star.stay_duration - 1))
             self._update_labels()
         elif self.stay_plus.rect.collidepoint(pos):
-            self.current_star.stay_duration = min(20, self.current_star.stay_duration + 1)
+            self._editar(stay_duration=min(20, self.current_star.stay_duration + 1))
             self._update_labels()
         
         # Impacto en salud
         elif self.health_minus.rect.collidepoint(pos):
-            self.current_star.health_impact -= 0.5
+            self._editar(health_impact=self.current_star.health_impact - 0.5)
             self._update_labels()
         elif self.health_plus.rect.collidepoint(pos):
-            self.current_star.health_impact += 0.5
+            self._editar(health_impact=self.current_star.health_impact + 0.5)
             self._update_labels()
         
         # Impacto en vida
         elif self.life_minus.rect.collidepoint(pos):
-            self.current_star.life_time_impact -= 1
+            self._editar(life_time_impact=self.current_star.life_time_impact - 1)
             self._update_labels()
         elif self.life_plus.rect.collidepoint(pos):
-            self.current_star.life_time_impact += 1
+            self._editar(life_time_impact=self.current_star.life_time_impact + 1)
             self._update_labels()
         
         # Guardar
@@ -173,7 +177,7 @@ class StarEditorPanel:
             return
         
         # Crear una fuente para los botones
-        button_font = pygame.font.Font(None, 20)
+        button_font = get_font(20)
         
         self.panel.draw(screen)
         
@@ -198,6 +202,6 @@ class StarEditorPanel:
         self.life_plus.draw(screen, button_font)
         
         # Botones de acción
-        action_font = pygame.font.Font(None, 18)
+        action_font = get_font(18)
         self.save_button.draw(screen, action_font)
         self.close_button.draw(screen, action_font)
@@ -6,6 +6,8 @@ Responsabilidad: Dibujar y animar una estrella con sus efectos visuales.
 import pygame
 import math
 from views.config import Colors, GraphScale, Animation, VisualEffects
+from views.font_cache import get_font
+from views.sprite_atlas import atlas
 
 
 class StarRenderer:
@@ -116,13 +118,9 @@ class StarRenderer:
         if VisualEffects.GLOW_ENABLED and (self.hover or is_current):
             self._draw_glow(screen, draw_radius)
         
-        # Estrella principal
-        pygame.draw.circle(screen, color, (self.screen_x, self.screen_y), draw_radius)
-        
-        # Borde si es hipergigante
-        if self.estrella.hipergigante:
-            pygame.draw.circle(screen, Colors.TEXT_TITLE, 
-                             (self.screen_x, self.screen_y), draw_radius + 2, 2)
+        # Estrella principal (con borde si es hipergigante), desde el atlas
+        sprite, c = atlas.star(color, draw_radius, self.estrella.hipergigante)
+        screen.blit(sprite, (self.screen_x - c, self.screen_y - c))
         
         # Label (solo si hay hover o es actual)
         if self.hover or is_current:
@@ -130,22 +128,13 @@ class StarRenderer:
     
     def _draw_glow(self, screen, draw_radius):
         """Dibuja el efecto de brillo alrededor de la estrella."""
-        glow_surface = pygame.Surface((draw_radius * 4, draw_radius * 4), pygame.SRCALPHA)
-        glow_radius = int(draw_radius * 1.5)
-        
-        # Gradiente de glow
-        for i in range(glow_radius, 0, -2):
-            alpha = int((i / glow_radius) * self.glow_alpha * 0.3)
-            glow_color = (*Colors.STAR_GLOW, alpha)
-            pygame.draw.circle(glow_surface, glow_color, 
-                             (draw_radius * 2, draw_radius * 2), i)
-        
+        glow_surface = atlas.star_glow(draw_radius, self.glow_alpha)
         glow_rect = glow_surface.get_rect(center=(self.screen_x, self.screen_y))
         screen.blit(glow_surface, glow_rect)
     
     def _draw_label(self, screen):
         """Dibuja el nombre de la estrella."""
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         text_surface = font.render(self.estrella.label, True, Colors.TEXT_PRIMARY)
         text_rect = text_surface.get_rect(
             centerx=self.screen_x,
@@ -154,12 +143,24 @@ class StarRenderer:
         
         # Fondo del label
         bg_rect = text_rect.inflate(8, 4)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((*Colors.PANEL_BG, 200))
-        screen.blit(bg_surface, bg_rect)
+        screen.blit(atlas.label_background(bg_rect.size, (*Colors.PANEL_BG, 200)), bg_rect)
         
         screen.blit(text_surface, text_rect)
     
+    def bounds(self):
+        """
+        Rectángulo que puede ocupar la estrella dibujada: el brillo con el
+        pulso máximo y la etiqueta.
+        """
+        draw_radius = int(self.radius * Animation.STAR_PULSE_MAX)
+        rect = pygame.Rect(0, 0, draw_radius * 4 + 2, draw_radius * 4 + 2)
+        rect.center = (self.screen_x, self.screen_y)
+        
+        width, height = get_font(20).size(self.estrella.label)
+        label = pygame.Rect(0, 0, width + 8, height + 4)
+        label.midbottom = (self.screen_x, self.screen_y - self.radius - 3)
+        return rect.union(label.inflate(2, 2))
+    
     def contains_point(self, point):
         """Verifica si un punto está dentro de la estrella."""
         dx = point[0] - self.screen_x
@@ -175,11 +176,15 @@ class DonkeyRenderer:
     - Dibujar el burro como figura
     - Animar rebote del burro
     - Posicionar sobre la estrella actual
+    - Mostrar el progreso de la estadía (comer e investigar)
     """
     
     def __init__(self):
         self.bounce = 0
         self.bounce_speed = 0.1
+        self.size = 18  # Tamaño del burro
+        # Progreso de la estadía en curso (0 a 1), None si no hay ninguna
+        self.stay_progress = None
     
     def update(self):
         """Actualiza la animación del burro."""
@@ -200,27 +205,49 @@ class DonkeyRenderer:
         donkey_y = star_renderer.screen_y - star_renderer.radius - 35 + bounce_offset
         
         # Tamaño del burro
-        donkey_size = 18
+        donkey_size = self.size
         
         # Glow effect
         if VisualEffects.GLOW_ENABLED:
             self._draw_glow(screen, donkey_x, donkey_y, donkey_size)
         
-        # Dibujar el burro como una figura simple
-        self._draw_donkey_body(screen, donkey_x, donkey_y, donkey_size)
+        # Anillo de progreso mientras dura la estadía
+        if self.stay_progress is not None:
+            self._draw_stay_progress(screen, donkey_x, donkey_y, donkey_size)
+        
+        # Dibujar el burro como una figura simple (sprite del atlas)
+        sprite, c = atlas.donkey(donkey_size, donkey_y - int(donkey_y), self._draw_donkey_body)
+        screen.blit(sprite, (int(donkey_x) - c, int(donkey_y) - c))
         self._draw_donkey_label(screen, donkey_x, donkey_y, donkey_size)
     
+    def bounds(self, star_renderer):
+        """
+        Rectángulo que ocupa el burro (brillo, cuerpo y etiqueta) en la
+        posición actual del rebote.
+        """
+        bounce_offset = math.sin(self.bounce) * 5
+        donkey_y = star_renderer.screen_y - star_renderer.radius - 35 + bounce_offset
+        # El sprite del atlas (lado 6 * size) contiene el brillo y la etiqueta
+        c = self.size * 3
+        return pygame.Rect(int(star_renderer.screen_x) - c, int(donkey_y) - c, 2 * c + 2, 2 * c + 2)
+    
     def _draw_glow(self, screen, x, y, size):
         """Dibuja el brillo alrededor del burro."""
-        glow_surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-        for i in range(size + 12, 0, -2):
-            alpha = int((i / (size + 12)) * 80)
-            glow_color = (255, 200, 100, alpha)  # Dorado
-            pygame.draw.circle(glow_surface, glow_color, 
-                             (size * 2, size * 2), i)
+        glow_surface = atlas.donkey_glow(size)
         glow_rect = glow_surface.get_rect(center=(int(x), int(y)))
         screen.blit(glow_surface, glow_rect)
     
+    def _draw_stay_progress(self, screen, x, y, size):
+        """Dibuja el anillo que se completa a medida que avanza la estadía."""
+        radius = size + 8
+        ring_rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        ring_rect.center = (int(x), int(y))
+        pygame.draw.circle(screen, Colors.PANEL_BORDER, ring_rect.center, radius, 2)
+        if self.stay_progress > 0:
+            # En sentido horario desde arriba
+            start = math.pi / 2 - 2 * math.pi * self.stay_progress
+            pygame.draw.arc(screen, Colors.TEXT_TITLE, ring_rect, start, math.pi / 2, 3)
+    
     def _draw_donkey_body(self, screen, x, y, size):
         """Dibuja el cuerpo del burro."""
         body_color = (139, 90, 43)  # Marrón burro
@@ -267,13 +294,11 @@ class DonkeyRenderer:
     def _draw_donkey_label(self, screen, x, y, size):
         """Dibuja la etiqueta BURRO."""
         leg_length = int(size * 0.6)
-        font = pygame.font.Font(None, 16)
+        font = get_font(16)
         label_text = font.render("BURRO", True, Colors.TEXT_PRIMARY)
         label_rect = label_text.get_rect(center=(int(x), int(y + size + leg_length + 8)))
         
         # Fondo del label
         bg_rect = label_rect.inflate(6, 2)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((*Colors.PANEL_BG, 200))
-        screen.blit(bg_surface, bg_rect)
+        screen.blit(atlas.label_background(bg_rect.size, (*Colors.PANEL_BG, 200)), bg_rect)
         screen.blit(label_text, label_rect)